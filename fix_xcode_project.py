@@ -1,500 +1,714 @@
 #!/usr/bin/env python3
 """
 Script to create a properly formatted Xcode project file for WordJournal
+
+The file list is discovered by walking WordJournal/ once; directories become
+groups. A small state file next to project.pbxproj records path -> mtime/hash
+and the project file's own mtime/size, so a rerun only re-reads files that
+changed and skips the write entirely when no file was added or removed and
+the project was not changed behind its back. Object IDs are hashed from (kind, path, target),
+so regenerating an unchanged tree is byte-identical. The project is built as
+an object graph (see pbxproj.py) and streamed to disk.
+
+When project.pbxproj already exists it is parsed and patched in place: only
+references for added or removed files change, so Swift package references,
+scheme target IDs and hand edits survive. --full regenerates from scratch,
+taking package references from Package.resolved.
+
+--watch keeps running and patches the project as files are added or removed,
+using inotify where available and polling otherwise. Bursts of events (a git
+checkout, an editor's save-as) are debounced into one patch.
+
+Usage:
+    python3 fix_xcode_project.py          # patch the existing project
+    python3 fix_xcode_project.py --full   # regenerate from scratch
+    python3 fix_xcode_project.py --watch  # keep patching as files change
+    python3 fix_xcode_project.py --watch --poll   # force the polling watcher
 """
 
-import uuid
+import ctypes
+import ctypes.util
+import hashlib
+import json
+import os
+import select
+import sys
+import time
 from pathlib import Path
 
-def generate_uuid():
-    """Generate a 24-character hex string for Xcode UUIDs"""
-    return uuid.uuid4().hex[:24].upper()
-
-# Generate all UUIDs upfront
-project_uuid = generate_uuid()
-target_uuid = generate_uuid()
-main_group_uuid = generate_uuid()
-products_group_uuid = generate_uuid()
-wordjournal_group_uuid = generate_uuid()
-models_group_uuid = generate_uuid()
-services_group_uuid = generate_uuid()
-views_group_uuid = generate_uuid()
-utilities_group_uuid = generate_uuid()
-resources_group_uuid = generate_uuid()
-
-# File reference UUIDs
-app_product_uuid = generate_uuid()
-wordjournal_app_ref = generate_uuid()
-info_plist_file_ref = generate_uuid()
-info_plist_build_ref = generate_uuid()
-
-# Source file UUIDs (file references)
-source_file_refs = {
-    'WordJournalApp.swift': generate_uuid(),
-    'WordEntry.swift': generate_uuid(),
-    'DictionaryResult.swift': generate_uuid(),
-    'AccessibilityMonitor.swift': generate_uuid(),
-    'DictionaryService.swift': generate_uuid(),
-    'JournalStorage.swift': generate_uuid(),
-    'DefinitionPopupView.swift': generate_uuid(),
-    'JournalView.swift': generate_uuid(),
-    'MenuBarView.swift': generate_uuid(),
-    'PreferencesView.swift': generate_uuid(),
-    'HotKeyManager.swift': generate_uuid(),
-    'dictionary.json': generate_uuid(),
+import pbxproj
+
+BASE_DIR = Path(__file__).parent
+SOURCE_DIR = BASE_DIR / 'WordJournal'
+PROJECT_DIR = BASE_DIR / 'WordJournal.xcodeproj'
+PBXPROJ_PATH = PROJECT_DIR / 'project.pbxproj'
+STATE_PATH = PROJECT_DIR / '.generator_state.json'
+PACKAGE_RESOLVED = PROJECT_DIR / 'project.xcworkspace' / 'xcshareddata' / 'swiftpm' / 'Package.resolved'
+
+STATE_VERSION = 2
+TARGET_NAME = 'WordJournal'
+
+# Watch mode: quiet period that ends a burst of events, and polling interval
+DEBOUNCE_SECONDS = 0.2
+POLL_SECONDS = 0.5
+
+# Extension -> (lastKnownFileType, build phase or None)
+FILE_TYPES = {
+    '.swift': ('sourcecode.swift', 'Sources'),
+    '.json': ('text.json', 'Resources'),
+    '.gif': ('image.gif', 'Resources'),
+    '.png': ('image.png', 'Resources'),
+    '.xcassets': ('folder.assetcatalog', 'Resources'),
+    '.plist': ('text.plist.xml', None),
+    '.entitlements': ('text.plist.entitlements', None),
+}
+
+# Directories that Xcode treats as a single file reference, not a group
+BUNDLE_EXTENSIONS = {'.xcassets'}
+
+# Files on disk that are intentionally not part of the target
+EXCLUDED = {'PreferencesView_Old.swift'}
+
+COMPILER_SETTINGS = {
+    'ALWAYS_SEARCH_USER_PATHS': 'NO',
+    'ASSETCATALOG_COMPILER_GENERATE_SWIFT_ASSET_SYMBOL_EXTENSIONS': 'YES',
+    'CLANG_ANALYZER_NONNULL': 'YES',
+    'CLANG_ANALYZER_NUMBER_OBJECT_CONVERSION': 'YES_AGGRESSIVE',
+    'CLANG_CXX_LANGUAGE_STANDARD': 'gnu++20',
+    'CLANG_ENABLE_MODULES': 'YES',
+    'CLANG_ENABLE_OBJC_ARC': 'YES',
+    'CLANG_ENABLE_OBJC_WEAK': 'YES',
+    'CLANG_WARN_BLOCK_CAPTURE_AUTORELEASING': 'YES',
+    'CLANG_WARN_BOOL_CONVERSION': 'YES',
+    'CLANG_WARN_COMMA': 'YES',
+    'CLANG_WARN_CONSTANT_CONVERSION': 'YES',
+    'CLANG_WARN_DEPRECATED_OBJC_IMPLEMENTATIONS': 'YES',
+    'CLANG_WARN_DIRECT_OBJC_ISA_USAGE': 'YES_ERROR',
+    'CLANG_WARN_DOCUMENTATION_COMMENTS': 'YES',
+    'CLANG_WARN_EMPTY_BODY': 'YES',
+    'CLANG_WARN_ENUM_CONVERSION': 'YES',
+    'CLANG_WARN_INFINITE_RECURSION': 'YES',
+    'CLANG_WARN_INT_CONVERSION': 'YES',
+    'CLANG_WARN_NON_LITERAL_NULL_CONVERSION': 'YES',
+    'CLANG_WARN_OBJC_IMPLICIT_RETAIN_SELF': 'YES',
+    'CLANG_WARN_OBJC_LITERAL_CONVERSION': 'YES',
+    'CLANG_WARN_OBJC_ROOT_CLASS': 'YES_ERROR',
+    'CLANG_WARN_QUOTED_INCLUDE_IN_FRAMEWORK_HEADER': 'YES',
+    'CLANG_WARN_RANGE_LOOP_ANALYSIS': 'YES',
+    'CLANG_WARN_STRICT_PROTOTYPES': 'YES',
+    'CLANG_WARN_SUSPICIOUS_MOVE': 'YES',
+    'CLANG_WARN_UNGUARDED_AVAILABILITY': 'YES_AGGRESSIVE',
+    'CLANG_WARN_UNREACHABLE_CODE': 'YES',
+    'CLANG_WARN__DUPLICATE_METHOD_MATCH': 'YES',
+    'COPY_PHASE_STRIP': 'NO',
+    'ENABLE_STRICT_OBJC_MSGSEND': 'YES',
+    'ENABLE_USER_SCRIPT_SANDBOXING': 'YES',
+    'GCC_C_LANGUAGE_STANDARD': 'gnu17',
+    'GCC_NO_COMMON_BLOCKS': 'YES',
+    'GCC_WARN_64_TO_32_BIT_CONVERSION': 'YES',
+    'GCC_WARN_ABOUT_RETURN_TYPE': 'YES_ERROR',
+    'GCC_WARN_UNDECLARED_SELECTOR': 'YES',
+    'GCC_WARN_UNINITIALIZED_AUTOS': 'YES_AGGRESSIVE',
+    'GCC_WARN_UNUSED_FUNCTION': 'YES',
+    'GCC_WARN_UNUSED_VARIABLE': 'YES',
+    'LOCALIZATION_PREFERS_STRING_CATALOGS': 'YES',
+    'MACOSX_DEPLOYMENT_TARGET': '13.0',
+    'MTL_FAST_MATH': 'YES',
+    'SDKROOT': 'macosx',
 }
 
-# Build file UUIDs
-source_build_refs = {
-    'WordJournalApp.swift': generate_uuid(),
-    'WordEntry.swift': generate_uuid(),
-    'DictionaryResult.swift': generate_uuid(),
-    'AccessibilityMonitor.swift': generate_uuid(),
-    'DictionaryService.swift': generate_uuid(),
-    'JournalStorage.swift': generate_uuid(),
-    'DefinitionPopupView.swift': generate_uuid(),
-    'JournalView.swift': generate_uuid(),
-    'MenuBarView.swift': generate_uuid(),
-    'PreferencesView.swift': generate_uuid(),
-    'HotKeyManager.swift': generate_uuid(),
-    'dictionary.json': generate_uuid(),
+COMPILER_DEBUG_SETTINGS = {
+    **COMPILER_SETTINGS,
+    'DEBUG_INFORMATION_FORMAT': 'dwarf',
+    'ENABLE_TESTABILITY': 'YES',
+    'GCC_DYNAMIC_NO_PIC': 'NO',
+    'GCC_OPTIMIZATION_LEVEL': '0',
+    'GCC_PREPROCESSOR_DEFINITIONS': ['DEBUG=1', '$(inherited)'],
+    'MTL_ENABLE_DEBUG_INFO': 'INCLUDE_SOURCE',
+    'ONLY_ACTIVE_ARCH': 'YES',
+    'SWIFT_ACTIVE_COMPILATION_CONDITIONS': 'DEBUG $(inherited)',
+    'SWIFT_OPTIMIZATION_LEVEL': '-Onone',
 }
 
-# Build phase UUIDs
-sources_phase_uuid = generate_uuid()
-frameworks_phase_uuid = generate_uuid()
-resources_phase_uuid = generate_uuid()
-
-# Configuration UUIDs
-debug_config_uuid = generate_uuid()
-release_config_uuid = generate_uuid()
-project_debug_config_uuid = generate_uuid()
-project_release_config_uuid = generate_uuid()
-target_config_list_uuid = generate_uuid()
-project_config_list_uuid = generate_uuid()
-
-# Build the project.pbxproj content
-pbxproj = f'''// !$*UTF8*$!
-{{
-	archiveVersion = 1;
-	classes = {{
-	}};
-	objectVersion = 56;
-	objects = {{
-
-/* Begin PBXBuildFile section */
-		{source_build_refs['WordJournalApp.swift']} /* WordJournalApp.swift in Sources */ = {{isa = PBXBuildFile; fileRef = {source_file_refs['WordJournalApp.swift']} /* WordJournalApp.swift */; }};
-		{source_build_refs['WordEntry.swift']} /* WordEntry.swift in Sources */ = {{isa = PBXBuildFile; fileRef = {source_file_refs['WordEntry.swift']} /* WordEntry.swift */; }};
-		{source_build_refs['DictionaryResult.swift']} /* DictionaryResult.swift in Sources */ = {{isa = PBXBuildFile; fileRef = {source_file_refs['DictionaryResult.swift']} /* DictionaryResult.swift */; }};
-		{source_build_refs['AccessibilityMonitor.swift']} /* AccessibilityMonitor.swift in Sources */ = {{isa = PBXBuildFile; fileRef = {source_file_refs['AccessibilityMonitor.swift']} /* AccessibilityMonitor.swift */; }};
-		{source_build_refs['DictionaryService.swift']} /* DictionaryService.swift in Sources */ = {{isa = PBXBuildFile; fileRef = {source_file_refs['DictionaryService.swift']} /* DictionaryService.swift */; }};
-		{source_build_refs['JournalStorage.swift']} /* JournalStorage.swift in Sources */ = {{isa = PBXBuildFile; fileRef = {source_file_refs['JournalStorage.swift']} /* JournalStorage.swift */; }};
-		{source_build_refs['DefinitionPopupView.swift']} /* DefinitionPopupView.swift in Sources */ = {{isa = PBXBuildFile; fileRef = {source_file_refs['DefinitionPopupView.swift']} /* DefinitionPopupView.swift */; }};
-		{source_build_refs['JournalView.swift']} /* JournalView.swift in Sources */ = {{isa = PBXBuildFile; fileRef = {source_file_refs['JournalView.swift']} /* JournalView.swift */; }};
-		{source_build_refs['MenuBarView.swift']} /* MenuBarView.swift in Sources */ = {{isa = PBXBuildFile; fileRef = {source_file_refs['MenuBarView.swift']} /* MenuBarView.swift */; }};
-		{source_build_refs['PreferencesView.swift']} /* PreferencesView.swift in Sources */ = {{isa = PBXBuildFile; fileRef = {source_file_refs['PreferencesView.swift']} /* PreferencesView.swift */; }};
-		{source_build_refs['HotKeyManager.swift']} /* HotKeyManager.swift in Sources */ = {{isa = PBXBuildFile; fileRef = {source_file_refs['HotKeyManager.swift']} /* HotKeyManager.swift */; }};
-		{info_plist_build_ref} /* Info.plist in Resources */ = {{isa = PBXBuildFile; fileRef = {info_plist_file_ref} /* Info.plist */; }};
-		{source_build_refs['dictionary.json']} /* dictionary.json in Resources */ = {{isa = PBXBuildFile; fileRef = {source_file_refs['dictionary.json']} /* dictionary.json */; }};
-/* End PBXBuildFile section */
-
-/* Begin PBXFileReference section */
-		{app_product_uuid} /* WordJournal.app */ = {{isa = PBXFileReference; explicitFileType = wrapper.application; includeInIndex = 0; path = WordJournal.app; sourceTree = BUILT_PRODUCTS_DIR; }};
-		{source_file_refs['WordJournalApp.swift']} /* WordJournalApp.swift */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = WordJournalApp.swift; sourceTree = "<group>"; }};
-		{source_file_refs['WordEntry.swift']} /* WordEntry.swift */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = WordEntry.swift; sourceTree = "<group>"; }};
-		{source_file_refs['DictionaryResult.swift']} /* DictionaryResult.swift */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = DictionaryResult.swift; sourceTree = "<group>"; }};
-		{source_file_refs['AccessibilityMonitor.swift']} /* AccessibilityMonitor.swift */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = AccessibilityMonitor.swift; sourceTree = "<group>"; }};
-		{source_file_refs['DictionaryService.swift']} /* DictionaryService.swift */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = DictionaryService.swift; sourceTree = "<group>"; }};
-		{source_file_refs['JournalStorage.swift']} /* JournalStorage.swift */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = JournalStorage.swift; sourceTree = "<group>"; }};
-		{source_file_refs['DefinitionPopupView.swift']} /* DefinitionPopupView.swift */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = DefinitionPopupView.swift; sourceTree = "<group>"; }};
-		{source_file_refs['JournalView.swift']} /* JournalView.swift */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = JournalView.swift; sourceTree = "<group>"; }};
-		{source_file_refs['MenuBarView.swift']} /* MenuBarView.swift */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = MenuBarView.swift; sourceTree = "<group>"; }};
-		{source_file_refs['PreferencesView.swift']} /* PreferencesView.swift */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = PreferencesView.swift; sourceTree = "<group>"; }};
-		{source_file_refs['HotKeyManager.swift']} /* HotKeyManager.swift */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = HotKeyManager.swift; sourceTree = "<group>"; }};
-		{info_plist_file_ref} /* Info.plist */ = {{isa = PBXFileReference; lastKnownFileType = text.plist.xml; path = Info.plist; sourceTree = "<group>"; }};
-		{source_file_refs['dictionary.json']} /* dictionary.json */ = {{isa = PBXFileReference; lastKnownFileType = text.json; path = dictionary.json; sourceTree = "<group>"; }};
-/* End PBXFileReference section */
-
-/* Begin PBXFrameworksBuildPhase section */
-		{frameworks_phase_uuid} /* Frameworks */ = {{
-			isa = PBXFrameworksBuildPhase;
-			buildActionMask = 2147483647;
-			files = (
-			);
-			runOnlyForDeploymentPostprocessing = 0;
-		}};
-/* End PBXFrameworksBuildPhase section */
-
-/* Begin PBXGroup section */
-		{main_group_uuid} = {{
-			isa = PBXGroup;
-			children = (
-				{wordjournal_group_uuid} /* WordJournal */,
-				{products_group_uuid} /* Products */,
-			);
-			sourceTree = "<group>";
-		}};
-		{wordjournal_group_uuid} /* WordJournal */ = {{
-			isa = PBXGroup;
-			children = (
-				{source_file_refs['WordJournalApp.swift']} /* WordJournalApp.swift */,
-				{models_group_uuid} /* Models */,
-				{services_group_uuid} /* Services */,
-				{views_group_uuid} /* Views */,
-				{utilities_group_uuid} /* Utilities */,
-				{resources_group_uuid} /* Resources */,
-			);
-			path = WordJournal;
-			sourceTree = "<group>";
-		}};
-		{models_group_uuid} /* Models */ = {{
-			isa = PBXGroup;
-			children = (
-				{source_file_refs['WordEntry.swift']} /* WordEntry.swift */,
-				{source_file_refs['DictionaryResult.swift']} /* DictionaryResult.swift */,
-			);
-			path = Models;
-			sourceTree = "<group>";
-		}};
-		{services_group_uuid} /* Services */ = {{
-			isa = PBXGroup;
-			children = (
-				{source_file_refs['AccessibilityMonitor.swift']} /* AccessibilityMonitor.swift */,
-				{source_file_refs['DictionaryService.swift']} /* DictionaryService.swift */,
-				{source_file_refs['JournalStorage.swift']} /* JournalStorage.swift */,
-			);
-			path = Services;
-			sourceTree = "<group>";
-		}};
-		{views_group_uuid} /* Views */ = {{
-			isa = PBXGroup;
-			children = (
-				{source_file_refs['DefinitionPopupView.swift']} /* DefinitionPopupView.swift */,
-				{source_file_refs['JournalView.swift']} /* JournalView.swift */,
-				{source_file_refs['MenuBarView.swift']} /* MenuBarView.swift */,
-				{source_file_refs['PreferencesView.swift']} /* PreferencesView.swift */,
-			);
-			path = Views;
-			sourceTree = "<group>";
-		}};
-		{utilities_group_uuid} /* Utilities */ = {{
-			isa = PBXGroup;
-			children = (
-				{source_file_refs['HotKeyManager.swift']} /* HotKeyManager.swift */,
-			);
-			path = Utilities;
-			sourceTree = "<group>";
-		}};
-		{resources_group_uuid} /* Resources */ = {{
-			isa = PBXGroup;
-			children = (
-				{info_plist_file_ref} /* Info.plist */,
-				{source_file_refs['dictionary.json']} /* dictionary.json */,
-			);
-			path = Resources;
-			sourceTree = "<group>";
-		}};
-		{products_group_uuid} /* Products */ = {{
-			isa = PBXGroup;
-			children = (
-				{app_product_uuid} /* WordJournal.app */,
-			);
-			name = Products;
-			sourceTree = "<group>";
-		}};
-/* End PBXGroup section */
-
-/* Begin PBXNativeTarget section */
-		{target_uuid} /* WordJournal */ = {{
-			isa = PBXNativeTarget;
-			buildConfigurationList = {target_config_list_uuid} /* Build configuration list for PBXNativeTarget "WordJournal" */;
-			buildPhases = (
-				{sources_phase_uuid} /* Sources */,
-				{frameworks_phase_uuid} /* Frameworks */,
-				{resources_phase_uuid} /* Resources */,
-			);
-			buildRules = (
-			);
-			dependencies = (
-			);
-			name = WordJournal;
-			productName = WordJournal;
-			productReference = {app_product_uuid} /* WordJournal.app */;
-			productType = "com.apple.product-type.application";
-		}};
-/* End PBXNativeTarget section */
-
-/* Begin PBXProject section */
-		{project_uuid} /* Project object */ = {{
-			isa = PBXProject;
-			attributes = {{
-				BuildIndependentTargetsInParallel = 1;
-				LastSwiftUpdateCheck = 1500;
-				LastUpgradeCheck = 1500;
-				TargetAttributes = {{
-					{target_uuid} = {{
-						CreatedOnToolsVersion = 15.0;
-					}};
-				}};
-			}};
-			buildConfigurationList = {project_config_list_uuid} /* Build configuration list for PBXProject "WordJournal" */;
-			compatibilityVersion = "Xcode 14.0";
-			developmentRegion = en;
-			hasScannedForEncodings = 0;
-			knownRegions = (
-				en,
-				Base,
-			);
-			mainGroup = {main_group_uuid};
-			productRefGroup = {products_group_uuid} /* Products */;
-			projectDirPath = "";
-			projectRoot = "";
-			targets = (
-				{target_uuid} /* WordJournal */,
-			);
-		}};
-/* End PBXProject section */
-
-/* Begin PBXResourcesBuildPhase section */
-		{resources_phase_uuid} /* Resources */ = {{
-			isa = PBXResourcesBuildPhase;
-			buildActionMask = 2147483647;
-			files = (
-				{info_plist_build_ref} /* Info.plist in Resources */,
-				{source_build_refs['dictionary.json']} /* dictionary.json in Resources */,
-			);
-			runOnlyForDeploymentPostprocessing = 0;
-		}};
-/* End PBXResourcesBuildPhase section */
-
-/* Begin PBXSourcesBuildPhase section */
-		{sources_phase_uuid} /* Sources */ = {{
-			isa = PBXSourcesBuildPhase;
-			buildActionMask = 2147483647;
-			files = (
-				{source_build_refs['WordJournalApp.swift']} /* WordJournalApp.swift in Sources */,
-				{source_build_refs['WordEntry.swift']} /* WordEntry.swift in Sources */,
-				{source_build_refs['DictionaryResult.swift']} /* DictionaryResult.swift in Sources */,
-				{source_build_refs['AccessibilityMonitor.swift']} /* AccessibilityMonitor.swift in Sources */,
-				{source_build_refs['DictionaryService.swift']} /* DictionaryService.swift in Sources */,
-				{source_build_refs['JournalStorage.swift']} /* JournalStorage.swift in Sources */,
-				{source_build_refs['DefinitionPopupView.swift']} /* DefinitionPopupView.swift in Sources */,
-				{source_build_refs['JournalView.swift']} /* JournalView.swift in Sources */,
-				{source_build_refs['MenuBarView.swift']} /* MenuBarView.swift in Sources */,
-				{source_build_refs['PreferencesView.swift']} /* PreferencesView.swift in Sources */,
-				{source_build_refs['HotKeyManager.swift']} /* HotKeyManager.swift in Sources */,
-			);
-			runOnlyForDeploymentPostprocessing = 0;
-		}};
-/* End PBXSourcesBuildPhase section */
-
-/* Begin XCBuildConfiguration section */
-		{debug_config_uuid} /* Debug */ = {{
-			isa = XCBuildConfiguration;
-			buildSettings = {{
-				ALWAYS_SEARCH_USER_PATHS = NO;
-				ASSETCATALOG_COMPILER_GENERATE_SWIFT_ASSET_SYMBOL_EXTENSIONS = YES;
-				CLANG_ANALYZER_NONNULL = YES;
-				CLANG_ANALYZER_NUMBER_OBJECT_CONVERSION = YES_AGGRESSIVE;
-				CLANG_CXX_LANGUAGE_STANDARD = "gnu++20";
-				CLANG_ENABLE_MODULES = YES;
-				CLANG_ENABLE_OBJC_ARC = YES;
-				CLANG_ENABLE_OBJC_WEAK = YES;
-				CLANG_WARN_BLOCK_CAPTURE_AUTORELEASING = YES;
-				CLANG_WARN_BOOL_CONVERSION = YES;
-				CLANG_WARN_COMMA = YES;
-				CLANG_WARN_CONSTANT_CONVERSION = YES;
-				CLANG_WARN_DEPRECATED_OBJC_IMPLEMENTATIONS = YES;
-				CLANG_WARN_DIRECT_OBJC_ISA_USAGE = YES_ERROR;
-				CLANG_WARN_DOCUMENTATION_COMMENTS = YES;
-				CLANG_WARN_EMPTY_BODY = YES;
-				CLANG_WARN_ENUM_CONVERSION = YES;
-				CLANG_WARN_INFINITE_RECURSION = YES;
-				CLANG_WARN_INT_CONVERSION = YES;
-				CLANG_WARN_NON_LITERAL_NULL_CONVERSION = YES;
-				CLANG_WARN_OBJC_IMPLICIT_RETAIN_SELF = YES;
-				CLANG_WARN_OBJC_LITERAL_CONVERSION = YES;
-				CLANG_WARN_OBJC_ROOT_CLASS = YES_ERROR;
-				CLANG_WARN_QUOTED_INCLUDE_IN_FRAMEWORK_HEADER = YES;
-				CLANG_WARN_RANGE_LOOP_ANALYSIS = YES;
-				CLANG_WARN_STRICT_PROTOTYPES = YES;
-				CLANG_WARN_SUSPICIOUS_MOVE = YES;
-				CLANG_WARN_UNGUARDED_AVAILABILITY = YES_AGGRESSIVE;
-				CLANG_WARN_UNREACHABLE_CODE = YES;
-				CLANG_WARN__DUPLICATE_METHOD_MATCH = YES;
-				COPY_PHASE_STRIP = NO;
-				DEBUG_INFORMATION_FORMAT = dwarf;
-				ENABLE_STRICT_OBJC_MSGSEND = YES;
-				ENABLE_TESTABILITY = YES;
-				ENABLE_USER_SCRIPT_SANDBOXING = YES;
-				GCC_C_LANGUAGE_STANDARD = gnu17;
-				GCC_DYNAMIC_NO_PIC = NO;
-				GCC_NO_COMMON_BLOCKS = YES;
-				GCC_OPTIMIZATION_LEVEL = 0;
-				GCC_PREPROCESSOR_DEFINITIONS = (
-					"DEBUG=1",
-					"$(inherited)",
-				);
-				GCC_WARN_64_TO_32_BIT_CONVERSION = YES;
-				GCC_WARN_ABOUT_RETURN_TYPE = YES_ERROR;
-				GCC_WARN_UNDECLARED_SELECTOR = YES;
-				GCC_WARN_UNINITIALIZED_AUTOS = YES_AGGRESSIVE;
-				GCC_WARN_UNUSED_FUNCTION = YES;
-				GCC_WARN_UNUSED_VARIABLE = YES;
-				LOCALIZATION_PREFERS_STRING_CATALOGS = YES;
-				MACOSX_DEPLOYMENT_TARGET = 13.0;
-				MTL_ENABLE_DEBUG_INFO = INCLUDE_SOURCE;
-				MTL_FAST_MATH = YES;
-				ONLY_ACTIVE_ARCH = YES;
-				SDKROOT = macosx;
-				SWIFT_ACTIVE_COMPILATION_CONDITIONS = "DEBUG $(inherited)";
-				SWIFT_OPTIMIZATION_LEVEL = "-Onone";
-			}};
-			name = Debug;
-		}};
-		{release_config_uuid} /* Release */ = {{
-			isa = XCBuildConfiguration;
-			buildSettings = {{
-				ALWAYS_SEARCH_USER_PATHS = NO;
-				ASSETCATALOG_COMPILER_GENERATE_SWIFT_ASSET_SYMBOL_EXTENSIONS = YES;
-				CLANG_ANALYZER_NONNULL = YES;
-				CLANG_ANALYZER_NUMBER_OBJECT_CONVERSION = YES_AGGRESSIVE;
-				CLANG_CXX_LANGUAGE_STANDARD = "gnu++20";
-				CLANG_ENABLE_MODULES = YES;
-				CLANG_ENABLE_OBJC_ARC = YES;
-				CLANG_ENABLE_OBJC_WEAK = YES;
-				CLANG_WARN_BLOCK_CAPTURE_AUTORELEASING = YES;
-				CLANG_WARN_BOOL_CONVERSION = YES;
-				CLANG_WARN_COMMA = YES;
-				CLANG_WARN_CONSTANT_CONVERSION = YES;
-				CLANG_WARN_DEPRECATED_OBJC_IMPLEMENTATIONS = YES;
-				CLANG_WARN_DIRECT_OBJC_ISA_USAGE = YES_ERROR;
-				CLANG_WARN_DOCUMENTATION_COMMENTS = YES;
-				CLANG_WARN_EMPTY_BODY = YES;
-				CLANG_WARN_ENUM_CONVERSION = YES;
-				CLANG_WARN_INFINITE_RECURSION = YES;
-				CLANG_WARN_INT_CONVERSION = YES;
-				CLANG_WARN_NON_LITERAL_NULL_CONVERSION = YES;
-				CLANG_WARN_OBJC_IMPLICIT_RETAIN_SELF = YES;
-				CLANG_WARN_OBJC_LITERAL_CONVERSION = YES;
-				CLANG_WARN_OBJC_ROOT_CLASS = YES_ERROR;
-				CLANG_WARN_QUOTED_INCLUDE_IN_FRAMEWORK_HEADER = YES;
-				CLANG_WARN_RANGE_LOOP_ANALYSIS = YES;
-				CLANG_WARN_STRICT_PROTOTYPES = YES;
-				CLANG_WARN_SUSPICIOUS_MOVE = YES;
-				CLANG_WARN_UNGUARDED_AVAILABILITY = YES_AGGRESSIVE;
-				CLANG_WARN_UNREACHABLE_CODE = YES;
-				CLANG_WARN__DUPLICATE_METHOD_MATCH = YES;
-				COPY_PHASE_STRIP = NO;
-				DEBUG_INFORMATION_FORMAT = "dwarf-with-dsym";
-				ENABLE_NS_ASSERTIONS = NO;
-				ENABLE_STRICT_OBJC_MSGSEND = YES;
-				ENABLE_USER_SCRIPT_SANDBOXING = YES;
-				GCC_C_LANGUAGE_STANDARD = gnu17;
-				GCC_NO_COMMON_BLOCKS = YES;
-				GCC_WARN_64_TO_32_BIT_CONVERSION = YES;
-				GCC_WARN_ABOUT_RETURN_TYPE = YES_ERROR;
-				GCC_WARN_UNDECLARED_SELECTOR = YES;
-				GCC_WARN_UNINITIALIZED_AUTOS = YES_AGGRESSIVE;
-				GCC_WARN_UNUSED_FUNCTION = YES;
-				GCC_WARN_UNUSED_VARIABLE = YES;
-				LOCALIZATION_PREFERS_STRING_CATALOGS = YES;
-				MACOSX_DEPLOYMENT_TARGET = 13.0;
-				MTL_ENABLE_DEBUG_INFO = NO;
-				MTL_FAST_MATH = YES;
-				SDKROOT = macosx;
-				SWIFT_COMPILATION_MODE = wholemodule;
-				SWIFT_OPTIMIZATION_LEVEL = "-O";
-			}};
-			name = Release;
-		}};
-		{project_debug_config_uuid} /* Debug */ = {{
-			isa = XCBuildConfiguration;
-			buildSettings = {{
-				ASSETCATALOG_COMPILER_APPICON_NAME = "";
-				ASSETCATALOG_COMPILER_GLOBAL_ACCENT_COLOR_NAME = "";
-				CODE_SIGN_ENTITLEMENTS = "";
-				CODE_SIGN_STYLE = Automatic;
-				COMBINE_HIDPI_IMAGES = YES;
-				CURRENT_PROJECT_VERSION = 1;
-				DEVELOPMENT_ASSET_PATHS = "";
-				ENABLE_PREVIEWS = YES;
-				GENERATE_INFOPLIST_FILE = NO;
-				INFOPLIST_FILE = WordJournal/Info.plist;
-				INFOPLIST_KEY_NSHumanReadableCopyright = "";
-				LD_RUNPATH_SEARCH_PATHS = (
-					"$(inherited)",
-					"@executable_path/../Frameworks",
-				);
-				MARKETING_VERSION = 1.0;
-				PRODUCT_BUNDLE_IDENTIFIER = com.wordjournal.app;
-				PRODUCT_NAME = "$(TARGET_NAME)";
-				SWIFT_EMIT_LOC_STRINGS = YES;
-				SWIFT_VERSION = 5.0;
-			}};
-			name = Debug;
-		}};
-		{project_release_config_uuid} /* Release */ = {{
-			isa = XCBuildConfiguration;
-			buildSettings = {{
-				ASSETCATALOG_COMPILER_APPICON_NAME = "";
-				ASSETCATALOG_COMPILER_GLOBAL_ACCENT_COLOR_NAME = "";
-				CODE_SIGN_ENTITLEMENTS = "";
-				CODE_SIGN_STYLE = Automatic;
-				COMBINE_HIDPI_IMAGES = YES;
-				CURRENT_PROJECT_VERSION = 1;
-				DEVELOPMENT_ASSET_PATHS = "";
-				ENABLE_PREVIEWS = YES;
-				GENERATE_INFOPLIST_FILE = NO;
-				INFOPLIST_FILE = WordJournal/Info.plist;
-				INFOPLIST_KEY_NSHumanReadableCopyright = "";
-				LD_RUNPATH_SEARCH_PATHS = (
-					"$(inherited)",
-					"@executable_path/../Frameworks",
-				);
-				MARKETING_VERSION = 1.0;
-				PRODUCT_BUNDLE_IDENTIFIER = com.wordjournal.app;
-				PRODUCT_NAME = "$(TARGET_NAME)";
-				SWIFT_EMIT_LOC_STRINGS = YES;
-				SWIFT_VERSION = 5.0;
-			}};
-			name = Release;
-		}};
-/* End XCBuildConfiguration section */
-
-/* Begin XCConfigurationList section */
-		{target_config_list_uuid} /* Build configuration list for PBXNativeTarget "WordJournal" */ = {{
-			isa = XCConfigurationList;
-			buildConfigurations = (
-				{debug_config_uuid} /* Debug */,
-				{release_config_uuid} /* Release */,
-			);
-			defaultConfigurationIsVisible = 0;
-			defaultConfigurationName = Release;
-		}};
-		{project_config_list_uuid} /* Build configuration list for PBXProject "WordJournal" */ = {{
-			isa = XCConfigurationList;
-			buildConfigurations = (
-				{project_debug_config_uuid} /* Debug */,
-				{project_release_config_uuid} /* Release */,
-			);
-			defaultConfigurationIsVisible = 0;
-			defaultConfigurationName = Release;
-		}};
-/* End XCConfigurationList section */
-	}};
-	rootObject = {project_uuid} /* Project object */;
-}}
-'''
-
-# Write the corrected project file
-project_dir = Path('WordJournal.xcodeproj')
-project_dir.mkdir(exist_ok=True)
-
-pbxproj_path = project_dir / 'project.pbxproj'
-with open(pbxproj_path, 'w') as f:
-    f.write(pbxproj)
-
-print("[OK] Fixed Xcode project file!")
-print("[OK] All UUIDs are now consistent and properly referenced")
-print("\nThe project should now open correctly in Xcode.")
+COMPILER_RELEASE_SETTINGS = {
+    **COMPILER_SETTINGS,
+    'DEBUG_INFORMATION_FORMAT': 'dwarf-with-dsym',
+    'ENABLE_NS_ASSERTIONS': 'NO',
+    'MTL_ENABLE_DEBUG_INFO': 'NO',
+    'SWIFT_COMPILATION_MODE': 'wholemodule',
+    'SWIFT_OPTIMIZATION_LEVEL': '-O',
+}
+
+PRODUCT_SETTINGS = {
+    'ASSETCATALOG_COMPILER_APPICON_NAME': '',
+    'ASSETCATALOG_COMPILER_GLOBAL_ACCENT_COLOR_NAME': '',
+    'CODE_SIGN_ENTITLEMENTS': '',
+    'CODE_SIGN_STYLE': 'Automatic',
+    'COMBINE_HIDPI_IMAGES': 'YES',
+    'CURRENT_PROJECT_VERSION': '1',
+    'DEVELOPMENT_ASSET_PATHS': '',
+    'ENABLE_PREVIEWS': 'YES',
+    'GENERATE_INFOPLIST_FILE': 'NO',
+    'INFOPLIST_FILE': 'WordJournal/Info.plist',
+    'INFOPLIST_KEY_NSHumanReadableCopyright': '',
+    'LD_RUNPATH_SEARCH_PATHS': ['$(inherited)', '@executable_path/../Frameworks'],
+    'MARKETING_VERSION': '1.0',
+    'PRODUCT_BUNDLE_IDENTIFIER': 'com.wordjournal.app',
+    'PRODUCT_NAME': '$(TARGET_NAME)',
+    'SWIFT_EMIT_LOC_STRINGS': 'YES',
+    'SWIFT_VERSION': '5.0',
+}
+
+def object_id(kind, path='', target=TARGET_NAME):
+    """
+    Derive a 24-character hex Xcode object ID from (object kind, path, target).
+
+    IDs are a stable hash instead of uuid4, so regenerating an unchanged tree
+    is byte-identical and Xcode's derived data and indexes stay valid.
+    Project-level objects pass target=''.
+    """
+    digest = hashlib.sha1(f'{kind}\0{target}\0{path}'.encode()).hexdigest()
+    return digest[:24].upper()
+
+
+STATIC_IDS = {
+    'project': object_id('PBXProject', target=''),
+    'main_group': object_id('PBXGroup', '<main>', target=''),
+    'products_group': object_id('PBXGroup', '<products>', target=''),
+    'project_debug_config': object_id('XCBuildConfiguration', 'Debug', target=''),
+    'project_release_config': object_id('XCBuildConfiguration', 'Release', target=''),
+    'project_config_list': object_id('XCConfigurationList', target=''),
+    'target': object_id('PBXNativeTarget'),
+    'product': object_id('PBXFileReference', f'{TARGET_NAME}.app'),
+    'sources_phase': object_id('PBXSourcesBuildPhase'),
+    'frameworks_phase': object_id('PBXFrameworksBuildPhase'),
+    'resources_phase': object_id('PBXResourcesBuildPhase'),
+    'target_debug_config': object_id('XCBuildConfiguration', 'Debug'),
+    'target_release_config': object_id('XCBuildConfiguration', 'Release'),
+    'target_config_list': object_id('XCConfigurationList'),
+}
+
+
+def file_ids(rel):
+    """Object IDs owned by one path under WordJournal/."""
+    path = f'{SOURCE_DIR.name}/{rel}'
+    return {'file': object_id('PBXFileReference', path, target=''),
+            'build': object_id('PBXBuildFile', path)}
+
+
+def group_id(group):
+    return object_id('PBXGroup', f'{SOURCE_DIR.name}/{group}'.rstrip('/'), target='')
+
+
+def content_hash(path):
+    """SHA-1 of a file, or of the sorted entry names for a bundle directory."""
+    h = hashlib.sha1()
+    if path.is_dir():
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                h.update(os.path.relpath(os.path.join(root, name), path).encode())
+        return h.hexdigest()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def scan_tree(root):
+    """Walk the source tree once; return {posix path relative to root: stat}."""
+    found = {}
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.name.startswith('.') or entry.name in EXCLUDED:
+                    continue
+                ext = os.path.splitext(entry.name)[1]
+                if entry.is_dir() and ext not in BUNDLE_EXTENSIONS:
+                    stack.append(entry.path)
+                elif ext in FILE_TYPES:
+                    rel = Path(entry.path).relative_to(root).as_posix()
+                    found[rel] = entry.stat()
+    return found
+
+
+def load_state():
+    try:
+        with open(STATE_PATH) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if state.get('version') != STATE_VERSION:
+        return None
+    return state
+
+
+def save_state(state):
+    tmp = STATE_PATH.with_suffix('.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+    os.replace(tmp, STATE_PATH)
+
+
+def describe(rel):
+    """State entry for one path: its file type and the build phase it joins."""
+    file_type, phase = FILE_TYPES[os.path.splitext(rel)[1]]
+    return {'type': file_type, 'phase': phase}
+
+
+def refresh_entries(found, previous):
+    """
+    Reconcile the scanned tree with the previous state.
+
+    Paths whose mtime/size are unchanged are reused without touching the file.
+    Otherwise the content hash is recomputed. A path counts as added when it
+    is new or its file type changed. Returns (entries, added, removed).
+    """
+    entries = {}
+    added = []
+    for rel, st in found.items():
+        old = previous.get(rel)
+        if old and old['mtime'] == st.st_mtime_ns and old['size'] == st.st_size:
+            entries[rel] = old
+            continue
+        entry = describe(rel)
+        if not old or old['type'] != entry['type']:
+            added.append(rel)
+        entry['mtime'] = st.st_mtime_ns
+        entry['size'] = st.st_size
+        entry['sha1'] = content_hash(SOURCE_DIR / rel)
+        entries[rel] = entry
+    removed = sorted(set(previous) - set(found))
+    return entries, sorted(added), removed
+
+
+def group_tree(paths):
+    """Map each group path ('' is the WordJournal group) to (files, subgroups)."""
+    tree = {'': ([], [])}
+    for rel in sorted(paths, key=str.lower):
+        parent = rel.rpartition('/')[0]
+        tree.setdefault(parent, ([], []))[0].append(rel)
+        while parent:
+            grandparent = parent.rpartition('/')[0]
+            siblings = tree.setdefault(grandparent, ([], []))[1]
+            if parent in siblings:
+                break
+            siblings.append(parent)
+            parent = grandparent
+    return tree
+
+
+def add_file(project, rel, entry):
+    """Add the PBXFileReference (and PBXBuildFile, if any) for one path."""
+    ids = file_ids(rel)
+    name = rel.rsplit('/', 1)[-1]
+    project.add(pbxproj.PBXFileReference(
+        ids['file'], lastKnownFileType=entry['type'], path=name, sourceTree='<group>'))
+    if entry['phase']:
+        project.add(pbxproj.PBXBuildFile(ids['build'], fileRef=ids['file']))
+    return ids
+
+
+def resolved_packages():
+    """(repository URL, version) for each remote package pinned in Package.resolved."""
+    try:
+        with open(PACKAGE_RESOLVED) as f:
+            pins = json.load(f)['pins']
+    except (OSError, ValueError, KeyError):
+        return []
+    return [(pin['location'], pin['state']['version']) for pin in pins
+            if pin.get('kind') == 'remoteSourceControl' and pin.get('state', {}).get('version')]
+
+
+def add_packages(project):
+    """Add Swift package references for the pinned packages; return their IDs."""
+    ids = {'references': [], 'products': [], 'build_files': []}
+    for url, version in resolved_packages():
+        product = url.rstrip('/').rsplit('/', 1)[-1]
+        if product.endswith('.git'):
+            product = product[:-4]
+        ref = project.add(pbxproj.PBXObject(
+            object_id('XCRemoteSwiftPackageReference', url, target=''),
+            isa='XCRemoteSwiftPackageReference',
+            repositoryURL=url,
+            requirement={'kind': 'exactVersion', 'version': version}))
+        dependency = project.add(pbxproj.PBXObject(
+            object_id('XCSwiftPackageProductDependency', product),
+            isa='XCSwiftPackageProductDependency',
+            package=ref.id,
+            productName=product))
+        build = project.add(pbxproj.PBXBuildFile(
+            object_id('PBXBuildFile', f'<package>/{product}'), productRef=dependency.id))
+        ids['references'].append(ref.id)
+        ids['products'].append(dependency.id)
+        ids['build_files'].append(build.id)
+    return ids
+
+
+def build_project(entries):
+    """Build the object graph for the scanned tree."""
+    static = STATIC_IDS
+    project = pbxproj.Project(root_object=static['project'])
+    by_phase = {'Sources': [], 'Resources': []}
+    for rel in sorted(entries):
+        ids = add_file(project, rel, entries[rel])
+        if entries[rel]['phase']:
+            by_phase[entries[rel]['phase']].append(ids['build'])
+
+    project.add(pbxproj.PBXFileReference(
+        static['product'], explicitFileType='wrapper.application', includeInIndex='0',
+        path=f'{TARGET_NAME}.app', sourceTree='BUILT_PRODUCTS_DIR'))
+
+    for group, (files, subgroups) in group_tree(entries).items():
+        project.add(pbxproj.PBXGroup(
+            group_id(group),
+            children=[file_ids(rel)['file'] for rel in files] + [group_id(sub) for sub in subgroups],
+            path=group.rsplit('/', 1)[-1] or SOURCE_DIR.name,
+            sourceTree='<group>'))
+    project.add(pbxproj.PBXGroup(
+        static['main_group'], children=[group_id(''), static['products_group']], sourceTree='<group>'))
+    project.add(pbxproj.PBXGroup(
+        static['products_group'], children=[static['product']], name='Products', sourceTree='<group>'))
+
+    packages = add_packages(project)
+
+    phase_fields = {'buildActionMask': '2147483647', 'runOnlyForDeploymentPostprocessing': '0'}
+    project.add(pbxproj.PBXSourcesBuildPhase(static['sources_phase'], files=by_phase['Sources'], **phase_fields))
+    project.add(pbxproj.PBXFrameworksBuildPhase(
+        static['frameworks_phase'], files=packages['build_files'], **phase_fields))
+    project.add(pbxproj.PBXResourcesBuildPhase(
+        static['resources_phase'], files=by_phase['Resources'], **phase_fields))
+
+    project.add(pbxproj.PBXNativeTarget(
+        static['target'],
+        buildConfigurationList=static['target_config_list'],
+        buildPhases=[static['sources_phase'], static['frameworks_phase'], static['resources_phase']],
+        buildRules=[],
+        dependencies=[],
+        name=TARGET_NAME,
+        productName=TARGET_NAME,
+        productReference=static['product'],
+        productType='com.apple.product-type.application'))
+    if packages['products']:
+        project[static['target']]['packageProductDependencies'] = packages['products']
+
+    project.add(pbxproj.PBXProject(
+        static['project'],
+        attributes={
+            'BuildIndependentTargetsInParallel': '1',
+            'LastSwiftUpdateCheck': '1500',
+            'LastUpgradeCheck': '1500',
+            'TargetAttributes': {static['target']: {'CreatedOnToolsVersion': '15.0'}},
+        },
+        buildConfigurationList=static['project_config_list'],
+        compatibilityVersion='Xcode 14.0',
+        developmentRegion='en',
+        hasScannedForEncodings='0',
+        knownRegions=['en', 'Base'],
+        mainGroup=static['main_group'],
+        productRefGroup=static['products_group'],
+        projectDirPath='',
+        projectRoot='',
+        targets=[static['target']]))
+    if packages['references']:
+        project[static['project']]['packageReferences'] = packages['references']
+
+    for key, name, settings in (('target_debug_config', 'Debug', COMPILER_DEBUG_SETTINGS),
+                                ('target_release_config', 'Release', COMPILER_RELEASE_SETTINGS),
+                                ('project_debug_config', 'Debug', PRODUCT_SETTINGS),
+                                ('project_release_config', 'Release', PRODUCT_SETTINGS)):
+        project.add(pbxproj.XCBuildConfiguration(static[key], buildSettings=dict(settings), name=name))
+    for key, debug, release in (('target_config_list', 'target_debug_config', 'target_release_config'),
+                                ('project_config_list', 'project_debug_config', 'project_release_config')):
+        project.add(pbxproj.XCConfigurationList(
+            static[key],
+            buildConfigurations=[static[debug], static[release]],
+            defaultConfigurationIsVisible='0',
+            defaultConfigurationName='Release'))
+    return project
+
+
+def project_paths(project):
+    """
+    Walk the group tree of a loaded project.
+
+    Returns ({group path: group ID}, {file path: PBXFileReference ID}) with
+    paths relative to the project directory, e.g. 'WordJournal/Views'.
+    """
+    groups = {}
+    files = {}
+    root = project[project.root_object]
+    stack = [(root['mainGroup'], '')]
+    while stack:
+        group_id_, prefix = stack.pop()
+        for child_id in project[group_id_].get('children', ()):
+            child = project.objects.get(child_id)
+            if child is None or child.get('sourceTree', '<group>') != '<group>':
+                continue
+            path = child.get('path')
+            rel = f'{prefix}/{path}'.lstrip('/') if path else prefix
+            if child.isa in ('PBXGroup', 'PBXVariantGroup'):
+                groups[rel] = child_id
+                stack.append((child_id, rel))
+            elif child.isa == 'PBXFileReference':
+                files[rel] = child_id
+    return groups, files
+
+
+def target_phase(project, phase):
+    """The build phase of the app target that files of this phase belong to."""
+    isa = f'PBX{phase}BuildPhase'
+    for target in project.objects_of('PBXNativeTarget'):
+        if target.get('name') == TARGET_NAME:
+            for phase_id in target.get('buildPhases', ()):
+                if project[phase_id].isa == isa:
+                    return project[phase_id]
+    raise LookupError(f"target {TARGET_NAME} has no {isa}")
+
+
+def ensure_group(project, groups, rel):
+    """Return the group for rel (relative to WordJournal/), creating missing ones."""
+    key = f'{SOURCE_DIR.name}/{rel}'.rstrip('/')
+    if key in groups:
+        return project[groups[key]]
+    if not rel:
+        raise LookupError(f"project has no {SOURCE_DIR.name} group")
+    parent = ensure_group(project, groups, rel.rpartition('/')[0])
+    group = project.add(pbxproj.PBXGroup(
+        group_id(rel), children=[], path=rel.rsplit('/', 1)[-1], sourceTree='<group>'))
+    parent['children'] = parent.get('children', []) + [group.id]
+    groups[key] = group.id
+    return group
+
+
+def prune_groups(project, groups, removed):
+    """Drop the groups that removing these paths left empty, innermost first."""
+    emptied = set()
+    for rel in removed:
+        parent = rel.rpartition('/')[0]
+        while parent:
+            emptied.add(parent)
+            parent = parent.rpartition('/')[0]
+    for rel in sorted(emptied, key=lambda r: r.count('/'), reverse=True):
+        key = f'{SOURCE_DIR.name}/{rel}'
+        if key not in groups or project[groups[key]].get('children'):
+            continue
+        parent = project[groups[key.rpartition('/')[0]]]
+        parent['children'] = [child for child in parent.get('children', []) if child != groups[key]]
+        project.remove(groups.pop(key))
+
+
+def patch_project(project, entries):
+    """
+    Bring a loaded project's file references in line with the scanned tree.
+
+    Only objects for added or removed paths (and groups left empty) are
+    touched; everything else, including Swift package references and hand
+    edits, is left as parsed. A reference is only removed when it is one
+    this script manages (a FILE_TYPES extension, not EXCLUDED) and its file
+    is gone from disk, so hand-added .xcstrings, .xib etc. survive.
+    Returns (added, removed) paths relative to WordJournal/.
+    """
+    groups, files = project_paths(project)
+    prefix = f'{SOURCE_DIR.name}/'
+    on_project = {rel[len(prefix):]: id for rel, id in files.items() if rel.startswith(prefix)}
+
+    removed = sorted(rel for rel in set(on_project) - set(entries)
+                     if os.path.splitext(rel)[1] in FILE_TYPES
+                     and os.path.basename(rel) not in EXCLUDED
+                     and not (SOURCE_DIR / rel).exists())
+    for rel in removed:
+        project.remove_file_reference(on_project[rel])
+    prune_groups(project, groups, removed)
+
+    added = sorted(set(entries) - set(on_project))
+    for rel in added:
+        entry = entries[rel]
+        group = ensure_group(project, groups, rel.rpartition('/')[0])
+        ids = add_file(project, rel, entry)
+        group['children'] = group.get('children', []) + [ids['file']]
+        if entry['phase']:
+            phase = target_phase(project, entry['phase'])
+            phase['files'] = phase.get('files', []) + [ids['build']]
+    return added, removed
+
+
+def project_stamp():
+    st = PBXPROJ_PATH.stat()
+    return {'mtime': st.st_mtime_ns, 'size': st.st_size}
+
+
+def sync(state, project=None):
+    """
+    Scan the tree and patch the project for any added or removed paths.
+
+    The project is loaded and reconciled when a path was added or removed
+    on disk, or when project.pbxproj itself changed since the last sync (a
+    git checkout, an edit in Xcode). project is an already-loaded Project to
+    reuse (watch mode keeps one in memory). Returns (project, added,
+    removed); project is None if nothing needed loading.
+    """
+    found = scan_tree(SOURCE_DIR)
+    entries, added, removed = refresh_entries(found, state['files'])
+    state['files'] = entries
+    if added or removed or state.get('project') != project_stamp():
+        if project is None:
+            project = pbxproj.load(PBXPROJ_PATH)
+        added, removed = patch_project(project, entries)
+        if added or removed:
+            project.save(PBXPROJ_PATH)
+    state['project'] = project_stamp()
+    save_state(state)
+    return project, added, removed
+
+
+def report(added, removed):
+    for rel in added:
+        print(f"  + {rel}")
+    for rel in removed:
+        print(f"  - {rel}")
+
+
+class InotifyWatcher:
+    """Linux inotify on every directory of the tree, through libc via ctypes."""
+
+    # IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    MASK = 0x40 | 0x80 | 0x100 | 0x200
+
+    def __init__(self, root):
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._root = root
+        self._add_watches()
+
+    def _add_watches(self):
+        # Re-adding an existing watch is a no-op, so this also picks up new directories
+        for dirpath, dirnames, _ in os.walk(self._root):
+            dirnames[:] = [d for d in dirnames
+                           if not d.startswith('.') and os.path.splitext(d)[1] not in BUNDLE_EXTENSIONS]
+            self._libc.inotify_add_watch(self._fd, os.fsencode(dirpath), self.MASK)
+
+    def wait(self, timeout):
+        """Block up to timeout seconds (None = forever); True if anything changed."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return False
+        try:
+            while os.read(self._fd, 1 << 16):
+                pass
+        except BlockingIOError:
+            pass
+        self._add_watches()
+        return True
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Fallback for platforms without inotify: compare the scanned path set."""
+
+    def __init__(self, root, interval=POLL_SECONDS):
+        self._root = root
+        self._interval = interval
+        self._paths = set(scan_tree(root))
+
+    def wait(self, timeout):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            paths = set(scan_tree(self._root))
+            if paths != self._paths:
+                self._paths = paths
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            delay = self._interval if deadline is None else min(self._interval, deadline - time.monotonic())
+            time.sleep(max(delay, 0))
+
+    def close(self):
+        pass
+
+
+def make_watcher(root, poll=False):
+    if not poll:
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError, TypeError):
+            pass
+    return PollingWatcher(root)
+
+
+def watch(state, poll=False):
+    """Patch the project whenever files are added or removed, until Ctrl+C."""
+    from verify_project import verify  # imports this module, so not at the top
+
+    project, added, removed = sync(state)
+    report(added, removed)
+    watcher = make_watcher(SOURCE_DIR, poll)
+    print(f"[OK] Watching {SOURCE_DIR} with {type(watcher).__name__} (Ctrl+C to stop)")
+    project_mtime = PBXPROJ_PATH.stat().st_mtime_ns
+    try:
+        while True:
+            if not watcher.wait(None):
+                continue
+            while watcher.wait(DEBOUNCE_SECONDS):
+                pass
+            start = time.perf_counter()
+            # Xcode may have rewritten the project since we last loaded it
+            if project is not None and PBXPROJ_PATH.stat().st_mtime_ns != project_mtime:
+                project = None
+            project, added, removed = sync(state, project)
+            # sync may have reloaded or written the project; either way it now matches the file
+            project_mtime = PBXPROJ_PATH.stat().st_mtime_ns
+            if not added and not removed:
+                continue
+            elapsed = (time.perf_counter() - start) * 1000
+            report(added, removed)
+            problems = verify(project, scan_tree(SOURCE_DIR), {})
+            count = sum(len(v) for v in problems.values())
+            status = "verified" if not count else f"{count} problem(s), run verify_project.py"
+            print(f"[OK] Patched in {elapsed:.1f} ms ({status})")
+    except KeyboardInterrupt:
+        print()
+    finally:
+        watcher.close()
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    full = '--full' in argv or not PBXPROJ_PATH.exists()
+
+    PROJECT_DIR.mkdir(exist_ok=True)
+    state = load_state() or {'version': STATE_VERSION, 'files': {}}
+
+    if full:
+        found = scan_tree(SOURCE_DIR)
+        entries, _, _ = refresh_entries(found, state['files'])
+        state['files'] = entries
+        build_project(entries).save(PBXPROJ_PATH)
+        state['project'] = project_stamp()
+        save_state(state)
+        print(f"[OK] Wrote {PBXPROJ_PATH} ({len(entries)} files)")
+        print("[OK] All UUIDs are now consistent and properly referenced")
+        print("\nThe project should now open correctly in Xcode.")
+        if '--watch' not in argv:
+            return
+
+    if '--watch' in argv:
+        watch(state, poll='--poll' in argv)
+        return
+
+    _, added, removed = sync(state)
+    if not added and not removed:
+        print("[OK] Xcode project is up to date (no files added or removed)")
+        return
+    report(added, removed)
+    print(f"[OK] Patched {PBXPROJ_PATH} ({len(added)} added, {len(removed)} removed)")
+
+
+if __name__ == "__main__":
+    main()
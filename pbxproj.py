@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+"""
+Small object model for Xcode project.pbxproj files
+
+A Project holds PBX objects keyed by ID. write() streams the file straight to
+a file handle: sections are emitted in isa order and objects in ID order, one
+line at a time, so memory use does not depend on how large the output is.
+Reference comments (/* Foo.swift in Sources */) are derived from the graph
+the same way Xcode does, so callers only deal with IDs and field values.
+
+Field values are plain Python data: str for scalars, list for arrays and
+dict for dictionaries. Keys use Xcode's own spelling (fileRef, sourceTree...).
+
+load()/parse() read an existing project back into the same graph with a
+single-pass tokenizer, so tools can patch the committed project in place
+instead of regenerating it.
+
+Usage:
+    python3 pbxproj.py [path/to/project.pbxproj]   # parse and summarize
+    python3 pbxproj.py --benchmark 10000           # time parse/write on N objects
+"""
+
+import io
+import os
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+
+_UNQUOTED = re.compile(r'^[A-Za-z0-9_$./]+$')
+_ESCAPES = {'\\': '\\\\', '"': '\\"', '\n': '\\n', '\t': '\\t'}
+
+# Values under these keys are IDs of objects outside this file, never comment them
+_UNCOMMENTED_KEYS = {'remoteGlobalIDString', 'TargetAttributes'}
+
+# One alternation for the whole grammar: comments and whitespace are matched
+# but not captured, so findall() yields '' for them and the token otherwise.
+_TOKEN = re.compile(r'''
+    (?:\s+|/\*.*?\*/|//[^\n]*)
+  | ("(?:[^"\\]|\\.)*"|[{}()=;,]|[^\s{}()=;,"]+)
+''', re.S | re.X)
+_UNESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '"': '"', '\\': '\\'}
+_ESCAPE_SEQ = re.compile(r'\\(.)', re.S)
+
+_DEFAULT_PHASE_NAMES = {
+    'PBXSourcesBuildPhase': 'Sources',
+    'PBXFrameworksBuildPhase': 'Frameworks',
+    'PBXResourcesBuildPhase': 'Resources',
+    'PBXHeadersBuildPhase': 'Headers',
+    'PBXCopyFilesBuildPhase': 'CopyFiles',
+    'PBXShellScriptBuildPhase': 'ShellScript',
+}
+
+
+def quote(value):
+    """Quote a string the way Xcode does when it is not a bare word."""
+    if _UNQUOTED.match(value):
+        return value
+    return '"' + ''.join(_ESCAPES.get(c, c) for c in value) + '"'
+
+
+class ParseError(ValueError):
+    pass
+
+
+class PBXObject:
+    """One entry of the objects dictionary: an ID, an isa and its fields."""
+
+    isa = None
+    inline = False  # Xcode writes these on a single line
+
+    def __init__(self, id, isa=None, **fields):
+        self.id = id
+        if isa is not None:
+            self.isa = isa
+        self.fields = fields
+
+    def __getitem__(self, key):
+        return self.fields[key]
+
+    def __setitem__(self, key, value):
+        self.fields[key] = value
+
+    def get(self, key, default=None):
+        return self.fields.get(key, default)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.id!r}, {self.fields!r})'
+
+
+class PBXBuildFile(PBXObject):
+    isa = 'PBXBuildFile'
+    inline = True
+
+
+class PBXFileReference(PBXObject):
+    isa = 'PBXFileReference'
+    inline = True
+
+
+class PBXGroup(PBXObject):
+    isa = 'PBXGroup'
+
+
+class PBXSourcesBuildPhase(PBXObject):
+    isa = 'PBXSourcesBuildPhase'
+
+
+class PBXFrameworksBuildPhase(PBXObject):
+    isa = 'PBXFrameworksBuildPhase'
+
+
+class PBXResourcesBuildPhase(PBXObject):
+    isa = 'PBXResourcesBuildPhase'
+
+
+class PBXNativeTarget(PBXObject):
+    isa = 'PBXNativeTarget'
+
+
+class PBXProject(PBXObject):
+    isa = 'PBXProject'
+
+
+class XCBuildConfiguration(PBXObject):
+    isa = 'XCBuildConfiguration'
+
+
+class XCConfigurationList(PBXObject):
+    isa = 'XCConfigurationList'
+
+
+ISA_CLASSES = {cls.isa: cls for cls in (
+    PBXBuildFile, PBXFileReference, PBXGroup,
+    PBXSourcesBuildPhase, PBXFrameworksBuildPhase, PBXResourcesBuildPhase,
+    PBXNativeTarget, PBXProject, XCBuildConfiguration, XCConfigurationList,
+)}
+
+
+def make_object(id, isa, fields):
+    """Instantiate the class registered for isa (or a generic PBXObject)."""
+    cls = ISA_CLASSES.get(isa)
+    if cls is None:
+        return PBXObject(id, isa=isa, **fields)
+    return cls(id, **fields)
+
+
+class Project:
+    """The object graph of one project.pbxproj file."""
+
+    def __init__(self, root_object=None, archive_version='1', object_version='56', classes=None):
+        self.objects = {}
+        self.root_object = root_object
+        self.archive_version = archive_version
+        self.object_version = object_version
+        self.classes = classes if classes is not None else {}
+
+    def add(self, obj):
+        if obj.id in self.objects:
+            raise ValueError(f"duplicate object ID {obj.id} ({obj.isa})")
+        self.objects[obj.id] = obj
+        return obj
+
+    def remove(self, id):
+        return self.objects.pop(id, None)
+
+    def __contains__(self, id):
+        return id in self.objects
+
+    def __getitem__(self, id):
+        return self.objects[id]
+
+    def objects_of(self, isa):
+        return [obj for obj in self.objects.values() if obj.isa == isa]
+
+    def remove_file_reference(self, file_id):
+        """
+        Remove a file reference, its build files, and every list entry that
+        points at either of them (group children, build phase files).
+        """
+        doomed = {file_id}
+        doomed.update(obj.id for obj in self.objects.values()
+                      if obj.isa == 'PBXBuildFile' and obj.get('fileRef') == file_id)
+        for obj in self.objects.values():
+            for key in ('children', 'files'):
+                items = obj.get(key)
+                if items and not doomed.isdisjoint(items):
+                    obj[key] = [item for item in items if item not in doomed]
+        for id in doomed:
+            self.objects.pop(id, None)
+        return doomed
+
+    # -- comments ----------------------------------------------------------
+
+    def _comment_index(self):
+        """One pass over the graph for comments that depend on other objects."""
+        phase_of = {}
+        owner_of = {}
+        for obj in self.objects.values():
+            if obj.isa in _DEFAULT_PHASE_NAMES:
+                name = obj.get('name') or _DEFAULT_PHASE_NAMES[obj.isa]
+                for build_id in obj.get('files', ()):
+                    phase_of[build_id] = name
+            config_list = obj.get('buildConfigurationList')
+            if config_list:
+                owner_of[config_list] = obj
+        return phase_of, owner_of
+
+    def _comment(self, id, index):
+        obj = self.objects.get(id)
+        if obj is None:
+            return None
+        phase_of, owner_of = index
+        isa = obj.isa
+        if isa == 'PBXBuildFile':
+            ref = obj.get('fileRef') or obj.get('productRef')
+            return f'{self._comment(ref, index)} in {phase_of.get(id, "Sources")}'
+        if isa == 'PBXProject':
+            return 'Project object'
+        if isa in _DEFAULT_PHASE_NAMES:
+            return obj.get('name') or _DEFAULT_PHASE_NAMES[isa]
+        if isa == 'XCConfigurationList':
+            owner = owner_of.get(id)
+            if owner is None:
+                return None
+            name = owner.get('name') or self._project_name()
+            return f'Build configuration list for {owner.isa} "{name}"'
+        if isa == 'XCRemoteSwiftPackageReference':
+            url = obj.get('repositoryURL', '')
+            name = url.rstrip('/').rsplit('/', 1)[-1]
+            if name.endswith('.git'):
+                name = name[:-4]
+            return f'{isa} "{name}"'
+        if isa == 'XCSwiftPackageProductDependency':
+            return obj.get('productName')
+        if isa in ('PBXContainerItemProxy', 'PBXTargetDependency'):
+            return isa
+        return obj.get('name') or obj.get('path')
+
+    def _project_name(self):
+        root = self.objects.get(self.root_object)
+        if root is not None:
+            for target_id in root.get('targets', ()):
+                target = self.objects.get(target_id)
+                if target is not None and target.get('name'):
+                    return target['name']
+        return ''
+
+    # -- writing -------------------------------------------------------------
+
+    def _value(self, value, index, key=None):
+        if isinstance(value, str):
+            text = quote(value)
+            if index is not None and key not in _UNCOMMENTED_KEYS and value in self.objects:
+                comment = self._comment(value, index)
+                if comment:
+                    text += f' /* {comment} */'
+            return text
+        raise TypeError(f"unexpected scalar {value!r} under {key!r}")
+
+    def _write_value(self, fh, key, value, index, depth):
+        pad = '\t' * depth
+        if isinstance(value, dict):
+            fh.write(f'{pad}{quote(key)} = {{\n')
+            for sub in sorted(value):
+                self._write_value(fh, sub, value[sub], index if key not in _UNCOMMENTED_KEYS else None,
+                                  depth + 1)
+            fh.write(f'{pad}}};\n')
+        elif isinstance(value, list):
+            fh.write(f'{pad}{quote(key)} = (\n')
+            for item in value:
+                if isinstance(item, dict):
+                    raise TypeError(f"dictionaries inside arrays are not supported ({key})")
+                fh.write(f'{pad}\t{self._value(item, index, key)},\n')
+            fh.write(f'{pad});\n')
+        else:
+            fh.write(f'{pad}{quote(key)} = {self._value(value, index, key)};\n')
+
+    def _inline_value(self, key, value, index):
+        if isinstance(value, dict):
+            inner = ''.join(f'{quote(k)} = {self._inline_value(k, value[k], index)}; ' for k in sorted(value))
+            return '{' + inner + '}'
+        if isinstance(value, list):
+            return '(' + ''.join(f'{self._value(item, index, key)}, ' for item in value) + ')'
+        return self._value(value, index, key)
+
+    def _write_object(self, fh, obj, index):
+        comment = self._comment(obj.id, index)
+        head = f'\t\t{obj.id}' + (f' /* {comment} */' if comment else '')
+        keys = sorted(obj.fields)
+        if obj.inline:
+            body = ''.join(f'{quote(k)} = {self._inline_value(k, obj.fields[k], index)}; ' for k in keys)
+            fh.write(f'{head} = {{isa = {obj.isa}; {body}}};\n')
+            return
+        fh.write(f'{head} = {{\n')
+        fh.write(f'\t\t\tisa = {obj.isa};\n')
+        for key in keys:
+            self._write_value(fh, key, obj.fields[key], index, 3)
+        fh.write('\t\t};\n')
+
+    def write(self, fh):
+        """Stream the project to an open text file handle."""
+        index = self._comment_index()
+        sections = defaultdict(list)
+        for id, obj in self.objects.items():
+            sections[obj.isa].append(id)
+
+        fh.write('// !$*UTF8*$!\n{\n')
+        fh.write(f'\tarchiveVersion = {quote(self.archive_version)};\n')
+        self._write_value(fh, 'classes', self.classes, index, 1)
+        fh.write(f'\tobjectVersion = {quote(self.object_version)};\n')
+        fh.write('\tobjects = {\n')
+        for isa in sorted(sections):
+            fh.write(f'\n/* Begin {isa} section */\n')
+            for id in sorted(sections[isa]):
+                self._write_object(fh, self.objects[id], index)
+            fh.write(f'/* End {isa} section */\n')
+        fh.write('\t};\n')
+        fh.write(f'\trootObject = {self._value(self.root_object, index)};\n')
+        fh.write('}\n')
+
+    def save(self, path):
+        """Write to path atomically (via a temporary file in the same directory)."""
+        tmp = f'{path}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as fh:
+            self.write(fh)
+        os.replace(tmp, path)
+
+
+# -- reading -----------------------------------------------------------------
+
+def _unquote(token):
+    if token[0] != '"':
+        return token
+    body = token[1:-1]
+    if '\\' in body:
+        body = _ESCAPE_SEQ.sub(lambda m: _UNESCAPES.get(m.group(1), m.group(1)), body)
+    return body
+
+
+def _parse_tokens(tokens):
+    """Recursive-descent parse of the token list into dict/list/str values."""
+    pos = 0
+
+    def value():
+        nonlocal pos
+        token = tokens[pos]
+        pos += 1
+        if token == '{':
+            result = {}
+            while tokens[pos] != '}':
+                key = _unquote(tokens[pos])
+                if tokens[pos + 1] != '=':
+                    raise ParseError(f"expected '=' after {key!r}, got {tokens[pos + 1]!r}")
+                pos += 2
+                result[key] = value()
+                if tokens[pos] != ';':
+                    raise ParseError(f"expected ';' after value of {key!r}, got {tokens[pos]!r}")
+                pos += 1
+            pos += 1
+            return result
+        if token == '(':
+            result = []
+            while tokens[pos] != ')':
+                result.append(value())
+                if tokens[pos] == ',':
+                    pos += 1
+                elif tokens[pos] != ')':
+                    raise ParseError(f"expected ',' or ')' in array, got {tokens[pos]!r}")
+            pos += 1
+            return result
+        if token in '}),;=':
+            raise ParseError(f"unexpected {token!r}")
+        return _unquote(token)
+
+    try:
+        root = value()
+    except IndexError:
+        raise ParseError("unexpected end of file") from None
+    if pos != len(tokens):
+        raise ParseError(f"trailing data after the root dictionary ({tokens[pos]!r})")
+    return root
+
+
+def parse(text):
+    """Parse the text of a project.pbxproj into a Project."""
+    tokens = [t for t in _TOKEN.findall(text) if t]
+    if not tokens:
+        raise ParseError("empty project file")
+    root = _parse_tokens(tokens)
+    if not isinstance(root, dict) or 'objects' not in root:
+        raise ParseError("not a project.pbxproj (no objects dictionary)")
+    project = Project(
+        root_object=root.get('rootObject'),
+        archive_version=root.get('archiveVersion', '1'),
+        object_version=root.get('objectVersion', '56'),
+        classes=root.get('classes', {}),
+    )
+    objects = project.objects
+    for id, fields in root['objects'].items():
+        isa = fields.pop('isa', None)
+        if isa is None:
+            raise ParseError(f"object {id} has no isa")
+        objects[id] = make_object(id, isa, fields)
+    return project
+
+
+def load(path):
+    with open(path, encoding='utf-8') as fh:
+        return parse(fh.read())
+
+
+# -- command line ------------------------------------------------------------
+
+def synthetic_project(count):
+    """A project with roughly count objects: count // 2 files, each built once."""
+    project = Project(root_object='D' * 24)
+    children = []
+    build_files = []
+    for n in range(count // 2):
+        file_id = f'{n:024X}'
+        build_id = f'{n + (1 << 60):024X}'
+        name = f'File{n}.swift'
+        project.add(PBXFileReference(file_id, lastKnownFileType='sourcecode.swift',
+                                     path=name, sourceTree='<group>'))
+        project.add(PBXBuildFile(build_id, fileRef=file_id))
+        children.append(file_id)
+        build_files.append(build_id)
+    project.add(PBXGroup('F' * 24, children=children, sourceTree='<group>'))
+    project.add(PBXSourcesBuildPhase('E' * 24, buildActionMask='2147483647', files=build_files,
+                                     runOnlyForDeploymentPostprocessing='0'))
+    project.add(PBXProject('D' * 24, mainGroup='F' * 24, targets=[]))
+    return project
+
+
+def benchmark(count):
+    buffer = io.StringIO()
+    start = time.perf_counter()
+    synthetic_project(count).write(buffer)
+    written = time.perf_counter()
+    text = buffer.getvalue()
+    project = parse(text)
+    parsed = time.perf_counter()
+    print(f"{len(project.objects)} objects, {len(text) / 1e6:.1f} MB")
+    print(f"  write: {(written - start) * 1000:.0f} ms")
+    print(f"  parse: {(parsed - written) * 1000:.0f} ms")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ['--benchmark']:
+        benchmark(int(argv[1]) if len(argv) > 1 else 10000)
+        return
+    path = argv[0] if argv else os.path.join(os.path.dirname(__file__), 'WordJournal.xcodeproj', 'project.pbxproj')
+    start = time.perf_counter()
+    project = load(path)
+    elapsed = time.perf_counter() - start
+    print(f"[OK] Parsed {path}: {len(project.objects)} objects in {elapsed * 1000:.1f} ms")
+    for isa, count in sorted(Counter(obj.isa for obj in project.objects.values()).items()):
+        print(f"  {isa}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Benchmark the asset scripts on synthetic inputs of increasing size.
+
+Cases:
+- icon:        icon_pipeline.apply_spec + pyramid + write_iconset, N icon sets
+- screenshots: prepare_appstore_assets.process_image on N screenshots
+- og:          create_og_image.render_card for N cards
+- pbxproj:     fix_xcode_project.build_project + write for N source files
+
+Each (case, size) runs in a fresh worker process, so its peak RSS (VmHWM
+where /proc exists) is its own, interpreter and imports included. The work is repeated --repeat times and
+the median (p50) wall-clock time is kept. Synthetic inputs are generated
+before timing starts and are not part of either figure.
+
+Results are written to scripts/.benchmark_results.json. --save-baseline makes
+them the baseline instead; when a baseline exists, any case whose p50 time or
+peak RSS exceeds it by more than --time-threshold / --rss-threshold (fractions,
+default 0.25 and 0.20) is reported as a regression and the exit code is 1.
+Time differences under MIN_TIME_DELTA never count, so tiny cases stay quiet.
+Baselines are machine-specific, so record one per machine (or CI runner).
+
+Usage:
+    python3 scripts/benchmark_assets.py                    # compare to baseline
+    python3 scripts/benchmark_assets.py --save-baseline    # record baseline
+    python3 scripts/benchmark_assets.py --quick            # skip the largest sizes
+    python3 scripts/benchmark_assets.py --only pbxproj --repeat 5
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+RESULTS_PATH = SCRIPT_DIR / ".benchmark_results.json"
+BASELINE_PATH = SCRIPT_DIR / ".benchmark_baseline.json"
+
+# Input sizes per case, smallest first; --quick drops the last one
+SCALES = {
+    "icon": [1, 10],
+    "screenshots": [10, 100, 1000],
+    "og": [10, 100],
+    "pbxproj": [12, 200, 2000],
+}
+REPEATS = 3
+TIME_THRESHOLD = 0.25
+RSS_THRESHOLD = 0.20
+# Differences smaller than this are timer noise, whatever the ratio
+MIN_TIME_DELTA = 0.005
+
+SCREENSHOT_SIZE = (1800, 1200)  # the largest capture in screenshots/
+DISTINCT_SCREENSHOTS = 10       # larger batches repeat these files
+ICON_SPECS = [
+    {"safe_ratio": 1.0, "background": None, "padding": 0},
+    {"safe_ratio": 0.8, "background": "auto", "padding": 0},
+    {"safe_ratio": 0.8, "background": [255, 255, 255, 255], "padding": 40},
+]
+
+
+def peak_rss_mb() -> float:
+    """
+    Peak resident set size of this process in MB.
+
+    ru_maxrss survives fork + exec, so a spawned worker would report at
+    least its parent's peak; VmHWM belongs to the address space and starts
+    over at exec. ru_maxrss is only the fallback where /proc is missing
+    (macOS), which is why the inputs are generated out of the parent too.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+
+# -- synthetic inputs -----------------------------------------------------------
+
+def synthetic_icon():
+    """A 1024 RGBA master: a rounded, shaded square with a transparent margin."""
+    import numpy as np
+    from PIL import Image, ImageDraw
+    import icon_pipeline
+
+    size = icon_pipeline.MASTER_SIZE
+    y, x = np.mgrid[0:size, 0:size]
+    rgba = np.zeros((size, size, 4), np.uint8)
+    rgba[..., 0] = 60 + x * 80 // size
+    rgba[..., 1] = 100 + y * 60 // size
+    rgba[..., 2] = 170
+    mask = Image.new("L", (size, size), 0)
+    ImageDraw.Draw(mask).rounded_rectangle((100, 100, size - 100, size - 100), radius=180, fill=255)
+    rgba[..., 3] = np.asarray(mask)
+    return Image.fromarray(rgba, "RGBA")
+
+
+def write_screenshots(directory: Path, count: int) -> list:
+    """count screenshot-like PNGs (window chrome, text rows) in directory."""
+    import numpy as np
+    from PIL import Image, ImageDraw
+
+    rng = np.random.default_rng(0)
+    w, h = SCREENSHOT_SIZE
+    distinct = []
+    for i in range(min(count, DISTINCT_SCREENSHOTS)):
+        img = Image.new("RGB", SCREENSHOT_SIZE, (236, 236, 236))
+        draw = ImageDraw.Draw(img)
+        draw.rectangle((0, 0, w, 56), fill=(220, 220, 222))
+        draw.rectangle((40 + i * 20, 100, w - 40, h - 60), fill=(255, 255, 255))
+        for row in range(140, h - 100, 36):
+            length = int(rng.integers(200, w - 200))
+            draw.rectangle((80, row, 80 + length, row + 14), fill=(40, 40, 40))
+        path = directory / f"screenshot_{i:04d}.png"
+        img.save(path, compress_level=1)
+        distinct.append(path)
+    paths = list(distinct)
+    for i in range(len(distinct), count):
+        path = directory / f"screenshot_{i:04d}.png"
+        shutil.copyfile(distinct[i % len(distinct)], path)
+        paths.append(path)
+    return paths
+
+
+def synthetic_entries(count: int) -> dict:
+    """Generator state entries for count files spread over nested groups."""
+    entries = {}
+    for n in range(count):
+        group = f"Feature{n % 12}/Sub{n % 5}"
+        if n % 10 == 9:
+            rel, kind, phase = f"{group}/Data{n}.json", "text.json", "Resources"
+        else:
+            rel, kind, phase = f"{group}/File{n}.swift", "sourcecode.swift", "Sources"
+        entries[rel] = {"type": kind, "phase": phase, "mtime": 0, "size": 0, "sha1": ""}
+    return entries
+
+
+# -- cases ------------------------------------------------------------------------
+# Each setup(size, workdir) returns a callable that does the measured work once.
+
+def setup_icon(size: int, workdir: Path):
+    import icon_pipeline
+    master = synthetic_icon()
+    specs = [ICON_SPECS[i % len(ICON_SPECS)] for i in range(size)]
+
+    def work():
+        for i, spec in enumerate(specs):
+            images = icon_pipeline.pyramid(icon_pipeline.apply_spec(master, spec))
+            out = workdir / f"set{i}"
+            out.mkdir(exist_ok=True)
+            icon_pipeline.write_iconset(images, str(out))
+    return work
+
+
+def setup_screenshots(size: int, workdir: Path):
+    import prepare_appstore_assets
+    sources = sorted((workdir / "sources").glob("*.png"))[:size]
+    out = workdir / "out"
+    out.mkdir(exist_ok=True)
+
+    def work():
+        for src in sources:
+            prepare_appstore_assets.process_image(src, [(prepare_appstore_assets.TARGET_SIZE, out / src.name)])
+    return work
+
+
+def setup_og(size: int, workdir: Path):
+    import create_og_image
+    icon = PROJECT_ROOT / "docs" / "icon.png"
+    if not icon.exists():
+        icon = workdir / "icon.png"
+        synthetic_icon().save(icon)
+    create_og_image.docs_dir = str(workdir)
+    create_og_image.init_worker(str(icon))
+    cards = [{"output": f"og-{i}.png", "badge": f"Version 1.{i} · macOS 13+ · Free"} for i in range(size)]
+
+    def work():
+        for card in cards:
+            create_og_image.render_card(card)
+    return work
+
+
+def setup_pbxproj(size: int, workdir: Path):
+    import io
+    import fix_xcode_project
+    entries = synthetic_entries(size)
+
+    def work():
+        fix_xcode_project.build_project(entries).write(io.StringIO())
+    return work
+
+
+CASES = {
+    "icon": setup_icon,
+    "screenshots": setup_screenshots,
+    "og": setup_og,
+    "pbxproj": setup_pbxproj,
+}
+
+
+def run_case(job):
+    """Worker (fresh process): time one (case, size) repeats times; return (times, peak RSS)."""
+    name, size, workdir, repeats = job
+    sys.path[:0] = [str(SCRIPT_DIR), str(PROJECT_ROOT)]
+    work = CASES[name](size, Path(workdir))
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        work()
+        times.append(time.perf_counter() - start)
+    return times, peak_rss_mb()
+
+
+def in_fresh_process(fn, *args):
+    """Run fn(*args) in a new interpreter (spawn, so no memory is shared with this one)."""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(fn, *args).result()
+
+
+def measure(name: str, size: int, workdir: Path, repeats: int) -> dict:
+    times, rss = in_fresh_process(run_case, (name, size, str(workdir), repeats))
+    return {"p50": statistics.median(times), "times": times, "peak_rss_mb": rss}
+
+
+# -- comparison ---------------------------------------------------------------------
+
+def environment() -> dict:
+    versions = {}
+    for module in ("numpy", "PIL"):
+        try:
+            versions[module] = __import__(module).__version__
+        except ImportError:
+            versions[module] = None
+    return {"python": platform.python_version(), "platform": platform.platform(),
+            "machine": platform.machine(), "cpus": os.cpu_count(), **versions}
+
+
+def compare(results: dict, baseline: dict, time_threshold: float, rss_threshold: float) -> list:
+    """Lines describing every case that regressed against baseline."""
+    regressions = []
+    for case, current in results.items():
+        base = baseline.get(case)
+        if base is None:
+            continue
+        for key, threshold, unit in (("p50", time_threshold, "s"), ("peak_rss_mb", rss_threshold, " MB")):
+            limit = base[key] * (1 + threshold)
+            if key == "p50":
+                limit = max(limit, base[key] + MIN_TIME_DELTA)
+            if current[key] > limit:
+                regressions.append(f"{case}: {key} {current[key]:.3f}{unit} > {limit:.3f}{unit} "
+                                   f"(baseline {base[key]:.3f}{unit} + {threshold:.0%})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the asset scripts.")
+    parser.add_argument("--only", action="append", choices=sorted(CASES), help="run just this case (repeatable)")
+    parser.add_argument("--quick", action="store_true", help="skip the largest size of each case")
+    parser.add_argument("--repeat", type=int, default=REPEATS, help="runs per size; p50 is reported")
+    parser.add_argument("--save-baseline", action="store_true", help="store results as the new baseline")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--output", type=Path, default=RESULTS_PATH)
+    parser.add_argument("--time-threshold", type=float, default=TIME_THRESHOLD)
+    parser.add_argument("--rss-threshold", type=float, default=RSS_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    print("Asset benchmarks")
+    print("=" * 40)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for name in args.only or CASES:
+            sizes = SCALES[name][:-1] if args.quick and len(SCALES[name]) > 1 else SCALES[name]
+            if name == "screenshots":
+                (tmp / "sources").mkdir(exist_ok=True)
+                # Not in this process, so its peak stays out of later cases' figures
+                in_fresh_process(write_screenshots, tmp / "sources", max(sizes))
+            for size in sizes:
+                workdir = tmp / f"{name}-{size}"
+                workdir.mkdir()
+                if name == "screenshots":
+                    (workdir / "sources").symlink_to(tmp / "sources")
+                result = measure(name, size, workdir, args.repeat)
+                results[f"{name}/{size}"] = result
+                print(f"  {name:12} {size:>5}  p50 {result['p50'] * 1000:9.1f} ms "
+                      f"({result['p50'] * 1000 / size:7.2f} ms each)  peak RSS {result['peak_rss_mb']:6.1f} MB")
+                shutil.rmtree(workdir)
+
+    report = {"environment": environment(), "repeat": args.repeat, "results": results}
+    path = args.baseline if args.save_baseline else args.output
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+    print()
+    print(f"Results written to {path}")
+    if args.save_baseline:
+        return 0
+    if not args.baseline.exists():
+        print("No baseline yet; record one with --save-baseline")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    if baseline.get("environment") != report["environment"]:
+        print("Warning: baseline was recorded in a different environment")
+    regressions = compare(results, baseline.get("results", {}), args.time_threshold, args.rss_threshold)
+    if regressions:
+        for line in regressions:
+            print(f"  FAILED: {line}")
+        return 1
+    print(f"OK: no regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Build every release asset with one command.
+
+The asset scripts are steps with these inputs:
+
+    icon master   -> icons
+    docs/icon.png -> og-image
+    screenshots   -> appstore, web-screenshots
+    demo video    -> video (App Store preview, web video, hero GIF, poster)
+
+The steps are independent: none reads another's outputs (docs/icon.png,
+which the og-image uses, is kept by hand rather than exported from the icon
+set, and both screenshot sets are resized from screenshots/). So they all
+run concurrently, each as its own process with its output printed once it
+finishes, and a failed step does not stop the others. A step is skipped
+when its inputs (the files it reads, its scripts, their arguments and tool
+versions) hash to the same key it was last built with and every output it
+wrote then is still there and untouched; the keys and output lists live in
+scripts/.asset_graph.json, separate from the per-file cache the scripts
+keep themselves (see build_cache.py). A step whose inputs are missing (e.g.
+no demo video) is skipped without failing the build.
+
+--dry-run prints the plan instead: what would run, what is up to date, and
+the estimated cost from each step's last run time. It writes nothing.
+
+Usage:
+    python3 scripts/build_assets.py                  # everything
+    python3 scripts/build_assets.py og-image video   # just these steps
+    python3 scripts/build_assets.py --dry-run        # print the plan only
+    python3 scripts/build_assets.py --force          # run every step
+    python3 scripts/build_assets.py --jobs 2         # at most 2 steps at once
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from build_cache import BuildCache
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+GRAPH_CACHE_PATH = SCRIPT_DIR / ".asset_graph.json"
+ICON_SET = "WordJournal/Resources/Assets.xcassets/AppIcon.appiconset"
+
+# script: run from scripts/ with args; inputs/outputs: glob patterns under
+# the project root (a tuple means the first alternative that matches);
+# sources: scripts/ modules the step runs; estimate: seconds, used for
+# --dry-run until the step has run once
+STEPS = {
+    "icons": {
+        "script": "fix_icon_proper_size.py", "args": [],
+        # Only the unpadded master: the committed icon_1024.png is padded
+        # output, so without a master the step is skipped, not re-padded
+        "inputs": ["assets/AppIcon-master.png"],
+        "sources": ["icon_pipeline.py"],
+        "outputs": [f"{ICON_SET}/icon_*.png", f"{ICON_SET}/Contents.json"],
+        "tools": ["pillow"], "estimate": 2,
+    },
+    "og-image": {
+        "script": "create_og_image.py", "args": [],
+        "inputs": ["docs/icon.png"],
+        "sources": ["build_cache.py"],
+        "outputs": ["docs/og-image.png"],
+        "tools": ["pillow"], "estimate": 2,
+    },
+    "appstore": {
+        "script": "prepare_appstore_assets.py", "args": ["--no-preview"],
+        "inputs": ["screenshots/*.png", "docs/screenshots/*.png"],
+        "sources": ["build_cache.py"],
+        "outputs": ["AppStoreAssets/screenshots/screenshot-*.png"],
+        "tools": ["pillow"], "estimate": 10,
+    },
+    "web-screenshots": {
+        "script": "optimize_screenshots.py", "args": [],
+        "inputs": ["screenshots/*.png"],
+        "sources": ["prepare_appstore_assets.py"],
+        "outputs": ["screenshots/web-optimized/*.png"],
+        "tools": ["pillow"], "estimate": 5,
+    },
+    "video": {
+        "script": "media_job.py", "args": [],
+        "inputs": ["docs/demo_sped.mp4"],
+        "sources": ["create_web_gif.py"],
+        "outputs": ["AppStoreAssets/app-preview.mp4", "docs/demo-web.mp4",
+                    "screenshots/demo-hero.gif", "docs/demo-poster.png"],
+        "tools": ["ffmpeg"], "estimate": 60,
+    },
+}
+
+
+def resolve(patterns) -> list:
+    """Existing files matching patterns, in a stable order."""
+    found = []
+    for pattern in patterns:
+        for alternative in (pattern if isinstance(pattern, tuple) else (pattern,)):
+            matches = sorted(PROJECT_ROOT.glob(alternative))
+            if matches:
+                found += matches
+                break
+    return found
+
+
+def step_key(cache: BuildCache, name: str):
+    """Key of the step's current inputs, or None if it has none to build from."""
+    step = STEPS[name]
+    inputs = resolve(step["inputs"])
+    if not inputs:
+        return None
+    sources = [SCRIPT_DIR / step["script"]] + [SCRIPT_DIR / s for s in step["sources"]]
+    return cache.key(inputs + sources, {"step": name, "args": step["args"]}, step["tools"])
+
+
+def up_to_date(cache: BuildCache, name: str, key: str) -> bool:
+    """True if every output the step last wrote, and any now matching its patterns, is fresh for key."""
+    recorded = cache.data.get("step_outputs", {}).get(name)
+    if not recorded:
+        return False
+    outputs = {PROJECT_ROOT / rel for rel in recorded} | set(resolve(STEPS[name]["outputs"]))
+    return all(cache.fresh(out, key) for out in outputs)
+
+
+def record_outputs(cache: BuildCache, name: str, key: str) -> None:
+    """Remember the step's outputs with key, so a deleted one is noticed next time."""
+    outputs = resolve(STEPS[name]["outputs"])
+    for out in outputs:
+        cache.record(out, key)
+    cache.data.setdefault("step_outputs", {})[name] = [str(out.relative_to(PROJECT_ROOT)) for out in outputs]
+
+
+def estimate(cache: BuildCache, name: str) -> float:
+    return cache.data.get("timings", {}).get(name, STEPS[name]["estimate"])
+
+
+def plan(cache: BuildCache, order, force: bool) -> dict:
+    """{step: status} as of now: "run", "up to date" or "no input"."""
+    status = {}
+    for name in order:
+        key = step_key(cache, name)
+        if key is None:
+            status[name] = "no input"
+        elif force or not up_to_date(cache, name, key):
+            status[name] = "run"
+        else:
+            status[name] = "up to date"
+    return status
+
+
+def print_plan(cache: BuildCache, order, status: dict) -> None:
+    for name in order:
+        cost_text = f"~{estimate(cache, name):.0f}s" if status[name] == "run" else ""
+        print(f"  {name:16} {status[name]:11} {cost_text:>6}  {STEPS[name]['script']}")
+    costs = [estimate(cache, n) for n in order if status[n] == "run"]
+    print()
+    print(f"Estimated cost: ~{sum(costs):.0f}s of work, ~{max(costs, default=0):.0f}s wall clock "
+          f"with the steps in parallel")
+
+
+def run_step(name: str):
+    """Thread: run one step's script; return (exit status, output, seconds)."""
+    step = STEPS[name]
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, str(SCRIPT_DIR / step["script"]), *step["args"]],
+                            cwd=PROJECT_ROOT, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    return result.returncode, result.stdout, time.perf_counter() - start
+
+
+def build(cache: BuildCache, order, force: bool, jobs: int) -> dict:
+    """Run the steps that are not up to date concurrently; return {step: outcome}."""
+    outcome = {}
+    keys = {}
+    running = {}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for name in order:
+            key = step_key(cache, name)
+            if key is None:
+                outcome[name] = "no input"
+                print(f"  Skipped: {name} (no input files)")
+            elif not force and up_to_date(cache, name, key):
+                outcome[name] = "up to date"
+                print(f"  Up to date: {name}")
+            else:
+                keys[name] = key
+                running[pool.submit(run_step, name)] = name
+                print(f"  Started: {name}")
+        for future in as_completed(running):
+            name = running[future]
+            code, output, seconds = future.result()
+            print()
+            print(f"--- {name} ({STEPS[name]['script']}) ---")
+            # Keep only the final state of \r-updated progress lines
+            print("\n".join(line.rsplit("\r", 1)[-1] for line in output.rstrip().split("\n")))
+            if code == 0:
+                outcome[name] = "built"
+                record_outputs(cache, name, keys[name])
+                cache.data.setdefault("timings", {})[name] = round(seconds, 1)
+                cache.save()
+                print(f"OK: {name} ({seconds:.1f}s)")
+            else:
+                outcome[name] = "failed"
+                print(f"FAILED: {name} (exit status {code})")
+            print()
+    return outcome
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the release assets.")
+    parser.add_argument("steps", nargs="*", metavar="STEP", help=f"any of: {', '.join(STEPS)} (default: all)")
+    parser.add_argument("--dry-run", action="store_true", help="print the plan and estimated cost only")
+    parser.add_argument("--force", action="store_true", help="run steps even if they are up to date")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="steps to run at once")
+    args = parser.parse_args(argv)
+    unknown = [s for s in args.steps if s not in STEPS]
+    if unknown:
+        parser.error(f"unknown step(s): {', '.join(unknown)}")
+
+    cache = BuildCache(GRAPH_CACHE_PATH)
+    order = [name for name in STEPS if name in args.steps] if args.steps else list(STEPS)
+    print("Release assets" + (" (dry run)" if args.dry_run else ""))
+    print("=" * 40)
+    if args.dry_run:
+        print_plan(cache, order, plan(cache, order, args.force))
+        return 0
+
+    start = time.perf_counter()
+    outcome = build(cache, order, args.force, max(1, args.jobs))
+    cache.save()
+    failed = [name for name in order if outcome[name] == "failed"]
+    print("=" * 40)
+    print(f"{sum(o == 'built' for o in outcome.values())} built, "
+          f"{sum(o == 'up to date' for o in outcome.values())} up to date, "
+          f"{len(failed)} failed in {time.perf_counter() - start:.1f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
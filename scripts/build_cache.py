@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Content-hash build cache for generated marketing assets.
+
+Each output is recorded in scripts/.build_cache.json with the key it was
+built from: a hash of its input files' content, the generating parameters
+and the versions of the tools involved (Pillow, ffmpeg). A later run skips
+any output whose key is unchanged and whose file has not been touched since.
+
+Input hashes are themselves cached by (mtime, size), so checking a large
+video that has not changed costs a stat rather than a full read.
+
+Scripts may run concurrently (see build_assets.py), so save() merges with
+whatever another process wrote since the manifest was loaded.
+"""
+import hashlib
+import json
+import os
+import subprocess
+from pathlib import Path
+
+CACHE_PATH = Path(__file__).resolve().parent / ".build_cache.json"
+CACHE_VERSION = 1
+
+_tool_versions = {}
+
+
+def tool_version(name: str) -> str:
+    """Version string for a tool, or "none" if it is not available."""
+    if name not in _tool_versions:
+        if name == "pillow":
+            try:
+                import PIL
+                version = PIL.__version__
+            except ImportError:
+                version = "none"
+        else:
+            try:
+                out = subprocess.run([name, "-version"], capture_output=True, text=True, check=True).stdout
+                version = out.splitlines()[0] if out else "unknown"
+            except (subprocess.CalledProcessError, FileNotFoundError):
+                version = "none"
+        _tool_versions[name] = version
+    return _tool_versions[name]
+
+
+class BuildCache:
+    def __init__(self, path: Path = CACHE_PATH):
+        self.path = path
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        if data.get("version") != CACHE_VERSION:
+            data = {"version": CACHE_VERSION, "inputs": {}, "outputs": {}}
+        self.data = data
+
+    def file_hash(self, path) -> str:
+        path = Path(path).resolve()
+        st = path.stat()
+        cached = self.data["inputs"].get(str(path))
+        if cached and cached["mtime"] == st.st_mtime_ns and cached["size"] == st.st_size:
+            return cached["sha256"]
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        self.data["inputs"][str(path)] = {"mtime": st.st_mtime_ns, "size": st.st_size, "sha256": digest}
+        return digest
+
+    def key(self, inputs, params=None, tools=()) -> str:
+        """Key for an output built from the given input files, parameters and tools."""
+        parts = {
+            "inputs": [self.file_hash(p) for p in inputs],
+            "params": params,
+            "tools": {name: tool_version(name) for name in tools},
+        }
+        return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+    def fresh(self, output, key: str) -> bool:
+        """True if output exists, was built with key, and has not been modified since."""
+        entry = self.data["outputs"].get(str(Path(output).resolve()))
+        if not entry or entry["key"] != key:
+            return False
+        try:
+            st = os.stat(output)
+        except OSError:
+            return False
+        return entry["mtime"] == st.st_mtime_ns and entry["size"] == st.st_size
+
+    def record(self, output, key: str) -> None:
+        st = os.stat(output)
+        self.data["outputs"][str(Path(output).resolve())] = {"key": key, "mtime": st.st_mtime_ns, "size": st.st_size}
+
+    def save(self) -> None:
+        """Write the manifest, keeping entries other processes saved since it was loaded."""
+        try:
+            with open(self.path) as f:
+                on_disk = json.load(f)
+        except (OSError, ValueError):
+            on_disk = {}
+        if on_disk.get("version") == CACHE_VERSION:
+            for section in ("inputs", "outputs"):
+                self.data[section] = {**on_disk.get(section, {}), **self.data[section]}
+        tmp = self.path.with_suffix(f".tmp{os.getpid()}")
+        with open(tmp, "w") as f:
+            json.dump(self.data, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
@@ -1,7 +1,31 @@
 #!/usr/bin/env python3
-"""Create 1200×630 og-image.png for social sharing (WeChat, Twitter, etc.)"""
+"""Create 1200×630 og-image.png for social sharing (WeChat, Twitter, etc.)
+
+Renders a batch of cards from one template: by default the single
+docs/og-image.png card, or every card in a JSON list passed with --cards
+(per release, per feature, per localized tagline), e.g.
+
+    [{"output": "og-image-1.6.png", "badge": "Version 1.6 · macOS 13+ · Free"},
+     {"output": "og-image-de.png", "tagline": "Wörter sofort nachschlagen."}]
+
+Keys a card leaves out are taken from DEFAULT_CARD; outputs go to docs/.
+Cards render in parallel worker processes, each of which loads the icon and
+font faces once and caches rasterized text runs, so repeated badges and
+titles are drawn once per worker.
+
+Cards whose inputs (icon.png, this script, the card's own fields) are
+unchanged since the last build are skipped (see build_cache.py); pass
+--force to rebuild anyway, and --optimize to run the results through
+png_optimize.py.
+"""
 from PIL import Image, ImageDraw, ImageFont
+import json
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from build_cache import BuildCache
 
 W, H = 1200, 630
 BG = "#faf9f6"      # warm paper
@@ -9,46 +33,126 @@ ACCENT = "#2563eb"  # blue
 TEXT = "#1c1917"    # dark
 MUTED = "#57534e"   # gray
 
+TITLE_SIZE = 72
+TAG_SIZE = 36
+ICON_SIZE = 180
+
+# First face that exists wins: macOS, then common Linux fonts (for CI)
+FONT_CANDIDATES = [
+    "/System/Library/Fonts/Helvetica.ttc",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+]
+
+DEFAULT_CARD = {
+    "output": "og-image.png",
+    "title": "Word Journal",
+    "tagline": "Look up words instantly. Build your vocabulary.",
+    "badge": "macOS 13+ · Free",
+}
+
 script_dir = os.path.dirname(os.path.abspath(__file__))
 docs_dir = os.path.join(script_dir, "..", "docs")
 icon_path = os.path.join(docs_dir, "icon.png")
-out_path = os.path.join(docs_dir, "og-image.png")
-
-img = Image.new("RGB", (W, H), BG)
-draw = ImageDraw.Draw(img)
-
-# Load and place icon (centered left third)
-icon = Image.open(icon_path).convert("RGBA")
-icon_size = 180
-icon = icon.resize((icon_size, icon_size), Image.LANCZOS)
-icon_x = 120
-icon_y = (H - icon_size) // 2
-img.paste(icon, (icon_x, icon_y), icon)
-
-# Try system fonts, fallback to default
-try:
-    title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 72)
-    tag_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 36)
-except Exception:
-    title_font = ImageFont.load_default()
-    tag_font = ImageFont.load_default()
-
-# App name
-title = "Word Journal"
-title_x = icon_x + icon_size + 80
-title_y = H // 2 - 80
-draw.text((title_x, title_y), title, fill=TEXT, font=title_font)
-
-# Tagline
-tagline = "Look up words instantly. Build your vocabulary."
-tag_x = title_x
-tag_y = title_y + 90
-draw.text((tag_x, tag_y), tagline, fill=MUTED, font=tag_font)
-
-# macOS badge
-badge = "macOS 13+ · Free"
-badge_y = H - 80
-draw.text((title_x, badge_y), badge, fill=MUTED, font=tag_font)
-
-img.save(out_path, "PNG", optimize=True)
-print(f"Created {out_path} ({W}x{H})")
+
+# Per-worker state, filled in once by init_worker()
+_icon = None
+
+
+def init_worker(path: str) -> None:
+    """Load and scale the icon once per worker process."""
+    global _icon
+    icon = Image.open(path).convert("RGBA")
+    _icon = icon.resize((ICON_SIZE, ICON_SIZE), Image.LANCZOS)
+
+
+@lru_cache(maxsize=None)
+def font(size: int):
+    for path in FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(path, size)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:
+        # Pillow < 10.1 only has the fixed-size bitmap font
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=1024)
+def text_run(text: str, size: int) -> Image.Image:
+    """Rasterized coverage mask for text, positioned as draw.text((0, 0)) would place it."""
+    f = font(size)
+    _, _, right, bottom = f.getbbox(text)
+    mask = Image.new("L", (max(1, right), max(1, bottom)), 0)
+    ImageDraw.Draw(mask).text((0, 0), text, fill=255, font=f)
+    return mask
+
+
+def draw_text(img: Image.Image, xy, text: str, size: int, color: str) -> None:
+    img.paste(color, xy, text_run(text, size))
+
+
+def render_card(card: dict) -> str:
+    """Worker: render one card to docs/ and return its path."""
+    card = {**DEFAULT_CARD, **card}
+    img = Image.new("RGB", (W, H), BG)
+
+    # Place icon (centered left third)
+    icon_x = 120
+    icon_y = (H - ICON_SIZE) // 2
+    img.paste(_icon, (icon_x, icon_y), _icon)
+
+    # App name, tagline, and badge along the bottom
+    title_x = icon_x + ICON_SIZE + 80
+    title_y = H // 2 - 80
+    draw_text(img, (title_x, title_y), card["title"], TITLE_SIZE, TEXT)
+    draw_text(img, (title_x, title_y + 90), card["tagline"], TAG_SIZE, MUTED)
+    draw_text(img, (title_x, H - 80), card["badge"], TAG_SIZE, MUTED)
+
+    out_path = os.path.join(docs_dir, card["output"])
+    img.save(out_path, "PNG", optimize=True)
+    return out_path
+
+
+def load_cards(argv) -> list:
+    if "--cards" not in argv:
+        return [DEFAULT_CARD]
+    with open(argv[argv.index("--cards") + 1]) as f:
+        return json.load(f)
+
+
+def main():
+    argv = sys.argv[1:]
+    optimize = "--optimize" in argv
+    cards = [{**DEFAULT_CARD, **card} for card in load_cards(argv)]
+
+    # Layout lives in this file, so it is an input alongside the icon
+    cache = BuildCache()
+    keys = [cache.key([icon_path, __file__], {"card": card, "optimize": optimize}, ["pillow"]) for card in cards]
+    todo = [(card, key) for card, key in zip(cards, keys)
+            if "--force" in argv or not cache.fresh(os.path.join(docs_dir, card["output"]), key)]
+    for card in cards:
+        if all(card is not c for c, _ in todo):
+            print(f"Up to date: {os.path.join(docs_dir, card['output'])}")
+    if not todo:
+        return 0
+
+    workers = min(len(todo), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(icon_path,)) as pool:
+        paths = list(pool.map(render_card, [card for card, _ in todo], chunksize=max(1, len(todo) // (workers * 4))))
+    for path in paths:
+        print(f"Created {path} ({W}x{H})")
+
+    if optimize:
+        from png_optimize import optimize_files, report
+        report(optimize_files(paths))
+    for path, (_, key) in zip(paths, todo):
+        cache.record(path, key)
+    cache.save()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
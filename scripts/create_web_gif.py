@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Create the web hero GIF from the demo video.
+Replaces the palettegen/paletteuse pipeline in create_web_gif.sh.
+
+ffmpeg only decodes and scales: frames arrive over a pipe as PPM images and
+are never all held in memory. One global palette is built from a sample of
+frames by median cut, refined with a few k-means passes, and every frame is
+mapped through a 6-bit-per-channel lookup table with ordered dithering.
+Pixels that match the previous frame become transparent and each frame is
+cropped to the region that changed, so a mostly static UI demo costs little
+per frame. The GIF (with its own LZW encoder) is written as frames arrive.
+
+Usage:
+    python3 scripts/create_web_gif.py                   # first 8 seconds
+    python3 scripts/create_web_gif.py --seconds 4 --output screenshots/demo-short.gif
+"""
+import struct
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+VIDEO = PROJECT_ROOT / "docs" / "demo_sped.mp4"
+OUTPUT = PROJECT_ROOT / "screenshots" / "demo-hero.gif"
+
+FPS = 12
+WIDTH = 800
+SECONDS = 8
+# Palette entries including the transparent one; GIF tables are powers of two
+MAX_COLORS = 128
+SAMPLE_FPS = 1
+SAMPLE_PIXELS = 200_000
+KMEANS_PASSES = 3
+LUT_BITS = 6
+DITHER_STRENGTH = 6.0
+
+BAYER_4X4 = (np.array([[0, 8, 2, 10], [12, 4, 14, 6], [3, 11, 1, 9], [15, 7, 13, 5]]) / 16.0 - 0.5)
+
+
+def read_frames(video: Path, fps: float, seconds: float, width: int):
+    """Yield RGB frames (height, width, 3) decoded by ffmpeg, one at a time."""
+    cmd = [
+        "ffmpeg", "-v", "error", "-i", str(video), "-t", str(seconds),
+        "-vf", f"fps={fps},scale={width}:-2:flags=lanczos",
+        "-f", "image2pipe", "-vcodec", "ppm", "-",
+    ]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+    try:
+        while True:
+            header = read_ppm_header(proc.stdout)
+            if header is None:
+                break
+            w, h = header
+            data = proc.stdout.read(w * h * 3)
+            if len(data) < w * h * 3:
+                break
+            yield np.frombuffer(data, np.uint8).reshape(h, w, 3)
+    finally:
+        proc.stdout.close()
+        if proc.wait() != 0:
+            raise RuntimeError(f"ffmpeg exited with status {proc.returncode}")
+
+
+def read_ppm_header(stream):
+    """Parse "P6 <w> <h> <maxval>" and return (w, h), or None at end of stream."""
+    fields = []
+    token = b""
+    while len(fields) < 4:
+        c = stream.read(1)
+        if not c:
+            return None
+        if c.isspace():
+            if token:
+                fields.append(token)
+                token = b""
+        else:
+            token += c
+    if fields[0] != b"P6" or fields[3] != b"255":
+        raise ValueError(f"unexpected frame header: {fields}")
+    return int(fields[1]), int(fields[2])
+
+
+def median_cut(pixels: np.ndarray, colors: int) -> np.ndarray:
+    """Split the box with the widest channel range at its median until there are `colors` boxes."""
+    boxes = [pixels]
+    while len(boxes) < colors:
+        ranges = [np.ptp(b, axis=0).max() if len(b) > 1 else -1 for b in boxes]
+        i = int(np.argmax(ranges))
+        if ranges[i] <= 0:
+            break
+        box = boxes.pop(i)
+        channel = np.ptp(box, axis=0).argmax()
+        box = box[box[:, channel].argsort(kind="stable")]
+        mid = len(box) // 2
+        boxes += [box[:mid], box[mid:]]
+    return np.array([b.mean(axis=0) for b in boxes], np.float32)
+
+
+def nearest(points: np.ndarray, palette: np.ndarray, chunk: int = 65536) -> np.ndarray:
+    """Index of the nearest palette color for every point, in bounded-size chunks."""
+    out = np.empty(len(points), np.int32)
+    p2 = (palette ** 2).sum(axis=1)
+    for start in range(0, len(points), chunk):
+        block = points[start:start + chunk]
+        # |x - p|^2 without the |x|^2 term, which is the same for every p
+        out[start:start + chunk] = (p2 - 2 * block @ palette.T).argmin(axis=1)
+    return out
+
+
+def build_palette(samples: np.ndarray, colors: int) -> np.ndarray:
+    palette = median_cut(samples, colors)
+    for _ in range(KMEANS_PASSES):
+        labels = nearest(samples, palette)
+        counts = np.bincount(labels, minlength=len(palette))
+        sums = np.zeros_like(palette)
+        np.add.at(sums, labels, samples)
+        used = counts > 0
+        palette[used] = sums[used] / counts[used, None]
+    return palette
+
+
+def build_lut(palette: np.ndarray) -> np.ndarray:
+    """Nearest palette index for every LUT_BITS-per-channel color cube."""
+    levels = 1 << LUT_BITS
+    step = 256 / levels
+    axis = (np.arange(levels, dtype=np.float32) + 0.5) * step
+    grid = np.stack(np.meshgrid(axis, axis, axis, indexing="ij"), axis=-1).reshape(-1, 3)
+    return nearest(grid, palette).astype(np.uint8)
+
+
+def quantize(frame: np.ndarray, lut: np.ndarray) -> np.ndarray:
+    h, w, _ = frame.shape
+    shift = 8 - LUT_BITS
+    threshold = np.tile(BAYER_4X4, (h // 4 + 1, w // 4 + 1))[:h, :w, None] * DITHER_STRENGTH
+    q = np.clip(frame + threshold, 0, 255).astype(np.uint8) >> shift
+    q = q.astype(np.int32)
+    return lut[(q[..., 0] << (2 * LUT_BITS)) | (q[..., 1] << LUT_BITS) | q[..., 2]]
+
+
+def lzw_encode(indices: bytes, min_code_size: int) -> bytes:
+    """GIF-flavoured LZW (variable code width, clear code when the table is full)."""
+    clear = 1 << min_code_size
+    end = clear + 1
+    out = bytearray()
+    # Bits waiting to be flushed, least significant first; this loop runs per
+    # pixel, so it is kept inline rather than calling a helper per code
+    buffer = clear
+    count = code_size = min_code_size + 1
+    table = {}
+    next_code = end + 1
+    limit = 1 << code_size
+    prefix = indices[0]
+    for byte in indices[1:]:
+        key = (prefix << 8) | byte
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+        buffer |= prefix << count
+        count += code_size
+        if next_code < 4096:
+            table[key] = next_code
+            next_code += 1
+            if next_code > limit and code_size < 12:
+                code_size += 1
+                limit <<= 1
+        else:
+            buffer |= clear << count
+            count += code_size
+            table = {}
+            next_code = end + 1
+            code_size = min_code_size + 1
+            limit = 1 << code_size
+        if count >= 32:
+            out += (buffer & 0xFFFFFFFF).to_bytes(4, "little")
+            buffer >>= 32
+            count -= 32
+        prefix = byte
+    for code in (prefix, end):
+        buffer |= code << count
+        count += code_size
+    out += buffer.to_bytes((count + 7) // 8, "little")
+    return bytes(out)
+
+
+def sub_blocks(data: bytes) -> bytes:
+    return b"".join(bytes([len(data[i:i + 255])]) + data[i:i + 255] for i in range(0, len(data), 255)) + b"\x00"
+
+
+class GifWriter:
+    """Writes a looping GIF with a global palette one frame at a time."""
+
+    def __init__(self, path: Path, width: int, height: int, palette: np.ndarray, transparent: int, delay_cs: int):
+        self.f = open(path, "wb")
+        self.transparent = transparent
+        self.delay = delay_cs
+        bits = max(1, (len(palette) - 1).bit_length())
+        self.min_code_size = max(2, bits)
+        table = np.zeros((1 << bits, 3), np.uint8)
+        table[:len(palette)] = palette
+        self.f.write(b"GIF89a" + struct.pack("<HHBBB", width, height, 0x80 | 0x70 | (bits - 1), 0, 0))
+        self.f.write(table.tobytes())
+        # NETSCAPE2.0 application extension: loop forever
+        self.f.write(b"\x21\xFF\x0BNETSCAPE2.0\x03\x01\x00\x00\x00")
+
+    def add(self, indices: np.ndarray, left: int = 0, top: int = 0):
+        h, w = indices.shape
+        # Graphic control: disposal 1 (keep), transparency on
+        self.f.write(b"\x21\xF9\x04" + struct.pack("<BHB", (1 << 2) | 1, self.delay, self.transparent) + b"\x00")
+        self.f.write(b"\x2C" + struct.pack("<HHHHB", left, top, w, h, 0))
+        self.f.write(bytes([self.min_code_size]))
+        self.f.write(sub_blocks(lzw_encode(indices.tobytes(), self.min_code_size)))
+
+    def close(self):
+        self.f.write(b"\x3B")
+        self.f.close()
+
+
+def subsample(frames) -> np.ndarray:
+    """Up to SAMPLE_PIXELS pixels drawn (reproducibly) from the given frames."""
+    pixels = np.concatenate([f.reshape(-1, 3) for f in frames]).astype(np.float32)
+    rng = np.random.default_rng(0)
+    if len(pixels) > SAMPLE_PIXELS:
+        pixels = pixels[rng.choice(len(pixels), SAMPLE_PIXELS, replace=False)]
+    return pixels
+
+
+def make_palette(samples: np.ndarray):
+    """(palette with a trailing transparent entry, lookup table, transparent index)."""
+    palette = build_palette(samples, MAX_COLORS - 1)
+    transparent = len(palette)
+    lut = build_lut(palette)
+    palette = np.vstack([palette, [0, 0, 0]]).round().clip(0, 255).astype(np.uint8)
+    return palette, lut, transparent
+
+
+def write_gif(frames, output: Path, palette: np.ndarray, lut: np.ndarray, transparent: int) -> dict:
+    """Quantize, difference and write frames (any iterable of RGB arrays) as they arrive."""
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_suffix(".tmp.gif")
+    writer = None
+    previous = None
+    count = changed = 0
+    try:
+        for frame in frames:
+            indices = quantize(frame, lut)
+            if writer is None:
+                writer = GifWriter(tmp, frame.shape[1], frame.shape[0], palette, transparent, round(100 / FPS))
+                writer.add(indices)
+                changed += indices.size
+            else:
+                diff = indices != previous
+                rows = np.flatnonzero(diff.any(axis=1))
+                cols = np.flatnonzero(diff.any(axis=0))
+                if len(rows):
+                    y0, y1, x0, x1 = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+                    patch = np.where(diff[y0:y1, x0:x1], indices[y0:y1, x0:x1], transparent).astype(np.uint8)
+                    changed += int(diff.sum())
+                else:
+                    # Nothing moved: a 1x1 transparent frame keeps the timing
+                    y0 = x0 = 0
+                    patch = np.full((1, 1), transparent, np.uint8)
+                writer.add(patch, int(x0), int(y0))
+            previous = indices
+            count += 1
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        raise RuntimeError(f"no frames to write to {output}")
+    tmp.replace(output)
+    return {"frames": count, "changed": changed / (count * previous.size), "bytes": output.stat().st_size}
+
+
+def create_gif(video: Path, output: Path, seconds: float) -> dict:
+    palette, lut, transparent = make_palette(subsample(read_frames(video, SAMPLE_FPS, seconds, WIDTH)))
+    return write_gif(read_frames(video, FPS, seconds, WIDTH), output, palette, lut, transparent)
+
+
+def main():
+    args = sys.argv[1:]
+    seconds = float(args[args.index("--seconds") + 1]) if "--seconds" in args else SECONDS
+    output = Path(args[args.index("--output") + 1]) if "--output" in args else OUTPUT
+
+    if not VIDEO.exists():
+        print(f"Video not found: {VIDEO}")
+        return 1
+
+    print("Creating GIF from demo video...")
+    print(f"Input:  {VIDEO}")
+    print(f"Output: {output}")
+    print()
+    start = time.perf_counter()
+    try:
+        stats = create_gif(VIDEO, output, seconds)
+    except FileNotFoundError:
+        print("ffmpeg is required. Install with: brew install ffmpeg")
+        return 1
+    elapsed = time.perf_counter() - start
+    print(f"✓ Created {output}")
+    print(f"  {stats['frames']} frames, {stats['changed']:.1%} of pixels redrawn, "
+          f"{stats['bytes'] / 1024:.1f} KB in {elapsed:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
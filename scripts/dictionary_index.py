@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Compile WordJournal/Resources/dictionary.json into a binary lookup index.
+
+DictionaryService decodes the whole JSON word list at launch. The index is
+built to be memory-mapped instead: opening it reads a 40-byte header, and a
+lookup touches only the pages it needs, so startup cost does not grow with
+the number of entries.
+
+Layout (little-endian, every section 4-byte aligned):
+
+    header    magic "WJDI", version, entry count, string count, hash slots,
+              and the offset of each section below
+    offsets   u32 x (strings + 1): start of string i in the string data
+    strings   UTF-8 string data; repeated strings (up to INTERN_LIMIT
+              distinct ones) are stored once, so repeated parts of speech
+              and phonetics cost one u32 each
+    records   u32 x 6 per entry: string ids of key, word, phonetic,
+              partOfSpeech, definition, example (NONE if absent), sorted
+              by the UTF-8 bytes of the key for binary search
+    hash      u32 x slots (a power of two, at most half full): entry
+              index + 1 by FNV-1a of the key, linear probing, 0 = empty
+
+Keys are the lowercased word, as DictionaryService keys its table; when a
+word appears twice the later entry wins, as it does there.
+
+Usage:
+    python3 scripts/dictionary_index.py                       # dictionary.json -> dictionary.idx
+    python3 scripts/dictionary_index.py IN.json OUT.idx
+    python3 scripts/dictionary_index.py --lookup serendipity  # read one entry back
+    python3 scripts/dictionary_index.py --benchmark 100000    # JSON vs. index on N entries
+"""
+import json
+import mmap
+import os
+import random
+import shutil
+import struct
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DICTIONARY_JSON = PROJECT_ROOT / "WordJournal" / "Resources" / "dictionary.json"
+DICTIONARY_INDEX = DICTIONARY_JSON.with_suffix(".idx")
+
+MAGIC = b"WJDI"
+VERSION = 1
+# magic, version, reserved, entries, strings, hash slots, offsets/strings/records/hash offsets
+HEADER = struct.Struct("<4sHHIIIIIII")
+FIELDS = ["word", "phonetic", "partOfSpeech", "definition", "example"]
+RECORD_WIDTH = 1 + len(FIELDS)  # key + fields
+NONE = 0xFFFFFFFF
+# Distinct strings remembered for reuse while writing
+INTERN_LIMIT = 1 << 16
+
+BENCHMARK_SIZES = [1000, 10000, 100000]
+
+
+def fnv1a(data: bytes) -> int:
+    h = 0x811C9DC5
+    for byte in data:
+        h = ((h ^ byte) * 0x01000193) & 0xFFFFFFFF
+    return h
+
+
+def _align(f) -> int:
+    """Pad the file being written to a 4-byte boundary; return the position."""
+    f.write(b"\0" * (-f.tell() % 4))
+    return f.tell()
+
+
+def compile_index(entries, path) -> int:
+    """Write the index for an iterable of entry dicts to path (atomically); return the entry count."""
+    by_key = {}
+    for entry in entries:
+        by_key[entry["word"].lower()] = entry
+    return write_index((by_key[key] for key in sorted(by_key, key=lambda k: k.encode())), path)
+
+
+def write_index(entries, path) -> int:
+    """
+    Write the index for entries already in key order, one per key (as
+    dictionary_ingest merges them), streaming: strings, offsets and records
+    go to temporary files as entries arrive and the hash table is filled in
+    place, so memory does not grow with the entry count. Strings are stored
+    once each up to INTERN_LIMIT distinct values (parts of speech and other
+    repeats come early); later new strings are stored as they come.
+    """
+    ids = {}
+    string_count = 0
+    position = 0
+    count = 0
+    with tempfile.TemporaryFile() as offsets, tempfile.TemporaryFile() as strings, \
+            tempfile.TemporaryFile() as records, tempfile.TemporaryFile() as hashes:
+
+        def store(value):
+            nonlocal string_count, position
+            data = value.encode()
+            offsets.write(struct.pack("<I", position))
+            strings.write(data)
+            position += len(data)
+            string_count += 1
+            return string_count - 1
+
+        def intern(value):
+            if value is None:
+                return NONE
+            if value in ids:
+                return ids[value]
+            string_id = store(value)
+            if len(ids) < INTERN_LIMIT:
+                ids[value] = string_id
+            return string_id
+
+        for entry in entries:
+            key = entry["word"].lower()
+            key_id = intern(key)
+            word_id = key_id if entry["word"] == key else intern(entry["word"])
+            records.write(struct.pack(f"<{RECORD_WIDTH}I", key_id, word_id,
+                                      *(intern(entry.get(field)) for field in FIELDS[1:])))
+            hashes.write(struct.pack("<I", fnv1a(key.encode())))
+            count += 1
+        offsets.write(struct.pack("<I", position))
+
+        slots = 1
+        while slots < 2 * count:
+            slots *= 2
+
+        path = Path(path)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w+b") as out:
+            out.write(b"\0" * HEADER.size)
+            sections = []
+            for section in (offsets, strings, records):
+                sections.append(_align(out))
+                section.seek(0)
+                shutil.copyfileobj(section, out)
+            hash_at = _align(out)
+            out.truncate(hash_at + 4 * slots)
+            with mmap.mmap(out.fileno(), 0) as mm:
+                HEADER.pack_into(mm, 0, MAGIC, VERSION, 0, count, string_count, slots, *sections, hash_at)
+                hashes.seek(0)
+                index = 0
+                for chunk in iter(lambda: hashes.read(1 << 16), b""):
+                    for (h,) in struct.iter_unpack("<I", chunk):
+                        slot = h & (slots - 1)
+                        while struct.unpack_from("<I", mm, hash_at + 4 * slot)[0]:
+                            slot = (slot + 1) & (slots - 1)
+                        index += 1
+                        struct.pack_into("<I", mm, hash_at + 4 * slot, index)
+        os.replace(tmp, path)
+    return count
+
+
+class DictionaryIndex:
+    """Read-only view of a compiled index; lookups decode only the entry they return."""
+
+    def __init__(self, path):
+        if sys.byteorder != "little":
+            raise RuntimeError("the index is little-endian and read in place")
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, count, string_count, slots, offsets_at, strings_at, records_at, hash_at = \
+            HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"{path} is not a version {VERSION} dictionary index")
+        view = memoryview(self._mm)
+        self._count = count
+        self._slots = slots
+        self._offsets = view[offsets_at:offsets_at + 4 * (string_count + 1)].cast("I")
+        self._strings = view[strings_at:strings_at + self._offsets[string_count]]
+        self._records = view[records_at:records_at + 4 * RECORD_WIDTH * count].cast("I")
+        self._hash = view[hash_at:hash_at + 4 * slots].cast("I")
+        self._views = [view, self._offsets, self._strings, self._records, self._hash]
+
+    def close(self) -> None:
+        for view in reversed(self._views):
+            view.release()
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _bytes(self, string_id: int):
+        return self._strings[self._offsets[string_id]:self._offsets[string_id + 1]]
+
+    def _key(self, index: int):
+        return self._bytes(self._records[index * RECORD_WIDTH])
+
+    def entry(self, index: int) -> dict:
+        """The entry at index in key order, in the JSON shape."""
+        base = index * RECORD_WIDTH + 1
+        result = {}
+        for n, field in enumerate(FIELDS):
+            string_id = self._records[base + n]
+            result[field] = None if string_id == NONE else str(self._bytes(string_id), "utf-8")
+        return result
+
+    def index_of(self, word: str):
+        """Entry index for word via the hash table (O(1) expected), or None."""
+        key = word.lower().encode()
+        mask = self._slots - 1
+        slot = fnv1a(key) & mask
+        while True:
+            index = self._hash[slot]
+            if not index:
+                return None
+            if self._key(index - 1) == key:
+                return index - 1
+            slot = (slot + 1) & mask
+
+    def search(self, word: str):
+        """Entry index for word by binary search over the sorted keys (O(log n)), or None."""
+        key = word.lower().encode()
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid).tobytes() < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self._key(lo) == key:
+            return lo
+        return None
+
+    def get(self, word: str):
+        index = self.index_of(word)
+        return None if index is None else self.entry(index)
+
+    def __contains__(self, word: str) -> bool:
+        return self.index_of(word) is not None
+
+    def words(self):
+        """Keys in sorted order."""
+        for index in range(self._count):
+            yield str(self._key(index), "utf-8")
+
+
+# -- benchmark ---------------------------------------------------------------
+
+def synthetic_entries(count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    parts = ["noun", "verb", "adjective", "adverb"]
+    vocabulary = ["".join(rng.choices(letters, k=rng.randint(3, 9))) for _ in range(2000)]
+    entries = []
+    seen = set()
+    while len(entries) < count:
+        word = "".join(rng.choices(letters, k=rng.randint(4, 12)))
+        if word in seen:
+            continue
+        seen.add(word)
+        entries.append({
+            "word": word,
+            "phonetic": f"/{word[::-1]}/" if rng.random() < 0.7 else None,
+            "partOfSpeech": rng.choice(parts),
+            "definition": " ".join(rng.choices(vocabulary, k=rng.randint(6, 16))),
+            "example": " ".join(rng.choices(vocabulary, k=rng.randint(5, 12))) if rng.random() < 0.5 else None,
+        })
+    return entries
+
+
+def per_lookup_ns(fn, words) -> float:
+    start = time.perf_counter()
+    for word in words:
+        fn(word)
+    return (time.perf_counter() - start) * 1e9 / len(words)
+
+
+def benchmark(sizes) -> None:
+    print(f"{'entries':>8} {'json':>9} {'index':>9} {'json load':>10} {'index open':>11} "
+          f"{'hash':>9} {'bisect':>9} {'miss':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in sizes:
+            entries = synthetic_entries(count)
+            json_path = Path(tmp) / "dictionary.json"
+            index_path = Path(tmp) / "dictionary.idx"
+            json_path.write_text(json.dumps(entries, ensure_ascii=False, indent=2))
+            compile_index(entries, index_path)
+
+            # What DictionaryService does at launch: decode everything, key by lowercased word
+            start = time.perf_counter()
+            table = {e["word"].lower(): e for e in json.loads(json_path.read_text())}
+            json_load = time.perf_counter() - start
+            start = time.perf_counter()
+            index = DictionaryIndex(index_path)
+            index_open = time.perf_counter() - start
+
+            rng = random.Random(1)
+            present = rng.sample(list(table), min(len(table), 20000))
+            missing = [w + "qx" for w in present]
+            assert all(index.get(w) == table[w] for w in present[:1000])
+            assert all(index.search(w) == index.index_of(w) for w in present[:1000])
+            hash_ns = per_lookup_ns(index.index_of, present)
+            bisect_ns = per_lookup_ns(index.search, present)
+            miss_ns = per_lookup_ns(index.index_of, missing)
+            index.close()
+            print(f"{count:>8} {json_path.stat().st_size / 1e6:>7.2f}MB {index_path.stat().st_size / 1e6:>7.2f}MB "
+                  f"{json_load * 1000:>8.1f}ms {index_open * 1e6:>9.1f}us "
+                  f"{hash_ns / 1000:>7.2f}us {bisect_ns / 1000:>7.2f}us {miss_ns / 1000:>7.2f}us")
+    print("hash/bisect/miss: mean time per lookup of a present (or absent) word")
+
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+    if "--benchmark" in args:
+        rest = args[args.index("--benchmark") + 1:]
+        benchmark([int(rest[0])] if rest else BENCHMARK_SIZES)
+        return 0
+    if "--lookup" in args:
+        word = args[args.index("--lookup") + 1]
+        with DictionaryIndex(DICTIONARY_INDEX) as index:
+            entry = index.get(word)
+        if entry is None:
+            print(f"Not found: {word}")
+            return 1
+        print(json.dumps(entry, ensure_ascii=False, indent=2))
+        return 0
+
+    paths = [a for a in args if not a.startswith("--")]
+    source = Path(paths[0]) if paths else DICTIONARY_JSON
+    target = Path(paths[1]) if len(paths) > 1 else source.with_suffix(".idx")
+    with open(source, encoding="utf-8") as f:
+        entries = json.load(f)
+    count = compile_index(entries, target)
+    print(f"OK: {target} ({count} entries, {target.stat().st_size} bytes; "
+          f"{source.name} is {source.stat().st_size} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
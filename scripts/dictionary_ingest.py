@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Build dictionary.json (and optionally the compiled index) from large word lists.
+
+Sources are uncompressed JSON Lines files, one headword per line, in either
+of two shapes:
+- Wiktionary REST, as fetchFromWiktionary reads it, plus the headword:
+  {"word": "...", "en": [{"partOfSpeech": "...", "definitions":
+  [{"definition": "<html>", "examples": ["..."]}]}]}
+- wiktextract (kaikki.org) dumps:
+  {"word": "...", "lang_code": "en", "pos": "...", "sounds": [{"ipa": "..."}],
+  "senses": [{"glosses": ["..."], "examples": [{"text": "..."}]}]}
+
+Each source is split into byte-range shards at line boundaries, and shards
+are parsed on a process pool. A worker normalizes headwords the way
+DictionaryService.cleanHeadword does, strips HTML the way
+fetchFromWiktionary does, merges the shard's duplicate headwords, and
+writes them sorted to a run file. The runs are then merged streaming
+(heapq.merge), so memory depends on the shard size, not on the size of
+the source.
+
+Duplicate headwords are merged: the first phonetic wins, and senses are
+kept in source order with repeats dropped. The first sense fills the
+fields the app reads (partOfSpeech, definition, example). When there are
+more, all of them are also listed under "senses", which the app's
+decoder ignores.
+
+Usage:
+    python3 scripts/dictionary_ingest.py enwiktionary.jsonl
+    python3 scripts/dictionary_ingest.py dump.jsonl --base WordJournal/Resources/dictionary.json
+    python3 scripts/dictionary_ingest.py dump.jsonl --index             # also dictionary.idx
+    python3 scripts/dictionary_ingest.py dump.jsonl --no-json --index out.idx --workers 8
+
+--base adds a JSON array of existing entries (e.g. the curated sample)
+ahead of the sources, so its definitions come first; it is read whole.
+"""
+import argparse
+import heapq
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+from pathlib import Path
+
+from dictionary_index import DICTIONARY_INDEX, DICTIONARY_JSON, write_index
+
+SHARD_BYTES = 64 << 20
+
+# DictionaryService.cleanHeadword
+POS_LABELS = ["noun", "verb", "adjective", "adverb", "pronoun", "preposition",
+              "conjunction", "interjection", "exclamation", "determiner", "article",
+              "abbreviation", "prefix", "suffix", "combining form", "modal verb",
+              "auxiliary verb", "linking verb", "phrasal verb"]
+_BRACKETED = re.compile(r"\[.*?\]")
+_TRAILING_POS = re.compile(r"\s+(" + "|".join(sorted(POS_LABELS, key=len, reverse=True)) + r")\s*$",
+                           re.IGNORECASE)
+_HOMONYM = re.compile(r"\s+\d+$")
+_TAG = re.compile(r"<[^>]+>")
+
+
+def clean_headword(raw: str) -> str:
+    """Strip [annotations], a trailing part-of-speech label and a trailing homonym number."""
+    cleaned = _BRACKETED.sub("", raw).strip()
+    cleaned = _TRAILING_POS.sub("", cleaned)
+    cleaned = _HOMONYM.sub("", cleaned)
+    return cleaned.strip()
+
+
+def strip_html(text: str) -> str:
+    return _TAG.sub("", text).strip()
+
+
+def parse_record(record: dict):
+    """(word, phonetic, [[pos, definition, example]]) for one source line, or None."""
+    word = clean_headword(record.get("word") or "")
+    if not word:
+        return None
+    senses = []
+    if "senses" in record:
+        if record.get("lang_code", "en") != "en":
+            return None
+        pos = record.get("pos") or ""
+        for sense in record["senses"]:
+            glosses = sense.get("glosses") or []
+            if glosses:
+                examples = [e.get("text") for e in sense.get("examples") or [] if e.get("text")]
+                senses.append([pos, strip_html(glosses[-1]), strip_html(examples[0]) if examples else None])
+        phonetic = next((s["ipa"] for s in record.get("sounds") or [] if s.get("ipa")), None)
+    else:
+        for entry in record.get("en") or []:
+            for definition in entry.get("definitions") or []:
+                text = strip_html(definition.get("definition") or "")
+                if text:
+                    examples = definition.get("examples") or []
+                    senses.append([entry.get("partOfSpeech") or "", text,
+                                   strip_html(examples[0]) if examples else None])
+        phonetic = record.get("phonetic")
+    if not senses:
+        return None
+    return word, phonetic, senses
+
+
+def merge_into(merged: list, word: str, phonetic, senses: list) -> None:
+    """Fold one occurrence of a headword into merged = [word, phonetic, senses]."""
+    if merged[1] is None:
+        merged[1] = phonetic
+    seen = {(pos.lower(), definition.lower()) for pos, definition, _ in merged[2]}
+    for sense in senses:
+        key = (sense[0].lower(), sense[1].lower())
+        if key not in seen:
+            seen.add(key)
+            merged[2].append(sense)
+
+
+def write_run(entries: dict, path: Path) -> None:
+    """One [key, word, phonetic, senses] JSON line per headword, sorted by key."""
+    with open(path, "w", encoding="utf-8") as f:
+        for key in sorted(entries):
+            f.write(json.dumps([key, *entries[key]], ensure_ascii=False) + "\n")
+
+
+def parse_shard(job):
+    """Worker: parse the lines that start in [start, end) of path into a sorted run file."""
+    path, start, end, run_path = job
+    entries = {}
+    lines = bad = 0
+    with open(path, "rb") as f:
+        if start:
+            # A line that straddles start belongs to the previous shard
+            f.seek(start - 1)
+            if f.read(1) != b"\n":
+                f.readline()
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            if not line.strip():
+                continue
+            lines += 1
+            try:
+                parsed = parse_record(json.loads(line))
+            except (ValueError, TypeError, AttributeError, KeyError):
+                bad += 1
+                continue
+            if parsed is None:
+                continue
+            word, phonetic, senses = parsed
+            key = word.lower()
+            if key in entries:
+                merge_into(entries[key], word, phonetic, senses)
+            else:
+                entries[key] = [word, phonetic, senses]
+    write_run(entries, run_path)
+    return lines, bad, len(entries)
+
+
+def shard_jobs(paths, shard_bytes: int, run_dir: Path) -> list:
+    jobs = []
+    for path in paths:
+        size = os.path.getsize(path)
+        for start in range(0, max(size, 1), shard_bytes):
+            jobs.append((str(path), start, min(size, start + shard_bytes), run_dir / f"run{len(jobs):05d}.jsonl"))
+    return jobs
+
+
+def base_run(path: Path, run_path: Path) -> None:
+    """Run file for a dictionary.json-shaped array, so its entries merge like any source."""
+    with open(path, encoding="utf-8") as f:
+        entries = {}
+        for item in json.load(f):
+            senses = item.get("senses") or [
+                {"partOfSpeech": item["partOfSpeech"], "definition": item["definition"], "example": item.get("example")}]
+            senses = [[s["partOfSpeech"], s["definition"], s.get("example")] for s in senses]
+            key = item["word"].lower()
+            if key in entries:
+                merge_into(entries[key], item["word"], item.get("phonetic"), senses)
+            else:
+                entries[key] = [item["word"], item.get("phonetic"), senses]
+    write_run(entries, run_path)
+
+
+def read_run(path: Path):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def merged_entries(run_paths):
+    """Entry dicts in key order, merging each headword across all runs (earlier runs first)."""
+    for key, group in groupby(heapq.merge(*map(read_run, run_paths), key=lambda r: r[0]), key=lambda r: r[0]):
+        _, word, phonetic, senses = next(group)
+        merged = [word, phonetic, list(senses)]
+        for _, word, phonetic, senses in group:
+            merge_into(merged, word, phonetic, senses)
+        word, phonetic, senses = merged
+        pos, definition, example = senses[0]
+        entry = {"word": word, "phonetic": phonetic, "partOfSpeech": pos, "definition": definition,
+                 "example": example}
+        if len(senses) > 1:
+            entry["senses"] = [{"partOfSpeech": p, "definition": d, "example": e} for p, d, e in senses]
+        yield entry
+
+
+def write_json(entries, path: Path):
+    """Stream entries to path as an indented JSON array, yielding each one on."""
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write("[")
+        for n, entry in enumerate(entries):
+            body = json.dumps(entry, ensure_ascii=False, indent=2).replace("\n", "\n  ")
+            f.write(("," if n else "") + "\n  " + body)
+            yield entry
+        f.write("\n]\n")
+    os.replace(tmp, path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build dictionary.json from large JSON Lines word lists.")
+    parser.add_argument("sources", nargs="+", type=Path, help="JSON Lines files (Wiktionary REST or wiktextract)")
+    parser.add_argument("--base", type=Path, help="existing dictionary.json entries to put first")
+    parser.add_argument("--json", type=Path, default=DICTIONARY_JSON, help="output dictionary.json")
+    parser.add_argument("--no-json", action="store_true", help="do not write dictionary.json")
+    parser.add_argument("--index", type=Path, nargs="?", const=DICTIONARY_INDEX,
+                        help="also compile the binary index (default path: next to dictionary.json)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--shard-mb", type=int, default=SHARD_BYTES >> 20, help="source bytes per worker task")
+    args = parser.parse_args(argv)
+    if args.no_json and not args.index:
+        parser.error("nothing to write: --no-json without --index")
+
+    print("Dictionary ingest")
+    print("=" * 40)
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmp:
+        run_dir = Path(tmp)
+        runs = []
+        if args.base:
+            runs.append(run_dir / "base.jsonl")
+            base_run(args.base, runs[0])
+        jobs = shard_jobs(args.sources, args.shard_mb << 20, run_dir)
+        lines = bad = 0
+        with ProcessPoolExecutor(max_workers=max(1, args.workers)) as pool:
+            for (path, shard_start, _, _), (n, errors, headwords) in zip(jobs, pool.map(parse_shard, jobs)):
+                lines += n
+                bad += errors
+                print(f"  {Path(path).name} @ {shard_start >> 20} MB: {n} lines, {headwords} headwords"
+                      + (f", {errors} unparseable" if errors else ""))
+        runs += [run_path for *_, run_path in jobs]
+        parsed = time.perf_counter() - start
+
+        entries = merged_entries(runs)
+        if not args.no_json:
+            entries = write_json(entries, args.json)
+        if args.index:
+            count = write_index(entries, args.index)
+        else:
+            count = sum(1 for _ in entries)
+
+    print()
+    print(f"{lines} lines in {len(jobs)} shard(s) parsed in {parsed:.1f}s; "
+          f"{count} headwords after merging ({time.perf_counter() - start:.1f}s total)")
+    if bad:
+        print(f"Skipped {bad} unparseable line(s)")
+    if not args.no_json:
+        print(f"OK: {args.json}")
+    if args.index:
+        print(f"OK: {args.index}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,46 +4,27 @@ Fix macOS app icon to proper dock size per Apple HIG.
 - Scales artwork to ~80% of canvas (Apple grid: 824/1024)
 - Uses the icon's own blue border color as full-canvas background
 - macOS clips to squircle automatically, giving visible rounded corners
-"""
-import os
-from PIL import Image, ImageDraw
-import numpy as np
 
-ICON_DIR = os.path.join(os.path.dirname(__file__), "..", "WordJournal", "Resources", "Assets.xcassets", "AppIcon.appiconset")
+Renders from the preserved master, so running it twice changes nothing.
+"""
+import sys
 
 SAFE_RATIO = 0.80
-BG_COLOR = (91, 129, 168, 255)
-
-SIZES = [16, 32, 64, 128, 256, 512, 1024]
-
-
-def fix_icon(path: str, size: int) -> None:
-    img = Image.open(path).convert("RGBA")
-    arr = np.array(img)
-
-    art_size = int(size * SAFE_RATIO)
-
-    art = img.resize((art_size, art_size), Image.LANCZOS)
-
-    canvas = Image.new("RGBA", (size, size), BG_COLOR)
-
-    x = (size - art_size) // 2
-    y = (size - art_size) // 2
-    canvas.paste(art, (x, y), art)
+# Sampled from the artwork's edge; was hard-coded as (91, 129, 168, 255)
+BG_COLOR = "auto"
 
-    canvas.save(path)
+SPEC = {"safe_ratio": SAFE_RATIO, "background": BG_COLOR, "padding": 0}
 
 
 def main():
-    for s in SIZES:
-        fname = f"icon_{s}.png"
-        path = os.path.join(ICON_DIR, fname)
-        if os.path.exists(path):
-            fix_icon(path, s)
-            print(f"Fixed {fname}")
-        else:
-            print(f"Skip {fname} (not found)")
+    try:
+        from icon_pipeline import run
+    except ImportError as e:
+        # icon_pipeline composites with NumPy
+        print(f"FAILED: icon_pipeline.py needs {e.name}. Install: pip install {e.name}")
+        return 1
+    return run(SPEC, "Fixed")
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
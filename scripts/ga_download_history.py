@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+GA4 download history: daily download_click counts per released version.
+
+Pulls daily download_click counts for a date range (default: from the first
+release in docs/appcast.xml to today) and joins them against the releases
+in the appcast (pubDate, shortVersionString). Each day's downloads count
+toward the newest version released on or before that day, which gives one
+adoption curve per version: downloads per day from its release until the
+next one, and cumulative downloads after 1, 7, 30 and 90 days. Versions
+published on the same day share one curve (e.g. "1.1/1.2"). A version
+released before --start is only partly covered, so its cumulative columns
+are left blank rather than counted from --start.
+
+Daily counts are cached in scripts/ga_history.sqlite3. Only days missing
+from the cache are requested, grouped into contiguous date ranges and
+paged through with limit/offset, so re-running a full-history report costs
+at most the last couple of days. Days younger than FINAL_AFTER_DAYS are
+still being processed by GA and are refetched until they are final.
+
+Uses the same client and transport settings as ga_realtime_report.py
+(GA4_PROPERTY_ID, GA4_TRANSPORT, GA4_API_ENDPOINT).
+
+Usage:
+    python3 scripts/ga_download_history.py
+    python3 scripts/ga_download_history.py --start 2026-02-01 --end 2026-03-31
+    python3 scripts/ga_download_history.py --refresh     # drop cached days first
+"""
+import sqlite3
+import sys
+import xml.etree.ElementTree as ET
+from datetime import date, datetime, timedelta
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+import ga_realtime_report as ga
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+APPCAST = SCRIPT_DIR.parent / "docs" / "appcast.xml"
+DB_PATH = SCRIPT_DIR / "ga_history.sqlite3"
+SPARKLE_NS = "{http://www.andymatuschak.org/xml-namespaces/sparkle}"
+
+EVENT = ga.DOWNLOAD_EVENT
+PAGE_SIZE = 10000
+FINAL_AFTER_DAYS = 2
+CURVE_DAYS = [1, 7, 30, 90]
+
+
+def load_releases(path: Path = APPCAST) -> list:
+    """[(release day, version)] from the appcast, oldest first; same-day releases are joined as "a/b"."""
+    releases = []
+    for item in ET.parse(path).getroot().iter("item"):
+        pub_date = item.findtext("pubDate")
+        version = item.findtext(f"{SPARKLE_NS}shortVersionString") or item.findtext("title")
+        if pub_date and version:
+            releases.append((parsedate_to_datetime(pub_date), version))
+    by_day = {}
+    for published, version in sorted(releases):
+        by_day.setdefault(published.date(), []).append(version)
+    return [(day, "/".join(versions)) for day, versions in by_day.items()]
+
+
+class DayCache:
+    """Daily event counts in SQLite; a day is stored as final or provisional."""
+
+    def __init__(self, path):
+        self.db = sqlite3.connect(path)
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS daily_events (
+                day TEXT NOT NULL,
+                event TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                final INTEGER NOT NULL,
+                PRIMARY KEY (day, event)
+            )
+        """)
+
+    def counts(self, event: str, start: date, end: date) -> dict:
+        rows = self.db.execute("SELECT day, count FROM daily_events WHERE event = ? AND day BETWEEN ? AND ?",
+                               (event, start.isoformat(), end.isoformat()))
+        return {date.fromisoformat(day): count for day, count in rows}
+
+    def final_days(self, event: str, start: date, end: date) -> set:
+        rows = self.db.execute("SELECT day FROM daily_events WHERE event = ? AND final AND day BETWEEN ? AND ?",
+                               (event, start.isoformat(), end.isoformat()))
+        return {date.fromisoformat(day) for day, in rows}
+
+    def store(self, event: str, counts: dict, final_before: date) -> None:
+        with self.db:
+            self.db.executemany("INSERT OR REPLACE INTO daily_events VALUES (?, ?, ?, ?)",
+                                [(day.isoformat(), event, count, day < final_before)
+                                 for day, count in counts.items()])
+
+    def clear(self, event: str) -> None:
+        with self.db:
+            self.db.execute("DELETE FROM daily_events WHERE event = ?", (event,))
+
+    def close(self) -> None:
+        self.db.close()
+
+
+def missing_ranges(start: date, end: date, have: set) -> list:
+    """Contiguous (first, last) runs of days in [start, end] that are not in have."""
+    ranges = []
+    day = start
+    while day <= end:
+        if day in have:
+            day += timedelta(days=1)
+            continue
+        first = day
+        while day <= end and day not in have:
+            day += timedelta(days=1)
+        ranges.append((first, day - timedelta(days=1)))
+    return ranges
+
+
+def fetch_daily(day_range, client=None) -> dict:
+    """{day: count} of EVENT for every day in the (first, last) range, paging through the report."""
+    from google.analytics.data_v1beta.types import (
+        DateRange, Dimension, Filter, FilterExpression, Metric, RunReportRequest)
+
+    client = client or ga.get_client()
+    first, last = day_range
+    counts = {first + timedelta(days=n): 0 for n in range((last - first).days + 1)}
+    offset = 0
+    while True:
+        response = client.run_report(RunReportRequest(
+            property=f"properties/{ga.PROPERTY_ID}",
+            date_ranges=[DateRange(start_date=first.isoformat(), end_date=last.isoformat())],
+            dimensions=[Dimension(name="date")],
+            metrics=[Metric(name="eventCount")],
+            dimension_filter=FilterExpression(filter=Filter(
+                field_name="eventName", string_filter=Filter.StringFilter(value=EVENT))),
+            limit=PAGE_SIZE,
+            offset=offset,
+        ))
+        for row in response.rows:
+            day = datetime.strptime(row.dimension_values[0].value, "%Y%m%d").date()
+            counts[day] = int(row.metric_values[0].value)
+        offset += len(response.rows)
+        if not response.rows or offset >= response.row_count:
+            return counts
+
+
+def daily_downloads(start: date, end: date, cache: DayCache, today: date = None) -> dict:
+    """{day: downloads} for [start, end], requesting only the days the cache cannot answer."""
+    today = today or date.today()
+    ranges = missing_ranges(start, end, cache.final_days(EVENT, start, end))
+    if ranges:
+        print(f"Fetching {sum((b - a).days + 1 for a, b in ranges)} day(s) in {len(ranges)} range(s)...")
+        for day_range in ranges:
+            cache.store(EVENT, fetch_daily(day_range), today - timedelta(days=FINAL_AFTER_DAYS))
+    return cache.counts(EVENT, start, end)
+
+
+def adoption_curves(releases: list, downloads: dict, start: date) -> list:
+    """
+    Per release: (version, released, {days since release: downloads that
+    day} until the next release, partial), where partial means the release
+    predates start, so its first days are missing from downloads.
+    """
+    curves = []
+    for i, (released, version) in enumerate(releases):
+        until = releases[i + 1][0] if i + 1 < len(releases) else max(downloads, default=released) + timedelta(days=1)
+        days = {(day - released).days: count for day, count in downloads.items() if released <= day < until}
+        curves.append((version, released, days, released < start))
+    return curves
+
+
+def print_curves(curves: list) -> None:
+    marks = "".join(f"{f'day {n}':>9}" for n in CURVE_DAYS)
+    print(f"\n{'Version':8} {'Released':10} {'Days':>5} {'Downloads':>10} {'Per day':>8}{marks}")
+    for version, released, days, partial in curves:
+        total = sum(days.values())
+        per_day = total / len(days) if days else 0.0
+        cumulative = []
+        for n in CURVE_DAYS:
+            # Only show a point once the version has been live that long, counted from its release
+            shown = not partial and len(days) >= n
+            cumulative.append(f"{sum(c for d, c in days.items() if d < n):>9}" if shown else f"{'':>9}")
+        label = version + ("*" if partial else "")
+        print(f"{label:8} {released.isoformat():10} {len(days):>5} {total:>10} {per_day:>8.1f}{''.join(cumulative)}")
+    if any(partial for *_, partial in curves):
+        print("\n* released before the start of the range; only the days in range are counted")
+    print()
+
+
+def parse_day(args, flag, default):
+    return date.fromisoformat(args[args.index(flag) + 1]) if flag in args else default
+
+
+def main():
+    args = sys.argv[1:]
+    try:
+        import google.analytics.data_v1beta  # noqa: F401
+    except ImportError:
+        print("Install: pip install google-analytics-data")
+        return 1
+    if not ga.PROPERTY_ID:
+        print("Set GA4_PROPERTY_ID (numeric, from GA4 Admin > Property Settings)")
+        return 1
+
+    releases = load_releases()
+    if not releases:
+        print(f"No releases found in {APPCAST}")
+        return 1
+    start = parse_day(args, "--start", releases[0][0])
+    end = parse_day(args, "--end", date.today())
+
+    cache = DayCache(DB_PATH)
+    try:
+        if "--refresh" in args:
+            cache.clear(EVENT)
+        downloads = daily_downloads(start, end, cache)
+    finally:
+        cache.close()
+
+    print(f"\n=== {EVENT} by release ({start} to {end}) ===")
+    print_curves(adoption_curves([r for r in releases if r[0] <= end], downloads, start))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the GA4 Data API, for running the analytics scripts offline.
+
+Serves the two REST methods the scripts call, with canned numbers:
+- runRealtimeReport: totals (5 users, 40 page views, 52 events), or
+  per-event counts when the request has a dimension (page_view 40,
+  download_click 7).
+- runReport: one row per day of the requested range with eventCount =
+  day of month, except every fifth day, which has no row (as GA omits
+  days without events). Pages are at most PAGE_SIZE rows, whatever
+  limit the request asks for, so paging is exercised too.
+
+ga_realtime_report.make_client() talks to an http:// GA4_API_ENDPOINT over
+REST with anonymous credentials, so no service account is needed.
+
+--check starts the server on a free port, runs both report paths against
+it through make_client(), and exits 1 if the numbers do not come back.
+
+Usage:
+    python3 scripts/ga_fake_server.py &              # http://localhost:8080
+    export GA4_PROPERTY_ID=0 GA4_API_ENDPOINT=http://localhost:8080
+    python3 scripts/ga_realtime_report.py
+    python3 scripts/ga_download_history.py --start 2026-02-01 --end 2026-03-31
+
+    python3 scripts/ga_fake_server.py --check
+"""
+import json
+import sys
+import threading
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PORT = 8080
+PAGE_SIZE = 7
+
+REALTIME_TOTALS = ["5", "40", "52"]  # activeUsers, screenPageViews, eventCount
+REALTIME_EVENTS = [("page_view", 40), ("download_click", 7)]
+
+
+def daily_rows(start: date, end: date) -> list:
+    rows = []
+    day = start
+    while day <= end:
+        if day.toordinal() % 5:
+            rows.append({"dimensionValues": [{"value": day.strftime("%Y%m%d")}],
+                         "metricValues": [{"value": str(day.day)}]})
+        day += timedelta(days=1)
+    return rows
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        method = self.path.split("?")[0].rsplit(":", 1)[-1]
+        if method == "runRealtimeReport":
+            if body.get("dimensions"):
+                rows = [{"dimensionValues": [{"value": name}], "metricValues": [{"value": str(count)}]}
+                        for name, count in REALTIME_EVENTS]
+            else:
+                rows = [{"metricValues": [{"value": value} for value in REALTIME_TOTALS]}]
+            payload = {"rows": rows, "rowCount": len(rows)}
+        elif method == "runReport":
+            date_range = body["dateRanges"][0]
+            rows = daily_rows(date.fromisoformat(date_range["startDate"]), date.fromisoformat(date_range["endDate"]))
+            offset = int(body.get("offset", 0))
+            limit = min(int(body.get("limit", PAGE_SIZE)), PAGE_SIZE)
+            payload = {"rows": rows[offset:offset + limit], "rowCount": len(rows)}
+        else:
+            self.send_error(404)
+            return
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        sys.stderr.write(f"{self.command} {self.path}\n")
+
+
+class QuietHandler(Handler):
+    def log_message(self, format, *args):
+        pass
+
+
+def check() -> int:
+    """Run both report paths through make_client() against a private server."""
+    import ga_download_history
+    import ga_realtime_report as ga
+
+    ga.PROPERTY_ID = ga.PROPERTY_ID or "0"
+    server = ThreadingHTTPServer(("127.0.0.1", 0), QuietHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = ga.make_client("rest", f"http://127.0.0.1:{server.server_port}")
+    failures = 0
+    try:
+        snapshot = ga.summarize(ga.fetch_reports(client))
+        expected = {"active_users": 5, "page_views": 40, "events": 52, "by_event": dict(REALTIME_EVENTS)}
+        if snapshot == expected:
+            print("OK: realtime report")
+        else:
+            print(f"FAILED: realtime report returned {snapshot}")
+            failures += 1
+
+        first, last = date(2026, 2, 1), date(2026, 3, 31)
+        counts = ga_download_history.fetch_daily((first, last), client)
+        expected = {day: (day.day if day.toordinal() % 5 else 0)
+                    for day in (first + timedelta(days=n) for n in range((last - first).days + 1))}
+        if counts == expected:
+            print(f"OK: daily report ({len(counts)} days, paged by {PAGE_SIZE})")
+        else:
+            print("FAILED: daily report counts differ")
+            failures += 1
+    finally:
+        server.shutdown()
+    return 1 if failures else 0
+
+
+def main():
+    args = sys.argv[1:]
+    if "--check" in args:
+        try:
+            import google.analytics.data_v1beta  # noqa: F401
+        except ImportError:
+            print("Install: pip install google-analytics-data")
+            return 1
+        return check()
+    port = int(args[args.index("--port") + 1]) if "--port" in args else PORT
+    print(f"Fake GA4 Data API on http://localhost:{port} (Ctrl-C to stop)", flush=True)
+    try:
+        ThreadingHTTPServer(("127.0.0.1", port), Handler).serve_forever()
+    except KeyboardInterrupt:
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,63 +12,128 @@ Setup:
 5. Set env vars:
    export GOOGLE_APPLICATION_CREDENTIALS="/path/to/service-account.json"
    export GA4_PROPERTY_ID="123456789"
+
+The totals and events-by-name reports are issued concurrently through one
+client, which is created once per process and reused. The realtime API has
+no batch endpoint, so this is two requests in flight at once rather than
+one after the other.
+
+Transport (optional):
+   export GA4_TRANSPORT="rest"                     # default: grpc
+   export GA4_API_ENDPOINT="http://localhost:8080" # e.g. scripts/ga_fake_server.py
+An http:// endpoint always uses REST and anonymous credentials, so the
+report can be exercised offline without a service account;
+`python3 scripts/ga_fake_server.py --check` does that for both GA scripts.
+
+Polling (--poll) keeps running and takes a snapshot every --interval seconds
+(default 60, jittered by 10%), backing off exponentially with jitter (up to
+15 minutes) while the API errors. Each snapshot is appended to a SQLite database (--db,
+default scripts/ga_realtime.sqlite3): totals in `snapshots`, per-event counts
+(download_click, page_view, ...) in `event_counts`. Rolling means over the
+last ROLLING_WINDOW snapshots are kept as running sums, seeded from the
+database on start, so each poll prints current vs. recent rates without
+re-reading history.
+
+Usage:
+   python3 scripts/ga_realtime_report.py                      # one snapshot
+   python3 scripts/ga_realtime_report.py --poll               # every minute, until Ctrl-C
+   python3 scripts/ga_realtime_report.py --poll --interval 30 --db /tmp/ga.sqlite3
 """
 import os
+import random
+import sqlite3
 import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit
+
+PROPERTY_ID = os.environ.get("GA4_PROPERTY_ID", "")
+TRANSPORT = os.environ.get("GA4_TRANSPORT", "grpc")
+API_ENDPOINT = os.environ.get("GA4_API_ENDPOINT", "")
+DB_PATH = Path(__file__).resolve().parent / "ga_realtime.sqlite3"
 
-try:
+POLL_SECONDS = 60
+JITTER = 0.1
+MAX_BACKOFF_SECONDS = 15 * 60
+MAX_BACKOFF_DOUBLINGS = 6  # 2 ** failures stops growing here, well before it could overflow
+ROLLING_WINDOW = 15        # snapshots
+REALTIME_MINUTES = 30      # realtime counts cover this trailing window
+DOWNLOAD_EVENT = "download_click"
+
+# name: (dimensions, metrics); no dimension means one row of totals
+REPORTS = {
+    "totals": ([], ["activeUsers", "screenPageViews", "eventCount"]),
+    "events": (["eventName"], ["eventCount"]),
+}
+
+_client = None
+_pool = ThreadPoolExecutor(max_workers=len(REPORTS))
+
+
+def make_client(transport: str = TRANSPORT, endpoint: str = API_ENDPOINT):
     from google.analytics.data_v1beta import BetaAnalyticsDataClient
-    from google.analytics.data_v1beta.types import (
-        Dimension,
-        Metric,
-        RunRealtimeReportRequest,
-    )
-except ImportError:
-    print("Install: pip install google-analytics-data")
-    sys.exit(1)
 
-PROPERTY_ID = os.environ.get("GA4_PROPERTY_ID", "")
-if not PROPERTY_ID:
-    print("Set GA4_PROPERTY_ID (numeric, from GA4 Admin > Property Settings)")
-    sys.exit(1)
+    if not endpoint:
+        return BetaAnalyticsDataClient(transport=transport)
+    url = urlsplit(endpoint if "://" in endpoint else f"https://{endpoint}")
+    if url.scheme == "http":
+        from google.auth.credentials import AnonymousCredentials
+        rest = BetaAnalyticsDataClient.get_transport_class("rest")
+        return BetaAnalyticsDataClient(transport=rest(
+            host=url.netloc, url_scheme="http", credentials=AnonymousCredentials()))
+    return BetaAnalyticsDataClient(transport=transport, client_options={"api_endpoint": url.netloc})
 
 
-def run_realtime_report():
-    client = BetaAnalyticsDataClient()
+def get_client():
+    """The process-wide client, created on first use."""
+    global _client
+    if _client is None:
+        _client = make_client()
+    return _client
+
+
+def build_request(dimensions, metrics):
+    from google.analytics.data_v1beta.types import Dimension, Metric, RunRealtimeReportRequest
 
-    # Report 1: Totals - active users, page views, events (no dimension = totals)
-    request = RunRealtimeReportRequest(
+    return RunRealtimeReportRequest(
         property=f"properties/{PROPERTY_ID}",
-        metrics=[
-            Metric(name="activeUsers"),
-            Metric(name="screenPageViews"),
-            Metric(name="eventCount"),
-        ],
+        dimensions=[Dimension(name=d) for d in dimensions],
+        metrics=[Metric(name=m) for m in metrics],
     )
-    response = client.run_realtime_report(request)
 
+
+def fetch_reports(client=None) -> dict:
+    """Run every report in REPORTS at once; return {name: response}."""
+    client = client or get_client()
+    futures = {name: _pool.submit(client.run_realtime_report, build_request(*spec))
+               for name, spec in REPORTS.items()}
+    return {name: future.result() for name, future in futures.items()}
+
+
+def summarize(responses: dict) -> dict:
+    """Plain numbers from the report responses."""
+    snapshot = {"active_users": 0, "page_views": 0, "events": 0, "by_event": {}}
+    totals = responses["totals"]
+    if totals.rows:
+        row = totals.rows[0]
+        snapshot["active_users"] = int(row.metric_values[0].value)
+        snapshot["page_views"] = int(row.metric_values[1].value)
+        snapshot["events"] = int(row.metric_values[2].value)
+    for row in responses["events"].rows:
+        snapshot["by_event"][row.dimension_values[0].value] = int(row.metric_values[0].value)
+    return snapshot
+
+
+def print_report(snapshot: dict) -> None:
     print("\n=== Realtime (last 30 min) ===\n")
-    if response.rows:
-        row = response.rows[0]
-        users = int(row.metric_values[0].value)
-        views = int(row.metric_values[1].value)
-        events = int(row.metric_values[2].value)
-        print(f"  Active users: {users}")
-        print(f"  Page views:   {views}")
-        print(f"  Total events: {events}")
-
-    # Report 2: Events by name (download_click, page_view, etc.)
-    request2 = RunRealtimeReportRequest(
-        property=f"properties/{PROPERTY_ID}",
-        dimensions=[Dimension(name="eventName")],
-        metrics=[Metric(name="eventCount")],
-    )
-    response2 = client.run_realtime_report(request2)
+    print(f"  Active users: {snapshot['active_users']}")
+    print(f"  Page views:   {snapshot['page_views']}")
+    print(f"  Total events: {snapshot['events']}")
 
     print("\n=== Events (last 30 min) ===\n")
-    for row in response2.rows:
-        event_name = row.dimension_values[0].value
-        count = int(row.metric_values[0].value)
+    for event_name, count in snapshot["by_event"].items():
         print(f"  {event_name}: {count}")
         if event_name == "download_click":
             print(f"    -> Downloads: {count}")
@@ -76,5 +141,140 @@ def run_realtime_report():
     print()
 
 
-if __name__ == "__main__":
+def run_realtime_report():
+    print_report(summarize(fetch_reports()))
+
+
+class SnapshotStore:
+    """Append-only time series of snapshots in SQLite."""
+
+    def __init__(self, path):
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS snapshots (
+                ts INTEGER PRIMARY KEY,
+                active_users INTEGER NOT NULL,
+                page_views INTEGER NOT NULL,
+                events INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS event_counts (
+                ts INTEGER NOT NULL REFERENCES snapshots(ts),
+                event TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (ts, event)
+            );
+        """)
+
+    def append(self, ts: int, snapshot: dict) -> None:
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?)",
+                            (ts, snapshot["active_users"], snapshot["page_views"], snapshot["events"]))
+            self.db.executemany("INSERT OR REPLACE INTO event_counts VALUES (?, ?, ?)",
+                                [(ts, event, count) for event, count in snapshot["by_event"].items()])
+
+    def recent(self, limit: int) -> list:
+        """The last limit snapshots, oldest first, as summarize() would return them."""
+        rows = self.db.execute("SELECT ts, active_users, page_views, events FROM snapshots "
+                               "ORDER BY ts DESC LIMIT ?", (limit,)).fetchall()
+        snapshots = []
+        for ts, users, views, events in reversed(rows):
+            by_event = dict(self.db.execute("SELECT event, count FROM event_counts WHERE ts = ?", (ts,)))
+            snapshots.append({"active_users": users, "page_views": views, "events": events, "by_event": by_event})
+        return snapshots
+
+    def close(self) -> None:
+        self.db.close()
+
+
+class RollingMean:
+    """Mean of the last size values, updated in O(1) per value."""
+
+    def __init__(self, size: int):
+        self.values = deque(maxlen=size)
+        self.total = 0
+
+    def add(self, value) -> None:
+        if len(self.values) == self.values.maxlen:
+            self.total -= self.values[0]
+        self.values.append(value)
+        self.total += value
+
+    @property
+    def mean(self) -> float:
+        return self.total / len(self.values) if self.values else 0.0
+
+
+def series(snapshot: dict) -> dict:
+    return {"users": snapshot["active_users"], "views": snapshot["page_views"],
+            "downloads": snapshot["by_event"].get(DOWNLOAD_EVENT, 0)}
+
+
+def print_poll(ts: int, current: dict, rolling: dict) -> None:
+    """One line: current values, downloads per minute, and the rolling means."""
+    per_minute = current["downloads"] / REALTIME_MINUTES
+    baseline = rolling["downloads"].mean / REALTIME_MINUTES
+    spike = "  <- spike" if baseline and per_minute >= 2 * baseline else ""
+    print(f"{time.strftime('%H:%M:%S', time.localtime(ts))}  "
+          f"users {current['users']:4} (avg {rolling['users'].mean:6.1f})  "
+          f"views {current['views']:5} (avg {rolling['views'].mean:7.1f})  "
+          f"downloads {current['downloads']:4} = {per_minute:5.2f}/min (avg {baseline:5.2f}/min){spike}",
+          flush=True)
+
+
+def poll(interval: float, db_path) -> None:
+    """Snapshot every interval seconds into db_path until interrupted."""
+    store = SnapshotStore(db_path)
+    rolling = {name: RollingMean(ROLLING_WINDOW) for name in ("users", "views", "downloads")}
+    for snapshot in store.recent(ROLLING_WINDOW):
+        for name, value in series(snapshot).items():
+            rolling[name].add(value)
+    print(f"Polling every {interval:g}s into {db_path} (Ctrl-C to stop)")
+    failures = 0
+    try:
+        while True:
+            try:
+                snapshot = summarize(fetch_reports())
+            except Exception as e:
+                failures += 1
+                ceiling = min(interval * 2 ** min(failures, MAX_BACKOFF_DOUBLINGS), MAX_BACKOFF_SECONDS)
+                delay = random.uniform(interval, max(interval, ceiling))
+                print(f"FAILED: {type(e).__name__}: {e} (retrying in {delay:.0f}s)", file=sys.stderr)
+                time.sleep(delay)
+                continue
+            failures = 0
+            ts = int(time.time())
+            store.append(ts, snapshot)
+            current = series(snapshot)
+            # Print against the means of the polls before this one, then fold it in
+            print_poll(ts, current, rolling)
+            for name, value in current.items():
+                rolling[name].add(value)
+            time.sleep(interval * random.uniform(1 - JITTER, 1 + JITTER))
+    except KeyboardInterrupt:
+        print()
+    finally:
+        store.close()
+
+
+def main():
+    args = sys.argv[1:]
+    try:
+        import google.analytics.data_v1beta  # noqa: F401
+    except ImportError:
+        print("Install: pip install google-analytics-data")
+        return 1
+    if not PROPERTY_ID:
+        print("Set GA4_PROPERTY_ID (numeric, from GA4 Admin > Property Settings)")
+        return 1
+    if "--poll" in args:
+        interval = float(args[args.index("--interval") + 1]) if "--interval" in args else POLL_SECONDS
+        db_path = args[args.index("--db") + 1] if "--db" in args else DB_PATH
+        poll(interval, db_path)
+        return 0
     run_realtime_report()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Shared AppIcon pipeline for the icon scripts.
+
+The 1024 master is decoded once and every smaller size is produced by
+successive halving (512 from 1024, 256 from 512, ...), so no size is ever
+resampled from a separately saved, already-downscaled file. All PNGs and
+Contents.json are written together at the end.
+
+Transforms are non-destructive: a spec (safe ratio, background color,
+padding) is applied to the preserved, unpadded master in
+assets/AppIcon-master.png. Rendered sets are cached under .icon_cache/ by a
+hash of (master, spec), together with the master they came from, so
+re-running a script is a no-op and switching between specs just copies the
+cached set back in.
+
+Without a committed master, the master of the installed set is reused when
+the set came from the cache; otherwise the largest icon in the set is used,
+with a hint to save the real master, since that icon may already be padded.
+
+Padding and background are composited as NumPy array operations ("over"
+with straight alpha). A background of "auto" takes the artwork's own edge
+color: the most common bin in a histogram of the pixels just inside the
+outermost opaque pixel of every row and column.
+"""
+import filecmp
+import hashlib
+import io
+import json
+import os
+import shutil
+from PIL import Image
+import numpy as np
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ICON_DIR = os.path.join(SCRIPT_DIR, "..", "WordJournal", "Resources", "Assets.xcassets", "AppIcon.appiconset")
+MASTER_PATH = os.path.join(SCRIPT_DIR, "..", "assets", "AppIcon-master.png")
+CACHE_DIR = os.path.join(SCRIPT_DIR, ".icon_cache")
+CURRENT_PATH = os.path.join(CACHE_DIR, "current")
+# Copy of the master a cache entry was rendered from
+ENTRY_MASTER = "master.png"
+
+# Bump when the rendering below changes, so cached sets are not reused
+PIPELINE_VERSION = 2
+
+# safe_ratio: artwork size as a fraction of the canvas
+# background: RGBA canvas color, "auto" for the artwork's edge color, or None for transparent
+# padding:    master pixels trimmed from each edge before scaling
+DEFAULT_SPEC = {"safe_ratio": 1.0, "background": None, "padding": 0}
+
+# Edge sampling for background "auto": pixels this far inside the outermost
+# opaque pixel (skipping anti-aliasing), binned at 5 bits per channel
+EDGE_INSET = 4
+EDGE_BIN_BITS = 5
+OPAQUE = 250
+
+MASTER_SIZE = 1024
+SIZES = [16, 32, 64, 128, 256, 512, 1024]
+
+# (point size, scale) slots of a macOS AppIcon set, in Xcode's order
+SLOTS = [(16, 1), (16, 2), (32, 1), (32, 2), (128, 1), (128, 2), (256, 1), (256, 2), (512, 1), (512, 2)]
+
+
+def icon_name(size: int) -> str:
+    return f"icon_{size}.png"
+
+
+def load_master(data: bytes) -> Image.Image:
+    """Decode the master icon once, as RGBA at MASTER_SIZE."""
+    img = Image.open(io.BytesIO(data)).convert("RGBA")
+    if img.size != (MASTER_SIZE, MASTER_SIZE):
+        img = img.resize((MASTER_SIZE, MASTER_SIZE), Image.LANCZOS)
+    return img
+
+
+def pyramid(master: Image.Image) -> dict:
+    """Return {size: image} for SIZES, each level halved from the one above."""
+    levels = {MASTER_SIZE: master}
+    img = master
+    size = MASTER_SIZE
+    smallest = min(SIZES)
+    while size > smallest:
+        size //= 2
+        img = img.resize((size, size), Image.LANCZOS)
+        levels[size] = img
+    return {s: levels[s] for s in SIZES}
+
+
+def contents_json() -> dict:
+    images = [
+        {"filename": icon_name(points * scale), "idiom": "mac", "scale": f"{scale}x", "size": f"{points}x{points}"}
+        for points, scale in SLOTS
+    ]
+    return {"images": images, "info": {"author": "xcode", "version": 1}}
+
+
+def _replace(path: str, write) -> None:
+    tmp = path + ".tmp"
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def write_iconset(images: dict, icon_dir: str = ICON_DIR) -> None:
+    """Write every icon_{size}.png plus Contents.json, each via an atomic rename."""
+    os.makedirs(icon_dir, exist_ok=True)
+    for size, img in sorted(images.items()):
+        _replace(os.path.join(icon_dir, icon_name(size)), lambda p: img.save(p, "PNG"))
+    # Xcode's own formatting: 2-space indent and "key" : value
+    text = json.dumps(contents_json(), indent=2, separators=(",", " : "), sort_keys=True) + "\n"
+
+    def write_text(path):
+        with open(path, "w") as f:
+            f.write(text)
+
+    _replace(os.path.join(icon_dir, "Contents.json"), write_text)
+
+
+def edge_color(art: np.ndarray) -> tuple:
+    """Most common color just inside the artwork's opaque outline, as RGBA."""
+    opaque = art[..., 3] >= OPAQUE
+    pixels = []
+    for mask, img in ((opaque, art), (opaque.T, art.transpose(1, 0, 2))):
+        rows = np.flatnonzero(mask.any(axis=1))
+        n = mask.shape[1]
+        first = np.minimum(mask[rows].argmax(axis=1) + EDGE_INSET, n - 1)
+        last = np.maximum(n - 1 - mask[rows, ::-1].argmax(axis=1) - EDGE_INSET, 0)
+        pixels += [img[rows, first], img[rows, last]]
+    pixels = np.concatenate(pixels)
+    pixels = pixels[pixels[:, 3] >= OPAQUE, :3]
+    if not len(pixels):
+        return (0, 0, 0, 0)
+
+    q = (pixels >> (8 - EDGE_BIN_BITS)).astype(np.int32)
+    bins = (q[:, 0] << (2 * EDGE_BIN_BITS)) | (q[:, 1] << EDGE_BIN_BITS) | q[:, 2]
+    top = np.bincount(bins).argmax()
+    r, g, b = pixels[bins == top].mean(axis=0).round().astype(int)
+    return (int(r), int(g), int(b), 255)
+
+
+def composite(art: np.ndarray, background: tuple) -> np.ndarray:
+    """Center art over a MASTER_SIZE canvas filled with background ("over" operator)."""
+    # Work on whole pixels as uint32 so fills and copies move 4 bytes at a time
+    canvas = np.empty((MASTER_SIZE, MASTER_SIZE, 4), np.uint8)
+    canvas.view(np.uint32)[:] = np.array(background, np.uint8).view(np.uint32)
+    n = art.shape[0]
+    x = (MASTER_SIZE - n) // 2
+    region = canvas[x:x + n, x:x + n]
+
+    # Opaque pixels replace the background outright; only the anti-aliased
+    # edge needs arithmetic, so blend just those
+    alpha = art[..., 3]
+    np.copyto(region.view(np.uint32), np.ascontiguousarray(art).view(np.uint32), where=(alpha == 255)[..., None])
+    edge = (alpha > 0) & (alpha < 255)
+    src = art[edge].astype(np.float32) / 255
+    dst = region[edge].astype(np.float32) / 255
+    sa = src[:, 3:]
+    da = dst[:, 3:] * (1 - sa)
+    out_a = sa + da
+    rgb = (src[:, :3] * sa + dst[:, :3] * da) / np.maximum(out_a, 1e-6)
+    region[edge] = (np.concatenate([rgb, out_a], axis=1) * 255).round().astype(np.uint8)
+    return canvas
+
+
+def apply_spec(master: Image.Image, spec: dict) -> Image.Image:
+    """Pad and center the artwork on a MASTER_SIZE canvas as the spec describes."""
+    spec = {**DEFAULT_SPEC, **spec}
+    art = master
+    pad = spec["padding"]
+    if pad:
+        art = art.crop((pad, pad, MASTER_SIZE - pad, MASTER_SIZE - pad))
+    art_size = int(MASTER_SIZE * spec["safe_ratio"])
+    if art.size != (art_size, art_size):
+        art = art.resize((art_size, art_size), Image.LANCZOS)
+    if art_size == MASTER_SIZE and spec["background"] is None:
+        return art
+
+    pixels = np.asarray(art)
+    if spec["background"] == "auto":
+        background = edge_color(pixels)
+    else:
+        background = tuple(spec["background"]) if spec["background"] else (0, 0, 0, 0)
+    return Image.fromarray(composite(pixels, background), "RGBA")
+
+
+def relative(path: str) -> str:
+    """path relative to the project root, for messages."""
+    return os.path.relpath(path, os.path.join(SCRIPT_DIR, ".."))
+
+
+def largest_icon() -> str:
+    """Path of the largest icon_{size}.png in the set."""
+    for size in sorted(SIZES, reverse=True):
+        path = os.path.join(ICON_DIR, icon_name(size))
+        if os.path.exists(path):
+            return path
+    raise FileNotFoundError(f"no {relative(MASTER_PATH)} and no icons in {relative(ICON_DIR)}")
+
+
+def installed_master():
+    """The master the installed set was rendered from, if the set came from the cache."""
+    try:
+        with open(CURRENT_PATH) as f:
+            key = f.read().strip()
+    except OSError:
+        return None
+    entry = os.path.join(CACHE_DIR, key)
+    path = os.path.join(entry, ENTRY_MASTER)
+    if key and os.path.exists(path) and installed(key, entry):
+        return path
+    return None
+
+
+def read_master() -> tuple:
+    """
+    Return (master bytes, path it was read from).
+
+    Falls back to the master the installed set was rendered from, so a set
+    is never padded again, and only then to the largest icon in the set.
+    """
+    for path in (MASTER_PATH, installed_master()):
+        if path and os.path.exists(path):
+            with open(path, "rb") as f:
+                return f.read(), path
+    path = largest_icon()
+    with open(path, "rb") as f:
+        return f.read(), path
+
+
+def spec_key(master: bytes, spec: dict) -> str:
+    h = hashlib.sha256(master)
+    h.update(json.dumps([PIPELINE_VERSION, {**DEFAULT_SPEC, **spec}], sort_keys=True).encode())
+    return h.hexdigest()[:16]
+
+
+def set_files() -> list:
+    return [icon_name(s) for s in SIZES] + ["Contents.json"]
+
+
+def render(master: bytes, spec: dict, entry: str) -> None:
+    """Render the set for spec into the cache entry directory, atomically."""
+    tmp = f"{entry}.tmp{os.getpid()}"
+    shutil.rmtree(tmp, ignore_errors=True)
+    write_iconset(pyramid(apply_spec(load_master(master), spec)), tmp)
+    with open(os.path.join(tmp, ENTRY_MASTER), "wb") as f:
+        f.write(master)
+    try:
+        os.rename(tmp, entry)
+    except OSError:
+        # Another run rendered the same key first
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def installed(key: str, entry: str) -> bool:
+    try:
+        with open(CURRENT_PATH) as f:
+            if f.read().strip() != key:
+                return False
+    except OSError:
+        return False
+    return all(
+        os.path.exists(os.path.join(ICON_DIR, name))
+        and filecmp.cmp(os.path.join(entry, name), os.path.join(ICON_DIR, name), shallow=False)
+        for name in set_files()
+    )
+
+
+def install(key: str, entry: str) -> None:
+    for name in set_files():
+        _replace(os.path.join(ICON_DIR, name), lambda p: shutil.copyfile(os.path.join(entry, name), p))
+    with open(CURRENT_PATH, "w") as f:
+        f.write(key + "\n")
+
+
+def run(spec: dict, verb: str) -> int:
+    """Install the set for spec, rendering it from the master only if not cached; return an exit status."""
+    try:
+        master, source = read_master()
+    except FileNotFoundError as e:
+        print(f"FAILED: {e}")
+        return 1
+    if source != MASTER_PATH:
+        if source.startswith(CACHE_DIR):
+            print(f"No master at {relative(MASTER_PATH)}; reusing the one the installed set was rendered from.")
+        else:
+            print(f"No master at {relative(MASTER_PATH)}; rendering from {relative(source)}, which may already be padded.")
+        print(f"  Save the unpadded {MASTER_SIZE}x{MASTER_SIZE} artwork to {relative(MASTER_PATH)} to seed it.")
+    key = spec_key(master, spec)
+    entry = os.path.join(CACHE_DIR, key)
+
+    if os.path.isdir(entry) and installed(key, entry):
+        print(f"Up to date ({key})")
+        return 0
+    cached = os.path.isdir(entry)
+    if not cached:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        render(master, spec, entry)
+    install(key, entry)
+    for name in set_files():
+        print(f"{verb} {name}" + (" (cached)" if cached else ""))
+    return 0
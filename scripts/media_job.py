@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Produce every video-derived asset from one decode of the demo video.
+
+A single ffmpeg run decodes docs/demo_sped.mp4 once and splits it in a
+filter graph into:
+- preview: AppStoreAssets/app-preview.mp4 (1920x1080 padded, max 30 sec)
+- web:     docs/demo-web.mp4 (1280 wide, faststart, for index.html)
+- gif:     screenshots/demo-hero.gif (first 8 sec, via create_web_gif.py)
+- poster:  docs/demo-poster.png (one frame, for the <video> poster)
+
+GIF frames come back over a pipe and are spooled to a temporary file, so
+memory stays bounded while the palette is sampled; the GIF is written once
+ffmpeg finishes. Progress is parsed from ffmpeg's -progress stream, and the
+run reports its wall-clock time and throughput.
+
+Usage:
+    python3 scripts/media_job.py                    # all outputs
+    python3 scripts/media_job.py preview poster     # just these
+"""
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+import create_web_gif
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+VIDEO = PROJECT_ROOT / "docs" / "demo_sped.mp4"
+OUTPUTS = {
+    "preview": PROJECT_ROOT / "AppStoreAssets" / "app-preview.mp4",
+    "web": PROJECT_ROOT / "docs" / "demo-web.mp4",
+    "gif": PROJECT_ROOT / "screenshots" / "demo-hero.gif",
+    "poster": PROJECT_ROOT / "docs" / "demo-poster.png",
+}
+PREVIEW_SECONDS = 30
+POSTER_SECONDS = 2
+
+# (filter chain after the split, output options) per output; the GIF branch
+# is handled separately because it goes to a pipe
+BRANCHES = {
+    "preview": (
+        f"trim=duration={PREVIEW_SECONDS},setpts=PTS-STARTPTS,"
+        "scale=1920:1080:force_original_aspect_ratio=decrease,pad=1920:1080:(ow-iw)/2:(oh-ih)/2",
+        ["-map", "0:a?", "-t", str(PREVIEW_SECONDS),
+         "-c:v", "libx264", "-preset", "medium", "-crf", "23", "-c:a", "aac", "-b:a", "128k"],
+    ),
+    "web": (
+        "scale=1280:-2:flags=lanczos",
+        ["-map", "0:a?", "-c:v", "libx264", "-preset", "slow", "-crf", "26", "-pix_fmt", "yuv420p",
+         "-c:a", "aac", "-b:a", "96k", "-movflags", "+faststart"],
+    ),
+    "poster": (
+        f"trim=start={POSTER_SECONDS},setpts=PTS-STARTPTS",
+        ["-frames:v", "1", "-update", "1"],
+    ),
+}
+# How much of the source each output covers (None: all of it), for progress
+OUTPUT_SECONDS = {"preview": PREVIEW_SECONDS, "web": None, "gif": create_web_gif.SECONDS, "poster": POSTER_SECONDS}
+GIF_BRANCH = (f"trim=duration={create_web_gif.SECONDS},setpts=PTS-STARTPTS,"
+              f"fps={create_web_gif.FPS},scale={create_web_gif.WIDTH}:-2:flags=lanczos")
+
+
+def probe_duration(video: Path) -> float:
+    """Duration in seconds from ffmpeg's header dump (no decoding)."""
+    result = subprocess.run(["ffmpeg", "-hide_banner", "-i", str(video)], capture_output=True, text=True)
+    match = re.search(r"Duration: (\d+):(\d+):([\d.]+)", result.stderr)
+    if not match:
+        raise RuntimeError(f"could not read the duration of {video}")
+    h, m, s = match.groups()
+    return int(h) * 3600 + int(m) * 60 + float(s)
+
+
+def build_command(video: Path, names, tmp_dir: Path):
+    """ffmpeg command for the given outputs, and {name: path it writes to}."""
+    labels = [f"[v{i}]" for i in range(len(names))]
+    chains = [f"[0:v]split={len(names)}{''.join(labels)}" if len(names) > 1 else f"[0:v]null{labels[0]}"]
+    cmd = ["ffmpeg", "-y", "-hide_banner", "-v", "error", "-nostats", "-progress", "pipe:2", "-i", str(video)]
+    outputs = []
+    written = {}
+    for name, label in zip(names, labels):
+        chain, options = (GIF_BRANCH, None) if name == "gif" else BRANCHES[name]
+        chains.append(f"{label}{chain}[{name}]")
+        if name == "gif":
+            outputs += ["-map", f"[{name}]", "-f", "image2pipe", "-vcodec", "ppm", "pipe:1"]
+        else:
+            # Write next to the target and rename at the end, so a failed run
+            # leaves the previous file in place
+            path = tmp_dir / OUTPUTS[name].name
+            outputs += ["-map", f"[{name}]", *options, str(path)]
+            written[name] = path
+    return cmd + ["-filter_complex", ";".join(chains)] + outputs, written
+
+
+def follow_progress(stream, duration: float, errors: list):
+    """Print a progress line from ffmpeg's key=value -progress blocks; collect anything else."""
+    values = {}
+    # Each block reports the time of one output; the final ones can be for a
+    # short output (the poster), so only ever move forward
+    done = 0.0
+    for line in stream:
+        line = line.decode(errors="replace").strip()
+        key, sep, value = line.partition("=")
+        if not sep or " " in key:
+            errors.append(line)
+            continue
+        values[key] = value
+        if key != "progress":
+            continue
+        try:
+            done = max(done, int(values.get("out_time_us", "0")) / 1e6)
+        except ValueError:
+            pass
+        percent = min(100.0, done * 100 / duration) if duration else 0.0
+        print(f"\r  {percent:5.1f}%  {done:5.1f}s of {duration:.1f}s", end="", flush=True)
+    print()
+
+
+def spool_gif_frames(stream, spool, samples: list):
+    """Copy piped GIF frames to spool; keep every frame that falls on SAMPLE_FPS."""
+    every = max(1, round(create_web_gif.FPS / create_web_gif.SAMPLE_FPS))
+    count = 0
+    shape = None
+    while True:
+        header = create_web_gif.read_ppm_header(stream)
+        if header is None:
+            break
+        w, h = header
+        data = stream.read(w * h * 3)
+        if len(data) < w * h * 3:
+            break
+        spool.write(data)
+        shape = (h, w, 3)
+        if count % every == 0:
+            samples.append(np.frombuffer(data, np.uint8).reshape(shape))
+        count += 1
+    return count, shape
+
+
+def spooled_frames(spool, count: int, shape):
+    spool.seek(0)
+    size = shape[0] * shape[1] * 3
+    for _ in range(count):
+        yield np.frombuffer(spool.read(size), np.uint8).reshape(shape)
+
+
+def run(names=None, video: Path = VIDEO) -> dict:
+    """Decode video once and write the named outputs (default: all). Returns timing figures."""
+    names = list(names or OUTPUTS)
+    duration = probe_duration(video)
+    for name in names:
+        OUTPUTS[name].parent.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmp, tempfile.TemporaryFile() as spool:
+        cmd, written = build_command(video, names, Path(tmp))
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        errors = []
+        expected = min(duration, max(OUTPUT_SECONDS[n] or duration for n in names))
+        progress = threading.Thread(target=follow_progress, args=(proc.stderr, expected, errors), daemon=True)
+        progress.start()
+        samples = []
+        count, shape = spool_gif_frames(proc.stdout, spool, samples) if "gif" in names else (0, None)
+        proc.stdout.close()
+        status = proc.wait()
+        progress.join()
+        if status != 0:
+            raise RuntimeError("ffmpeg failed:\n" + "\n".join(errors[-10:]))
+        decoded = time.perf_counter() - start
+
+        for name, path in written.items():
+            shutil.move(path, OUTPUTS[name])
+        if "gif" in names:
+            if not count:
+                raise RuntimeError("ffmpeg produced no GIF frames")
+            palette, lut, transparent = create_web_gif.make_palette(create_web_gif.subsample(samples))
+            create_web_gif.write_gif(spooled_frames(spool, count, shape), OUTPUTS["gif"], palette, lut, transparent)
+
+    elapsed = time.perf_counter() - start
+    return {"duration": expected, "decode": decoded, "elapsed": elapsed}
+
+
+def main():
+    names = [a for a in sys.argv[1:] if not a.startswith("--")] or list(OUTPUTS)
+    unknown = [n for n in names if n not in OUTPUTS]
+    if unknown:
+        print(f"Unknown output(s): {', '.join(unknown)}. Choose from: {', '.join(OUTPUTS)}")
+        return 1
+    if not VIDEO.exists():
+        print(f"Video not found: {VIDEO}")
+        return 1
+
+    print("Media job")
+    print("=" * 40)
+    print(f"Source: {VIDEO}")
+    for name in names:
+        print(f"  {name:8} -> {OUTPUTS[name]}")
+    print()
+    try:
+        stats = run(names)
+    except FileNotFoundError:
+        print("ffmpeg not found. Install with: brew install ffmpeg")
+        return 1
+    except RuntimeError as e:
+        print(f"\nFAILED: {e}")
+        return 1
+
+    print()
+    for name in names:
+        print(f"  OK: {OUTPUTS[name]} ({OUTPUTS[name].stat().st_size / 1024:.0f} KB)")
+    print(f"Decoded {stats['duration']:.1f}s of video once in {stats['decode']:.1f}s "
+          f"({stats['duration'] / stats['decode']:.1f}x realtime); total {stats['elapsed']:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Optimize existing screenshots for web (resize, optional compression).
+Python port of optimize_screenshots.sh that does not need macOS sips.
+
+Widths come from each PNG's IHDR header, so only the files that are wider
+than MAX_WIDTH are decoded; the rest are copied byte-for-byte. Resizing uses
+the LANCZOS filter and optimized PNG encode shared with
+prepare_appstore_assets.py (lanczos, save_png), and the directory is
+processed on a worker pool.
+
+Usage:
+    python3 scripts/optimize_screenshots.py              # resize / copy
+    python3 scripts/optimize_screenshots.py --optimize   # also run png_optimize.py
+"""
+import os
+import shutil
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from prepare_appstore_assets import lanczos, save_png
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+SCREENSHOTS = PROJECT_ROOT / "screenshots"
+OUTPUT = SCREENSHOTS / "web-optimized"
+MAX_WIDTH = 1200  # Good for 2x retina on most screens
+
+
+def png_size(path: Path):
+    """(width, height) from the IHDR chunk, or None if path is not a PNG."""
+    with open(path, "rb") as f:
+        header = f.read(24)
+    if len(header) < 24 or header[:8] != b"\x89PNG\r\n\x1a\n" or header[12:16] != b"IHDR":
+        return None
+    return struct.unpack(">II", header[16:24])
+
+
+def optimize_one(job):
+    """Worker: resize src to out if wider than MAX_WIDTH, else copy. Returns (width, new_width)."""
+    src, out = job
+    size = png_size(src)
+    if size is None or size[0] <= MAX_WIDTH:
+        shutil.copyfile(src, out)
+        return (size[0] if size else None), None
+
+    from PIL import Image
+    img = Image.open(src)
+    # Like sips -Z: fit the longest side to MAX_WIDTH, keeping aspect ratio
+    img.thumbnail((MAX_WIDTH, MAX_WIDTH), lanczos())
+    save_png(img, out)
+    return size[0], img.width
+
+
+def main():
+    OUTPUT.mkdir(parents=True, exist_ok=True)
+
+    print(f"Optimizing screenshots for web (max width: {MAX_WIDTH}px)...")
+    print()
+
+    jobs = [(img, OUTPUT / img.name) for img in sorted(SCREENSHOTS.glob("*.png")) if img.is_file()]
+    failures = 0
+    if jobs:
+        with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+            futures = [pool.submit(optimize_one, job) for job in jobs]
+            for (src, _), future in zip(jobs, futures):
+                name = src.stem
+                try:
+                    width, new_width = future.result()
+                except Exception as e:
+                    print(f"  FAILED:  {name} ({type(e).__name__}: {e})", file=sys.stderr)
+                    failures += 1
+                    continue
+                if new_width is None:
+                    print(f"  Copied:  {name} (no resize needed)")
+                else:
+                    print(f"  Resized: {name} ({width} → {new_width}px)")
+
+    if "--optimize" in sys.argv[1:] and jobs:
+        from png_optimize import optimize_files, report
+        print()
+        print("Optimizing PNGs...")
+        report(optimize_files([out for _, out in jobs if out.exists()]))
+
+    print()
+    print(f"Optimized images saved to: {OUTPUT}")
+    print("Review and replace screenshots/ with these if desired, or use web-optimized/ for the site.")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Lossless PNG optimizer for the website and App Store images.
+
+Each image is re-encoded in every applicable pixel format (RGBA, RGB when
+fully opaque, gray when R == G == B, and a palette of 1/2/4/8 bits when it has
+at most 256 colors), with every scanline filter (None, Sub, Up, Average,
+Paeth and a per-row adaptive choice), under several zlib strategies. Those
+combinations run in parallel worker processes. The smallest result replaces
+the file only if it is smaller and decodes to exactly the same pixels.
+
+Color chunks (iCCP, sRGB, gAMA, cHRM) and pHYs are carried over; text and
+time chunks are dropped. 16-bit images are left alone.
+
+Usage:
+    python3 scripts/png_optimize.py docs/og-image.png screenshots/
+    python3 scripts/png_optimize.py --dry-run docs/screenshots/
+"""
+import io
+import os
+import struct
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Ancillary chunks that affect how pixels display; the first group must
+# precede PLTE and IDAT, pHYs only IDAT
+COLOR_CHUNKS = (b"iCCP", b"sRGB", b"gAMA", b"cHRM")
+TRAILING_CHUNKS = (b"pHYs",)
+
+FILTERS = ["none", "sub", "up", "average", "paeth", "adaptive"]
+ZLIB_STRATEGIES = [zlib.Z_DEFAULT_STRATEGY, zlib.Z_FILTERED, zlib.Z_RLE]
+ZLIB_LEVEL = 9
+
+# PNG color types
+GRAY, RGB, PALETTE, GRAY_ALPHA, RGBA = 0, 2, 3, 4, 6
+
+
+def read_chunks(data: bytes):
+    """Yield (type, payload) for every chunk of a PNG file."""
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError("not a PNG file")
+    pos = len(PNG_SIGNATURE)
+    while pos + 8 <= len(data):
+        length, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        yield kind, data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+
+
+def chunk(kind: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I", len(payload)) + kind + payload + struct.pack(">I", zlib.crc32(kind + payload))
+
+
+def representations(path) -> dict:
+    """
+    Every lossless pixel format for the image at path, as
+    {name: (color_type, bit_depth, rows, plte, trns)} where rows is an
+    (height, row_bytes) uint8 array of unfiltered scanlines.
+    """
+    data = Path(path).read_bytes()
+    chunks = dict(read_chunks(data))
+    if chunks[b"IHDR"][8] > 8:
+        return {}
+    rgba = np.asarray(Image.open(io.BytesIO(data)).convert("RGBA"))
+    h, w, _ = rgba.shape
+    opaque = bool((rgba[..., 3] == 255).all())
+    gray = bool((rgba[..., 0] == rgba[..., 1]).all() and (rgba[..., 1] == rgba[..., 2]).all())
+
+    reps = {}
+    if opaque:
+        reps["rgb"] = (RGB, 8, rgba[..., :3].reshape(h, w * 3), None, None)
+    else:
+        reps["rgba"] = (RGBA, 8, rgba.reshape(h, w * 4), None, None)
+    # A gray image cannot keep an RGB ICC profile
+    if gray and b"iCCP" not in chunks:
+        if opaque:
+            reps["gray"] = (GRAY, 8, rgba[..., 0].copy(), None, None)
+        else:
+            reps["gray_alpha"] = (GRAY_ALPHA, 8, rgba[..., [0, 3]].reshape(h, w * 2), None, None)
+
+    pixels = np.ascontiguousarray(rgba).view(np.uint32).reshape(h, w)
+    colors, indices = np.unique(pixels, return_inverse=True)
+    if len(colors) <= 256:
+        rgba_colors = colors.view(np.uint8).reshape(-1, 4)
+        # Translucent entries first so tRNS can stop at the last of them
+        order = np.argsort(rgba_colors[:, 3] == 255, kind="stable")
+        rgba_colors = rgba_colors[order]
+        indices = np.argsort(order)[indices.reshape(h, w)].astype(np.uint8)
+        depth = next(d for d in (1, 2, 4, 8) if len(colors) <= 1 << d)
+        translucent = int((rgba_colors[:, 3] < 255).sum())
+        trns = rgba_colors[:translucent, 3].tobytes() if translucent else None
+        reps[f"palette{depth}"] = (PALETTE, depth, pack_bits(indices, depth), rgba_colors[:, :3].tobytes(), trns)
+    return reps
+
+
+def pack_bits(indices: np.ndarray, depth: int) -> np.ndarray:
+    """Pack palette indices into rows of depth-bit samples, leftmost sample highest."""
+    if depth == 8:
+        return indices
+    h, w = indices.shape
+    per_byte = 8 // depth
+    padded = np.zeros((h, -(-w // per_byte) * per_byte), np.uint8)
+    padded[:, :w] = indices
+    groups = padded.reshape(h, -1, per_byte)
+    shifts = np.arange(per_byte - 1, -1, -1, dtype=np.uint8) * depth
+    return np.bitwise_or.reduce(groups << shifts, axis=2).astype(np.uint8)
+
+
+def filter_rows(rows: np.ndarray, bpp: int, method: str) -> bytes:
+    """Apply a PNG scanline filter to every row; return the filtered stream with type bytes."""
+    x = rows.astype(np.int16)
+    a = np.zeros_like(x)
+    a[:, bpp:] = x[:, :-bpp]
+    b = np.zeros_like(x)
+    b[1:] = x[:-1]
+    c = np.zeros_like(x)
+    c[1:, bpp:] = x[:-1, :-bpp]
+
+    def filtered(kind):
+        if kind == 0:
+            return x
+        if kind == 1:
+            return x - a
+        if kind == 2:
+            return x - b
+        if kind == 3:
+            return x - ((a + b) >> 1)
+        p = a + b - c
+        pa, pb, pc = np.abs(p - a), np.abs(p - b), np.abs(p - c)
+        return x - np.where((pa <= pb) & (pa <= pc), a, np.where(pb <= pc, b, c))
+
+    if method != "adaptive":
+        out = filtered(FILTERS.index(method)) & 0xFF
+        types = np.full(len(rows), FILTERS.index(method), np.uint8)
+        return np.hstack([types[:, None], out.astype(np.uint8)]).tobytes()
+
+    # Per row, the filter with the minimum sum of absolute values as signed bytes
+    candidates = np.stack([filtered(kind) & 0xFF for kind in range(5)]).astype(np.uint8)
+    cost = np.abs(candidates.view(np.int8).astype(np.int16)).sum(axis=2, dtype=np.int64)
+    types = cost.argmin(axis=0)
+    out = candidates[types, np.arange(len(rows))]
+    return np.hstack([types.astype(np.uint8)[:, None], out]).tobytes()
+
+
+def try_encoding(job):
+    """Worker: (name, color type, bit depth, rows, filter) -> (size, name, idat) of the best zlib strategy."""
+    name, color_type, depth, rows, method = job
+    channels = {GRAY: 1, RGB: 3, PALETTE: 1, GRAY_ALPHA: 2, RGBA: 4}[color_type]
+    stream = filter_rows(rows, max(1, channels * depth // 8), method)
+    best = None
+    for strategy in ZLIB_STRATEGIES:
+        z = zlib.compressobj(ZLIB_LEVEL, zlib.DEFLATED, 15, 9, strategy)
+        idat = z.compress(stream) + z.flush()
+        if best is None or len(idat) < len(best):
+            best = idat
+    return len(best), name, best
+
+
+def assemble(original: bytes, width: int, height: int, rep, idat: bytes) -> bytes:
+    color_type, depth, _, plte, trns = rep
+    kept = dict(read_chunks(original))
+    out = [PNG_SIGNATURE, chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, depth, color_type, 0, 0, 0))]
+    out += [chunk(kind, kept[kind]) for kind in COLOR_CHUNKS if kind in kept]
+    if plte is not None:
+        out.append(chunk(b"PLTE", plte))
+    if trns is not None:
+        out.append(chunk(b"tRNS", trns))
+    out += [chunk(kind, kept[kind]) for kind in TRAILING_CHUNKS if kind in kept]
+    out += [chunk(b"IDAT", idat), chunk(b"IEND", b"")]
+    return b"".join(out)
+
+
+def same_pixels(a: bytes, b: bytes) -> bool:
+    decode = lambda data: np.asarray(Image.open(io.BytesIO(data)).convert("RGBA"))
+    return np.array_equal(decode(a), decode(b))
+
+
+def optimize_files(paths, workers=None, dry_run=False):
+    """
+    Optimize every PNG in paths in place; return [(path, before, after)].
+    All (file, format, filter) combinations share one process pool. Each
+    file is decoded once, here; the jobs get its scanlines, not its path.
+    """
+    paths = [Path(p) for p in paths]
+    reps = {p: representations(p) for p in paths}
+    owners = [p for p in paths for name in reps[p] for method in FILTERS]
+    jobs = ((name, color_type, depth, rows, method)
+            for p in paths for name, (color_type, depth, rows, _, _) in reps[p].items() for method in FILTERS)
+    best = {}
+    if owners:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+            for p, result in zip(owners, pool.map(try_encoding, jobs)):
+                if p not in best or result[0] < best[p][0]:
+                    best[p] = result
+
+    results = []
+    for p in paths:
+        original = p.read_bytes()
+        after = len(original)
+        if p in best:
+            _, name, idat = best[p]
+            with Image.open(io.BytesIO(original)) as img:
+                width, height = img.size
+            candidate = assemble(original, width, height, reps[p][name], idat)
+            if len(candidate) < len(original) and same_pixels(original, candidate):
+                after = len(candidate)
+                if not dry_run:
+                    tmp = p.with_suffix(".tmp.png")
+                    tmp.write_bytes(candidate)
+                    os.replace(tmp, p)
+        results.append((p, len(original), after))
+    return results
+
+
+def report(results, indent="  "):
+    """Print bytes saved per file and in total, for the page weight budget."""
+    total_before = sum(before for _, before, _ in results)
+    total_after = sum(after for _, _, after in results)
+    for path, before, after in results:
+        saved = before - after
+        print(f"{indent}{path}: {before / 1024:.1f} KB -> {after / 1024:.1f} KB "
+              f"(-{saved / 1024:.1f} KB, {saved * 100 / max(before, 1):.1f}%)")
+    saved = total_before - total_after
+    print(f"{indent}Total: {total_before / 1024:.1f} KB -> {total_after / 1024:.1f} KB "
+          f"(-{saved / 1024:.1f} KB)")
+
+
+def expand(args):
+    for arg in args:
+        p = Path(arg)
+        if p.is_dir():
+            yield from sorted(p.glob("*.png"))
+        else:
+            yield p
+
+
+def main():
+    args = sys.argv[1:]
+    dry_run = "--dry-run" in args
+    paths = list(expand(a for a in args if not a.startswith("--")))
+    if not paths:
+        print("Usage: png_optimize.py [--dry-run] FILE_OR_DIR ...")
+        return 1
+    print("PNG optimization" + (" (dry run)" if dry_run else ""))
+    print("=" * 40)
+    report(optimize_files(paths, dry_run=dry_run))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
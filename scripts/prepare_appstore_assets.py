@@ -5,19 +5,47 @@ Prepare Mac App Store screenshots and app preview.
 Mac screenshot requirements (16:10 aspect ratio):
 - 1280 x 800, 1440 x 900, 2560 x 1600, or 2880 x 1800
 
-We output 1280x800 (can scale up in App Store Connect if needed).
+We output 1280x800 by default. With --all-sizes every size above is written to
+screenshots/<width>x<height>/, decoding each source once: the largest size is
+resampled from the source and each smaller one from the size above it.
+
+Sources with identical content (e.g. the same file in screenshots/ and
+docs/screenshots/) count once. When slots are padded out to 10 by repeating
+sources, each repeat is encoded once and the other slots are hard-linked to
+it (or copied byte-for-byte where links are not possible).
+
+Outputs whose source content, parameters and tool versions are unchanged
+since the last run are skipped (see build_cache.py); --force rebuilds all.
+
+Usage:
+    python3 scripts/prepare_appstore_assets.py               # 1280x800 only
+    python3 scripts/prepare_appstore_assets.py --all-sizes   # all four sizes
+    python3 scripts/prepare_appstore_assets.py --force       # ignore the cache
+    python3 scripts/prepare_appstore_assets.py --optimize    # also run png_optimize.py
+    python3 scripts/prepare_appstore_assets.py --no-preview  # screenshots only
 
 Mac app preview (optional): 1920 x 1080, landscape, 15-30 sec, .mov/.m4v/.mp4
+
+Screenshots are resized and encoded on a process pool sized to the CPU count;
+progress is printed in screenshot order and failures are listed at the end.
 """
+import os
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+
+from build_cache import BuildCache
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
 SCREENSHOTS_SRC = PROJECT_ROOT / "screenshots"
 DOCS_SCREENSHOTS = PROJECT_ROOT / "docs" / "screenshots"
 OUTPUT_DIR = PROJECT_ROOT / "AppStoreAssets"
 TARGET_SIZE = (1280, 800)  # 16:10
+# Every 16:10 size App Store Connect accepts, largest first
+ALL_SIZES = [(2880, 1800), (2560, 1600), (1440, 900), (1280, 800)]
 
 # Preferred order for screenshots (best first)
 PREFERRED_ORDER = [
@@ -60,80 +88,230 @@ def resize_with_sips(input_path: Path, output_path: Path, width: int, height: in
     """Use sips to resize to fit, then pad to exact dimensions."""
     try:
         # sips -Z fits longest dimension; then pad to target
+        fitted = output_path.with_suffix(".fit.png")
         tmp = output_path.with_suffix(".tmp.png")
         subprocess.run(
-            ["sips", "-Z", str(height), str(input_path), "--out", str(tmp)],
+            ["sips", "-Z", str(height), str(input_path), "--out", str(fitted)],
             check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
         )
         subprocess.run(
-            ["sips", "-z", str(height), str(width), "--padColor", "FFFFFF", str(tmp), "--out", str(output_path)],
+            ["sips", "-z", str(height), str(width), "--padColor", "FFFFFF", str(fitted), "--out", str(tmp)],
             check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
         )
-        tmp.unlink(missing_ok=True)
+        fitted.unlink(missing_ok=True)
+        # A new inode, so slots hard-linked to this one keep their bytes
+        os.replace(tmp, output_path)
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
 
 
-def resize_with_pillow(input_path: Path, output_path: Path, width: int, height: int) -> bool:
-    """Use Pillow for proper resize + pad to exact dimensions."""
+def lanczos():
+    """Pillow's LANCZOS filter, under its Image.Resampling name where that exists (Pillow >= 9.1)."""
+    from PIL import Image
+    return getattr(Image, "Resampling", Image).LANCZOS
+
+
+def save_png(img, output_path: Path) -> None:
+    """
+    Encode img as an optimized PNG at output_path. Saving over output_path
+    would write into its inode, which link_or_copy may share with other
+    slots, so the file is written beside it and renamed into place.
+    """
+    tmp = output_path.with_suffix(".tmp.png")
+    img.save(tmp, "PNG", optimize=True)
+    os.replace(tmp, output_path)
+
+
+def export_with_pillow(input_path: Path, outputs) -> bool:
+    """
+    Decode input_path once and write each ((width, height), path) in outputs,
+    padded to exact dimensions. Artwork keeps the same share of the canvas at
+    every size as at TARGET_SIZE, where it is never upscaled.
+    """
     try:
         from PIL import Image
-        img = Image.open(input_path).convert("RGB")
-        # Resize to fit within target, maintaining aspect ratio
-        resample = getattr(Image, "Resampling", Image).LANCZOS if hasattr(Image, "Resampling") else Image.LANCZOS
-        img.thumbnail((width, height), resample)
-        # Create new image with target size, white background
-        out = Image.new("RGB", (width, height), (255, 255, 255))
-        # Paste centered
-        x = (width - img.width) // 2
-        y = (height - img.height) // 2
-        out.paste(img, (x, y))
-        out.save(output_path, "PNG", optimize=True)
-        return True
     except ImportError:
         return False
+    resample = lanczos()
+    src = Image.open(input_path).convert("RGB")
+    art = src
+    for (width, height), output_path in sorted(outputs, key=lambda o: o[0], reverse=True):
+        scale = min(width / src.width, height / src.height, width / TARGET_SIZE[0])
+        size = (max(1, round(src.width * scale)), max(1, round(src.height * scale)))
+        # Step down from the previous level unless that level was upscaled,
+        # in which case going back to the source loses less
+        base = art if art.width >= size[0] and art.width <= src.width else src
+        if base.size != size:
+            art = base.resize(size, resample)
+        else:
+            art = base
+        # Create new image with target size, white background, paste centered
+        out = Image.new("RGB", (width, height), (255, 255, 255))
+        out.paste(art, ((width - art.width) // 2, (height - art.height) // 2))
+        save_png(out, output_path)
+    return True
+
+
+def process_image(src_path: Path, outputs) -> bool:
+    """Resize with Pillow, falling back to sips; re-raises Pillow's error if both fail."""
+    try:
+        if export_with_pillow(src_path, outputs):
+            return True
+        error = None
     except Exception as e:
-        print(f"  Pillow error: {e}", file=sys.stderr)
-        return False
+        error = e
+    if all(resize_with_sips(src_path, out_path, w, h) for (w, h), out_path in outputs):
+        return True
+    if error is not None:
+        raise error
+    return False
 
 
-def process_image(src_path: Path, out_path: Path) -> bool:
-    if not resize_with_pillow(src_path, out_path, TARGET_SIZE[0], TARGET_SIZE[1]):
-        return resize_with_sips(src_path, out_path, TARGET_SIZE[0], TARGET_SIZE[1])
-    return True
+def process_job(job):
+    """Worker entry point: (src_path, outputs) -> None on success, else the error."""
+    src_path, outputs = job
+    try:
+        if process_image(src_path, outputs):
+            return None
+        return "neither Pillow nor sips is available"
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    """Make dst the same bytes as src: a hard link if possible, else a copy."""
+    if dst.exists() and os.path.samefile(src, dst):
+        return
+    tmp = dst.with_suffix(".tmp.png")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+
+def run_jobs(jobs, labels, cached=(), links=None):
+    """
+    Run jobs on a process pool, reporting in order, and return one error per
+    job (None if it succeeded). Jobs whose index is in cached are not run;
+    links maps a job index to an earlier job with the same source and sizes,
+    whose outputs are linked instead of encoding again.
+    """
+    links = links or {}
+    errors = [None] * len(jobs)
+    pending = [i for i in range(len(jobs)) if i not in cached and i not in links]
+    with ProcessPoolExecutor(max_workers=max(1, min(len(pending), os.cpu_count() or 1))) as pool:
+        futures = {i: pool.submit(process_job, jobs[i]) for i in pending}
+        for i, (label, (src_path, outputs)) in enumerate(zip(labels, jobs)):
+            print(f"  {label}")
+            if i in cached:
+                print("     Up to date")
+                continue
+            if i in links:
+                first = links[i]
+                if errors[first] is not None:
+                    errors[i] = f"same source as {labels[first]}, which failed"
+                    print(f"     FAILED: {src_path}", file=sys.stderr)
+                    continue
+                for (_, first_out), (_, out_path) in zip(jobs[first][1], outputs):
+                    link_or_copy(first_out, out_path)
+                    print(f"     Linked: {out_path} (same as {first_out.name})")
+                continue
+            errors[i] = futures[i].result()
+            if errors[i] is None:
+                for _, out_path in outputs:
+                    print(f"     OK: {out_path}")
+            else:
+                print(f"     FAILED: {src_path}", file=sys.stderr)
+    return errors
 
 
 def main():
-    OUTPUT_DIR.mkdir(exist_ok=True)
-    (OUTPUT_DIR / "screenshots").mkdir(exist_ok=True)
+    argv = sys.argv[1:]
+    sizes = ALL_SIZES if "--all-sizes" in argv else [TARGET_SIZE]
+    force = "--force" in argv
+    optimize = "--optimize" in argv
+    cache = BuildCache()
+    screenshots_dir = OUTPUT_DIR / "screenshots"
+    # Per-size folders only when writing more than one size
+    size_dirs = {size: screenshots_dir / f"{size[0]}x{size[1]}" if len(sizes) > 1 else screenshots_dir
+                 for size in sizes}
+    for d in size_dirs.values():
+        d.mkdir(parents=True, exist_ok=True)
 
     print("Mac App Store assets - screenshots")
     print("=" * 40)
-    print(f"Target size: {TARGET_SIZE[0]} x {TARGET_SIZE[1]} (16:10)")
+    print(f"Target size: {', '.join(f'{w} x {h}' for w, h in sizes)} (16:10)")
     print()
 
-    collected = collect_sources()
+    # The same screenshot may live in both source folders under different names
+    unique = {}
+    for src_path, name in collect_sources():
+        unique.setdefault(cache.file_hash(src_path), (src_path, name))
+    collected = list(unique.values())
     # Duplicate from start if we have fewer than 10
     while len(collected) < 10 and collected:
         n = min(len(collected), 10 - len(collected))
         collected.extend(collected[:n])
     collected = collected[:10]
 
+    jobs = []
+    labels = []
     for i, (src_path, name) in enumerate(collected, 1):
         out_name = f"screenshot-{i:02d}.png"
-        out_path = OUTPUT_DIR / "screenshots" / out_name
-        print(f"  {i}. {name} -> {out_name}")
-        if process_image(src_path, out_path):
-            print(f"     OK: {out_path}")
+        jobs.append((src_path, [(size, size_dirs[size] / out_name) for size in sizes]))
+        labels.append(f"{i}. {name} -> {out_name}")
+
+    # The script itself is an input, so editing the resize code invalidates outputs
+    keys = [{out_path: cache.key([src_path, __file__], {"size": size, "sizes": sizes, "optimize": optimize}, ["pillow"])
+             for size, out_path in outputs} for src_path, outputs in jobs]
+    cached = set() if force else {i for i, job_keys in enumerate(keys)
+                                  if all(cache.fresh(out, key) for out, key in job_keys.items())}
+    # Keys cover source content and size, so equal keys mean byte-identical output
+    first_with = {}
+    links = {}
+    for i, job_keys in enumerate(keys):
+        signature = tuple(job_keys.values())
+        if signature in first_with:
+            links[i] = first_with[signature]
         else:
-            print(f"     FAILED: {src_path}", file=sys.stderr)
+            first_with[signature] = i
+    errors = run_jobs(jobs, labels, cached, links) if jobs else []
+
+    built = [i for i, error in enumerate(errors) if error is None and i not in cached and i not in links]
+    if optimize and built:
+        from png_optimize import optimize_files, report
+        print()
+        print("Optimizing PNGs...")
+        report(optimize_files([out_path for i in built for _, out_path in jobs[i][1]]))
+        # Optimizing replaced the files, so the linked slots need linking again
+        for i, first in links.items():
+            if errors[i] is None and i not in cached:
+                for (_, first_out), (_, out_path) in zip(jobs[first][1], jobs[i][1]):
+                    link_or_copy(first_out, out_path)
+    for i, error in enumerate(errors):
+        if i not in cached and error is None:
+            for out_path, key in keys[i].items():
+                cache.record(out_path, key)
+    cache.save()
+    failures = [(label, error) for label, error in zip(labels, errors) if error is not None]
+    status = 1 if failures else 0
 
     print()
-    print(f"Done. Screenshots in: {OUTPUT_DIR / 'screenshots'}")
+    if failures:
+        print(f"{len(failures)} of {len(jobs)} screenshots failed:")
+        for label, error in failures:
+            print(f"  {label}: {error}")
+        print()
+    print(f"Done. Screenshots in: {screenshots_dir}")
     print()
 
-    # App preview (optional): 1920x1080, 15-30 sec
+    # App preview (optional): 1920x1080, 15-30 sec; build_assets.py makes it
+    # in its video step instead
+    if "--no-preview" in argv:
+        return status
     preview_out = OUTPUT_DIR / "app-preview.mp4"
     demo = PROJECT_ROOT / "docs" / "demo_sped.mp4"
     if demo.exists():
@@ -141,29 +319,30 @@ def main():
         print("=" * 40)
         print(f"Source: {demo}")
         print(f"Target: 1920x1080, max 30 sec")
+        # media_job.py owns the ffmpeg graph; run it for just the preview here,
+        # or run it directly to get the web video, GIF and poster from the same decode
+        try:
+            import media_job
+        except ImportError as e:
+            # It imports numpy (for the hero GIF) at module level
+            print(f"  Skipped: media_job.py needs {e.name}. Install: pip install {e.name}")
+            return status
+        key = cache.key([demo], media_job.BRANCHES["preview"], ["ffmpeg"])
+        if not force and cache.fresh(preview_out, key):
+            print(f"  Up to date: {preview_out}")
+            return status
         try:
-            # Scale to 1920x1080 (pad if needed), trim to 30 sec
-            subprocess.run(
-                [
-                    "ffmpeg", "-y",
-                    "-i", str(demo),
-                    "-t", "30",
-                    "-vf", "scale=1920:1080:force_original_aspect_ratio=decrease,pad=1920:1080:(ow-iw)/2:(oh-ih)/2",
-                    "-c:v", "libx264", "-preset", "medium", "-crf", "23",
-                    "-c:a", "aac", "-b:a", "128k",
-                    str(preview_out),
-                ],
-                check=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE,
-            )
+            media_job.run(["preview"], demo)
+            cache.record(preview_out, key)
+            cache.save()
             print(f"  OK: {preview_out}")
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        except (RuntimeError, FileNotFoundError):
             print("  ffmpeg not found or failed. Install: brew install ffmpeg")
             print(f"  Manual: ffmpeg -i docs/demo_sped.mp4 -t 30 -vf scale=1920:1080 -c:v libx264 app-preview.mp4")
     else:
         print("App preview: no docs/demo_sped.mp4 found")
+    return status
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,57 +1,212 @@
 #!/usr/bin/env python3
 """
-Script to verify Xcode project has all required files
+Script to verify the Xcode project matches the files on disk
+
+Parses WordJournal.xcodeproj/project.pbxproj and reports, in one pass:
+- [MISSING]   file references whose file is not on disk
+- [ORPHANED]  Swift files not in the Sources phase, resources not in the
+              Resources phase, references outside any group, and build
+              files or group children pointing at objects that do not exist
+- [DUPLICATE] paths referenced twice, files built twice, and resources
+              with identical content
+
+Resources are hashed on a thread pool. A manifest next to the project caches
+the hashes, so repeat runs only re-hash files whose mtime or size changed.
 """
 
+import json
 import os
-from pathlib import Path
-
-required_files = {
-    'WordJournalApp.swift': 'WordJournal/',
-    'WordEntry.swift': 'WordJournal/Models/',
-    'DictionaryResult.swift': 'WordJournal/Models/',
-    'AccessibilityMonitor.swift': 'WordJournal/Services/',
-    'DictionaryService.swift': 'WordJournal/Services/',
-    'JournalStorage.swift': 'WordJournal/Services/',
-    'DefinitionPopupView.swift': 'WordJournal/Views/',
-    'JournalView.swift': 'WordJournal/Views/',
-    'MenuBarView.swift': 'WordJournal/Views/',
-    'PreferencesView.swift': 'WordJournal/Views/',
-    'HotKeyManager.swift': 'WordJournal/Utilities/',
-    'Info.plist': 'WordJournal/',
-    'dictionary.json': 'WordJournal/Resources/',
-}
-
-base_dir = Path(__file__).parent
-
-print("Verifying project files...")
-print("=" * 50)
-
-all_present = True
-for filename, expected_path in required_files.items():
-    filepath = base_dir / expected_path / filename
-    if filepath.exists():
-        print(f"[OK] {filename}")
-    else:
-        print(f"[MISSING] {filename} at {filepath}")
-        all_present = False
-
-print("=" * 50)
-
-if all_present:
-    print("\n[SUCCESS] All required files are present!")
-    print("\nNext steps:")
-    print("1. Open WordJournal.xcodeproj in Xcode")
-    print("2. Verify all files appear in Project Navigator")
-    print("3. Ensure dictionary.json has Target Membership checked")
-    print("4. Build and run (Cmd+R)")
-else:
-    print("\n[ERROR] Some files are missing!")
-    print("Please check the file paths above.")
-
-# Check if project file exists
-project_file = base_dir / 'WordJournal.xcodeproj' / 'project.pbxproj'
-if project_file.exists():
-    print(f"\n[OK] Xcode project file exists: {project_file}")
-else:
-    print(f"\n[ERROR] Xcode project file not found: {project_file}")
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import pbxproj
+from fix_xcode_project import (
+    BASE_DIR, PBXPROJ_PATH, PROJECT_DIR, SOURCE_DIR, TARGET_NAME,
+    content_hash, describe, scan_tree,
+)
+
+MANIFEST_PATH = PROJECT_DIR / '.verify_manifest.json'
+
+GROUP_ISAS = {'PBXGroup', 'PBXVariantGroup'}
+UNGROUPED = object()
+
+
+def load_manifest():
+    try:
+        with open(MANIFEST_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest):
+    tmp = MANIFEST_PATH.with_suffix('.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp, MANIFEST_PATH)
+
+
+def hash_files(found, manifest):
+    """
+    Return {path: sha1} for the given {path: stat}, reusing manifest entries
+    whose mtime and size still match and hashing the rest on a thread pool.
+    """
+    digests = {}
+    stale = []
+    for rel, st in found.items():
+        cached = manifest.get(rel)
+        if cached and cached['mtime'] == st.st_mtime_ns and cached['size'] == st.st_size:
+            digests[rel] = cached['sha1']
+        else:
+            stale.append(rel)
+    with ThreadPoolExecutor() as pool:
+        for rel, digest in zip(stale, pool.map(lambda rel: content_hash(SOURCE_DIR / rel), stale)):
+            st = found[rel]
+            manifest[rel] = {'mtime': st.st_mtime_ns, 'size': st.st_size, 'sha1': digest}
+            digests[rel] = digest
+    for rel in set(manifest) - set(found):
+        del manifest[rel]
+    return digests, len(stale)
+
+
+def reference_paths(project):
+    """Map every file reference ID to its path relative to the project directory."""
+    main_group = project[project.root_object]['mainGroup']
+    parent = {}
+    for obj in project.objects.values():
+        if obj.isa in GROUP_ISAS:
+            for child in obj.get('children', ()):
+                parent[child] = obj.id
+    cache = {}
+
+    def path_of(id):
+        if id in cache:
+            return cache[id]
+        obj = project[id]
+        tree = obj.get('sourceTree', '<group>')
+        path = obj.get('path', '')
+        if tree == 'SOURCE_ROOT':
+            result = path
+        elif tree != '<group>':
+            result = None
+        elif id == main_group:
+            result = path
+        elif id not in parent:
+            result = UNGROUPED
+        else:
+            base = path_of(parent[id])
+            result = base if base is None or base is UNGROUPED else '/'.join(p for p in (base, path) if p)
+        cache[id] = result
+        return result
+
+    return {obj.id: path_of(obj.id) for obj in project.objects.values() if obj.isa == 'PBXFileReference'}
+
+
+def target_phases(project):
+    """{'Sources': phase, 'Resources': phase, ...} for the app target."""
+    for target in project.objects_of('PBXNativeTarget'):
+        if target.get('name') == TARGET_NAME:
+            phases = (project.objects.get(id) for id in target.get('buildPhases', ()))
+            return {p.isa[3:-len('BuildPhase')]: p for p in phases if p is not None}
+    return {}
+
+
+def verify(project, found, digests):
+    """Cross-check the project against the scanned tree; return {kind: [messages]}."""
+    problems = defaultdict(list)
+    prefix = f'{SOURCE_DIR.name}/'
+
+    by_path = defaultdict(list)
+    for id, path in reference_paths(project).items():
+        if path is UNGROUPED:
+            problems['ORPHANED'].append(f"{project[id].get('path')} ({id}) is not in any group")
+        elif path is not None:
+            by_path[path].append(id)
+    for path, ids in sorted(by_path.items()):
+        if not (BASE_DIR / path).exists():
+            problems['MISSING'].append(f"{path} is referenced by the project but not on disk")
+        if len(ids) > 1:
+            problems['DUPLICATE'].append(f"{path} is referenced {len(ids)} times ({', '.join(ids)})")
+
+    for obj in project.objects.values():
+        for child in obj.get('children', ()) if obj.isa in GROUP_ISAS else ():
+            if child not in project:
+                problems['ORPHANED'].append(f"group {obj.get('path') or obj.get('name') or obj.id} "
+                                            f"lists missing object {child}")
+
+    ref_path = {id: path for path, ids in by_path.items() for id in ids}
+    built = {}
+    for phase_name, phase in target_phases(project).items():
+        seen = defaultdict(int)
+        for build_id in phase.get('files', ()):
+            build = project.objects.get(build_id)
+            if build is None:
+                problems['ORPHANED'].append(f"{phase_name} phase lists missing build file {build_id}")
+                continue
+            ref = build.get('fileRef') or build.get('productRef')
+            if ref not in project:
+                problems['ORPHANED'].append(f"build file {build_id} points at missing object {ref}")
+                continue
+            seen[ref] += 1
+            if ref in ref_path:
+                built.setdefault(phase_name, set()).add(ref_path[ref])
+        for ref, count in seen.items():
+            if count > 1:
+                problems['DUPLICATE'].append(f"{ref_path.get(ref, ref)} is built {count} times in {phase_name}")
+
+    for rel in sorted(found):
+        phase = describe(rel)['phase']
+        if phase and prefix + rel not in built.get(phase, ()):
+            problems['ORPHANED'].append(f"{prefix}{rel} is on disk but not in the {phase} build phase")
+
+    by_digest = defaultdict(list)
+    for rel, digest in digests.items():
+        by_digest[digest].append(rel)
+    for rels in by_digest.values():
+        if len(rels) > 1:
+            problems['DUPLICATE'].append(f"identical resource content: {', '.join(sorted(prefix + r for r in rels))}")
+    return problems
+
+
+def main():
+    print("Verifying project files...")
+    print("=" * 50)
+
+    if not PBXPROJ_PATH.exists():
+        print(f"\n[ERROR] Xcode project file not found: {PBXPROJ_PATH}")
+        return 1
+    try:
+        project = pbxproj.load(PBXPROJ_PATH)
+    except pbxproj.ParseError as e:
+        print(f"\n[ERROR] Could not parse {PBXPROJ_PATH}: {e}")
+        return 1
+    print(f"[OK] Parsed {PBXPROJ_PATH} ({len(project.objects)} objects)")
+
+    found = scan_tree(SOURCE_DIR)
+    resources = {rel: st for rel, st in found.items()
+                 if describe(rel)['phase'] == 'Resources' and not (SOURCE_DIR / rel).is_dir()}
+    manifest = load_manifest()
+    digests, rehashed = hash_files(resources, manifest)
+    save_manifest(manifest)
+    print(f"[OK] Scanned {len(found)} files, hashed {rehashed} of {len(resources)} resources")
+
+    problems = verify(project, found, digests)
+    for kind in ('MISSING', 'ORPHANED', 'DUPLICATE'):
+        for message in problems.get(kind, ()):
+            print(f"[{kind}] {message}")
+
+    print("=" * 50)
+    if not problems:
+        print("\n[SUCCESS] Project and disk agree!")
+        print("\nNext steps:")
+        print("1. Open WordJournal.xcodeproj in Xcode")
+        print("2. Build and run (Cmd+R)")
+        return 0
+    print(f"\n[ERROR] {sum(len(v) for v in problems.values())} problem(s) found.")
+    print("Run fix_xcode_project.py to add or remove file references.")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())